@@ -1,13 +1,86 @@
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import json
+import logging
 import os
 
-# gdxpds needs to be imported before pandas to try to avoid library conflict on 
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
 # Linux that causes a segmentation fault.
 import gdxpds
+from gdxpds.gdx import (GdxFile, GdxSymbol, GamsDataType, GamsVariableType,
+                        GamsEquationType, GAMS_VALUE_COLS_MAP)
+from gdxpds.write_gdx import infer_data_type
 
 import pandas as pd
 
-def convert_csv_to_gdx(input_files, output_file, gams_dir=None):
+logger = logging.getLogger(__name__)
+
+
+def load_schema(schema_file):
+    """
+    Reads a schema sidecar: a JSON list of symbol descriptions as returned by
+    gdxpds.metadata.read_metadata (name, data_type, dims, and optionally
+    description, variable_type and equation_type), e.g., as written by
+    gdx_to_csv.py --schema.
+
+    Returns
+    -------
+    dict of str to dict
+        symbol description by symbol name
+    """
+    with open(schema_file) as f:
+        entries = json.load(f)
+    return {entry['name']: entry for entry in entries}
+
+
+def parse_csv(csv_file, entry=None):
+    """
+    Reads csv_file. If entry (a schema description) is given, dimension
+    columns are read as str and value columns as float, except for Sets, and
+    the columns are named after entry['dims'].
+    """
+    if entry is None:
+        return pd.read_csv(csv_file, index_col=None)
+    data_type = GamsDataType[entry['data_type']]
+    dims = list(entry['dims'])
+    value_cols = [col_name for col_name, _col_ind in GAMS_VALUE_COLS_MAP[data_type]]
+    # columns are read by position, so that repeated dimension names (e.g.,
+    # '*') are kept as-is
+    positions = [str(i) for i in range(len(dims) + len(value_cols))]
+    dtypes = {position: str for position in positions[:len(dims)]}
+    if data_type not in (GamsDataType.Set, GamsDataType.Alias):
+        dtypes.update({position: float for position in positions[len(dims):]})
+    # labels such as 'NA' are not missing values
+    df = pd.read_csv(csv_file, index_col=None, header=0, names=positions, dtype=dtypes,
+                     keep_default_na=False, na_values=['', 'NaN', 'nan'])
+    df.columns = dims + value_cols
+    return df
+
+
+def make_symbol(symbol_name, df, entry=None):
+    """
+    Returns a loaded GdxSymbol holding df, described by entry if given, and
+    with its type inferred from df otherwise.
+    """
+    if entry is None:
+        data_type, num_dims = infer_data_type(symbol_name, df)
+        logger.info("Inferred data type of {} to be {}.".format(symbol_name, data_type.name))
+        symbol = GdxSymbol(symbol_name, data_type, dims=num_dims)
+    else:
+        data_type = GamsDataType[entry['data_type']]
+        symbol = GdxSymbol(symbol_name, data_type, dims=list(entry['dims']),
+            description=entry.get('description') or '',
+            variable_type=None if entry.get('variable_type') is None else
+                GamsVariableType[entry['variable_type']],
+            equation_type=None if entry.get('equation_type') is None else
+                GamsEquationType[entry['equation_type']])
+    symbol.set_dataframe(df, copy=False)
+    return symbol
+
+
+def convert_csv_to_gdx(input_files, output_file, gams_dir=None, schema=None, workers=None):
     # check input files
     for ifile in input_files:
         if not os.path.splitext(ifile)[1] in ['.csv','.txt']:
@@ -15,7 +88,7 @@ def convert_csv_to_gdx(input_files, output_file, gams_dir=None):
             raise RuntimeError(msg)
         if not os.path.isfile(ifile):
             raise RuntimeError("'{}' is not a file.".format(ifile))
-   
+
     # convert input_files into one list of csvs
     ifiles = []
     for ifile in input_files:
@@ -33,15 +106,34 @@ def convert_csv_to_gdx(input_files, output_file, gams_dir=None):
             f.close()
     if len(ifiles) == 0:
         raise RuntimeError("Nothing to convert.")
-        
-    # convert list of csvs to map of dataframes
-    dataframes = {}
-    for ifile in ifiles:
-        dataframes[os.path.splitext(os.path.basename(ifile))[0]] = \
-            pd.read_csv(ifile,index_col=None)
-            
-    gdxpds.to_gdx(dataframes, output_file, gams_dir)
-    
+
+    schema = {} if schema is None else load_schema(schema)
+    names = [os.path.splitext(os.path.basename(ifile))[0] for ifile in ifiles]
+
+    # parse the csvs, and write each symbol as soon as it is parsed, in order
+    with GdxFile(gams_dir=gams_dir) as gdx:
+        gdx.open_write(output_file)
+        if (workers is None) or (workers <= 1) or (len(ifiles) < 2):
+            for name, ifile in zip(names, ifiles):
+                df = parse_csv(ifile, schema.get(name))
+                gdx.write_symbol(make_symbol(name, df, schema.get(name)))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                def submit(task):
+                    name, ifile = task
+                    return name, pool.submit(parse_csv, ifile, schema.get(name))
+
+                # at most workers frames are parsed but not yet written
+                tasks = iter(zip(names, ifiles))
+                pending = deque(submit(task) for task in islice(tasks, workers))
+                while pending:
+                    name, future = pending.popleft()
+                    task = next(tasks, None)
+                    if task is not None:
+                        pending.append(submit(task))
+                    gdx.write_symbol(make_symbol(name, future.result(), schema.get(name)))
+        gdx.close_write()
+
 
 if __name__ == "__main__":
 
@@ -56,7 +148,14 @@ if __name__ == "__main__":
         to the output gdx file. Will be overwritten if it already exists.''')
     parser.add_argument('-g', '--gams_dir', help='''Path to GAMS installation
         directory.''', default = None)
-        
+    parser.add_argument('-s', '--schema', help='''JSON file describing the
+        symbols (data_type, dims, description), e.g., as written by
+        gdx_to_csv.py --schema. Symbols it describes are read with explicit
+        dtypes, and the types of the others are inferred.''', default=None)
+    parser.add_argument('-w', '--workers', type=int, default=None, help='''Number
+        of processes parsing csvs in parallel.''')
+
     args = parser.parse_args()
-    
-    convert_csv_to_gdx(args.input, args.output, args.gams_dir)
+
+    convert_csv_to_gdx(args.input, args.output, args.gams_dir, schema=args.schema,
+                       workers=args.workers)
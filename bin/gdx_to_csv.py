@@ -1,44 +1,140 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import json
 import logging
 import os
 
-import gdxpds
+from gdxpds.gdx import GdxFile
+from gdxpds.metadata import symbol_metadata
+
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+COMPRESSION_EXTENSIONS = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+
+def open_csv(csv_path, compression=None):
+    """
+    Opens csv_path for writing text, compressed with compression (one of
+    COMPRESSION_EXTENSIONS).
+    """
+    if compression is None:
+        return open(csv_path, 'w', newline='')
+    if compression == 'gzip':
+        return gzip.open(csv_path, 'wt', newline='')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd compression requires the zstandard package.")
+        return zstandard.open(csv_path, 'wt', newline='')
+    raise RuntimeError("Unknown compression '{}'. Expected one of {}.".format(
+        compression, [key for key in COMPRESSION_EXTENSIONS if key]))
+
+
+def export_symbol(gdx, symbol_name, csv_path, compression=None, chunksize=1000000):
+    """
+    Streams symbol_name from gdx, a GdxFile that has been read, to csv_path,
+    chunksize records at a time.
+    """
+    symbol = gdx[symbol_name]
+    if os.path.exists(csv_path):
+        logger.info("Overwriting '{}'".format(csv_path))
+    with open_csv(csv_path, compression=compression) as f:
+        header = True
+        for df in symbol.iter_chunks(chunksize=chunksize):
+            df.to_csv(f, na_rep='NaN', index=False, header=header)
+            header = False
+        if header:
+            # no records, but still list the columns
+            pd.DataFrame(columns=symbol.dims + symbol.value_col_names).to_csv(f, index=False)
+    return csv_path
+
+
+# GdxFile read once per worker process by _init_worker
+_worker_gdx = None
+
 
-def convert_gdx_to_csv(in_gdx, out_dir, gams_dir=None):
+def _init_worker(in_gdx, gams_dir):
+    global _worker_gdx
+    _worker_gdx = GdxFile(gams_dir=gams_dir, lazy_load=True)
+    _worker_gdx.read(in_gdx)
+
+
+def _export_in_worker(symbol_name, csv_path, compression, chunksize):
+    return export_symbol(_worker_gdx, symbol_name, csv_path, compression=compression,
+                         chunksize=chunksize)
+
+
+def convert_gdx_to_csv(in_gdx, out_dir, gams_dir=None, symbols=None, exclude=None,
+                       workers=None, compression=None, chunksize=1000000, schema=None):
     # check inputs
     if not os.path.exists(os.path.dirname(out_dir)):
         raise RuntimeError("Parent directory of output directory '{}' does not exist.".format(out_dir))
-        
-    # convert to pandas.DataFrames
-    dataframes = gdxpds.to_dataframes(in_gdx, gams_dir)
-
-    # write to files
-    if not os.path.exists(out_dir):
-        os.mkdir(out_dir)
-    
-    for symbol_name, df in dataframes.items():
-        csv_path = os.path.join(out_dir, symbol_name + ".csv")
-        if os.path.exists(csv_path):
-            logger.info("Overwriting '{}'".format(csv_path))
-        df.to_csv(csv_path,
-                  na_rep='NaN',
-                  index=False)
+    extension = '.csv' + COMPRESSION_EXTENSIONS.get(compression, '')
+
+    # select the symbols, largest first so that workers finish together, and
+    # export them from this GdxFile unless workers are used
+    with GdxFile(gams_dir=gams_dir, lazy_load=True) as gdx:
+        gdx.read(in_gdx)
+        missing = [name for name in (symbols or []) + (exclude or []) if name not in gdx]
+        if missing:
+            raise RuntimeError("No symbols named {} in '{}'.".format(missing, in_gdx))
+        selected = [symbol for symbol in gdx if
+                    ((symbols is None) or (symbol.name in symbols)) and
+                    not (exclude and (symbol.name in exclude))]
+        if schema is not None:
+            # describe the symbols for csv_to_gdx.py --schema
+            with open(schema, 'w') as f:
+                json.dump([symbol_metadata(symbol) for symbol in selected], f, indent=2)
+        selected = [symbol.name for symbol in
+                    sorted(selected, key=lambda symbol: symbol.num_records, reverse=True)]
+
+        # write to files
+        if not os.path.exists(out_dir):
+            os.mkdir(out_dir)
+        csv_paths = [os.path.join(out_dir, name + extension) for name in selected]
+        n = len(selected)
+        if (workers is None) or (workers <= 1) or (n < 2):
+            return [export_symbol(gdx, name, csv_path, compression=compression, chunksize=chunksize)
+                    for name, csv_path in zip(selected, csv_paths)]
+        gams_dir = gdx.gams_dir
+    with ProcessPoolExecutor(max_workers=min(workers, n), initializer=_init_worker,
+                             initargs=(in_gdx, gams_dir)) as pool:
+        return list(pool.map(_export_in_worker, selected, csv_paths, [compression] * n,
+                             [chunksize] * n))
 
 if __name__ == "__main__":
 
     # define and execute the command line interface
-    parser = argparse.ArgumentParser(description='''Reads a gdx file into
-        pandas dataframes, and then writes them out as csv files.''')
+    parser = argparse.ArgumentParser(description='''Reads a gdx file and writes
+        each symbol out as a csv file, streaming records in chunks.''')
     parser.add_argument('-i', '--in_gdx', help='''Input gdx file to be read
                         and exported as one csv per symbol.''')
     parser.add_argument('-o', '--out_dir', default='./gdx_data/',
                         help='''Directory to which csvs are to be written.''')
     parser.add_argument('-g', '--gams_dir', help='''Path to GAMS installation
                         directory.''', default = None)
-        
+    parser.add_argument('-s', '--symbols', nargs='+', help='''Names of the
+                        symbols to export. All symbols are exported by default.''')
+    parser.add_argument('-x', '--exclude', nargs='+', help='''Names of symbols
+                        not to export.''')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='''Number
+                        of processes exporting symbols in parallel.''')
+    parser.add_argument('-c', '--compression', choices=['gzip', 'zstd'],
+                        default=None, help='''Compress the csvs, which are then
+                        named *.csv.gz or *.csv.zst.''')
+    parser.add_argument('--chunksize', type=int, default=1000000, help='''Maximum
+                        number of records held in memory per symbol.''')
+    parser.add_argument('--schema', help='''Path of a JSON file to which to
+                        write the type, dimensions and description of each
+                        symbol exported, for use with csv_to_gdx.py --schema.''')
+
     args = parser.parse_args()
-    
-    convert_gdx_to_csv(args.in_gdx, os.path.realpath(args.out_dir), args.gams_dir)
+
+    convert_gdx_to_csv(args.in_gdx, os.path.realpath(args.out_dir), args.gams_dir,
+                       symbols=args.symbols, exclude=args.exclude, workers=args.workers,
+                       compression=args.compression, chunksize=args.chunksize,
+                       schema=args.schema)
@@ -0,0 +1,51 @@
+import argparse
+import logging
+import os
+
+import gdxpds
+
+logger = logging.getLogger(__name__)
+
+
+def convert_gdx_to_parquet(in_gdx, out_dir, gams_dir=None, symbols=None,
+                           chunksize=1000000, load_set_text=False, raw_specials=False,
+                           compression='snappy'):
+    # check inputs
+    if not os.path.exists(os.path.dirname(os.path.normpath(out_dir))):
+        raise RuntimeError("Parent directory of output directory '{}' does not exist.".format(out_dir))
+
+    # stream each symbol to its own file
+    return gdxpds.to_parquet(in_gdx, out_dir, symbols=symbols, gams_dir=gams_dir,
+                             chunksize=chunksize, load_set_text=load_set_text,
+                             raw_specials=raw_specials, compression=compression)
+
+if __name__ == "__main__":
+
+    # define and execute the command line interface
+    parser = argparse.ArgumentParser(description='''Reads a gdx file and
+        writes each symbol out as a parquet file, in batches of records.''')
+    parser.add_argument('-i', '--in_gdx', help='''Input gdx file to be read
+                        and exported as one parquet file per symbol.''')
+    parser.add_argument('-o', '--out_dir', default='./gdx_data/',
+                        help='''Directory to which parquet files are to be written.''')
+    parser.add_argument('-s', '--symbols', nargs='+', help='''Names of the
+                        symbols to export. All symbols are exported by default.''')
+    parser.add_argument('-c', '--chunksize', type=int, default=1000000,
+                        help='''Maximum number of records per row group.''')
+    parser.add_argument('--load_set_text', action='store_true', help='''Write
+                        the GDX Text field of Sets rather than True as their
+                        values.''')
+    parser.add_argument('--raw_specials', action='store_true', help='''Write
+                        GDX special values as-is rather than as their numpy
+                        equivalents.''')
+    parser.add_argument('--compression', default='snappy', help='''Parquet
+                        compression codec.''')
+    parser.add_argument('-g', '--gams_dir', help='''Path to GAMS installation
+                        directory.''', default = None)
+
+    args = parser.parse_args()
+
+    convert_gdx_to_parquet(args.in_gdx, os.path.realpath(args.out_dir), args.gams_dir,
+                           symbols=args.symbols, chunksize=args.chunksize,
+                           load_set_text=args.load_set_text, raw_specials=args.raw_specials,
+                           compression=args.compression)
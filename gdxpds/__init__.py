@@ -1,51 +1,123 @@
 from ._version import __version__
 
+import importlib
 import logging
 import sys
 
 logger = logging.getLogger(__name__)
 
 from gdxpds.tools import Error
-from gdxpds.special import load_specials
 
 from ._version import __version__
 
 
 def load_gdxcc(gams_dir=None):
     """
-    Method to initialize GAMS, especially to load required libraries that can 
+    Method to initialize GAMS, especially to load required libraries that can
     sometimes conflict with other packages.
 
+    Otherwise, gdxcc is initialized with the default GAMS directory just
+    before pandas is first imported, or, if pandas was imported before
+    gdxpds, on first GDX use.
+
     Parameters
     ----------
     gams_dir : None or str
         if not None, directory containing the GAMS executable
     """
+    global _gdxcc_initialized
     if 'pandas' in sys.modules:
         logger.warning("Especially on Linux, gdxpds should be imported before " + \
                        "pandas to avoid a library conflict. Also make sure your " + \
                        "GAMS directory is listed in LD_LIBRARY_PATH.")
-    import gdxcc
+    from gdxpds.handles import handle_pool
+    from gdxpds.special import load_specials
     from gdxpds.tools import GamsDirFinder
     finder = GamsDirFinder(gams_dir=gams_dir)
-    H = gdxcc.new_gdxHandle_tp()
-    _rc = gdxcc.gdxCreateD(H,finder.gams_dir,gdxcc.GMS_SSSIZE)
-    gdxcc.gdxFree(H)
+    # loads the GDX library; load_specials then reuses the pooled handle
+    handle_pool.release(handle_pool.acquire(finder.gams_dir), finder.gams_dir)
     load_specials(finder)
+    _gdxcc_initialized = True
     return
 
-try:
-    load_gdxcc()
-except:
-    from gdxpds.tools import GamsDirFinder
-    gams_dir = None
+
+# gdxcc is initialized on first use rather than on import, see _ensure_gdxcc
+_gdxcc_initialized = False
+
+
+def _ensure_gdxcc(gams_dir=None):
+    """
+    Initializes gdxcc with gams_dir (or the default GAMS directory), unless 
+    that has already been done or attempted. Called before any gdxpds module 
+    imports pandas, before pandas is first imported by anyone else (see 
+    _InitBeforePandas), and, as a fallback, on first GDX use.
+    """
+    global _gdxcc_initialized
+    if _gdxcc_initialized:
+        return
+    _gdxcc_initialized = True
     try:
-        gams_dir = GamsDirFinder().gams_dir
-    except: pass
-    logger.warning(f"Unable to load gdxcc with default GAMS directory '{gams_dir}'. "
-                   "You may need to explicitly call gdxpds.load_gdxcc(gams_dir) "
-                   "before importing pandas to avoid a library conflict.")
+        load_gdxcc(gams_dir=gams_dir)
+    except:
+        from gdxpds.tools import GamsDirFinder
+        try:
+            gams_dir = GamsDirFinder(gams_dir=gams_dir).gams_dir
+        except: pass
+        logger.warning(f"Unable to load gdxcc with GAMS directory '{gams_dir}'. "
+                       "You may need to explicitly call gdxpds.load_gdxcc(gams_dir) "
+                       "before importing pandas to avoid a library conflict.")
+
+
+class _InitBeforePandas(object):
+    """
+    Import hook that keeps the 'import gdxpds before pandas' protection without
+    initializing gdxcc on import: gdxcc is initialized just before pandas is
+    first imported, whoever imports it.
+    """
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname == 'pandas':
+            _remove_import_hook()
+            _ensure_gdxcc()
+        # let the regular finders import the module
+        return None
+
+
+def _remove_import_hook():
+    sys.meta_path[:] = [finder for finder in sys.meta_path
+                        if not isinstance(finder, _InitBeforePandas)]
+
+
+if 'pandas' not in sys.modules:
+    sys.meta_path.insert(0, _InitBeforePandas())
+
+
+# public functions and submodules, imported on first access
+_LAZY_ATTRIBUTES = {
+    'to_dataframes': 'gdxpds.read_gdx',
+    'list_symbols': 'gdxpds.read_gdx',
+    'to_dataframe': 'gdxpds.read_gdx',
+    'get_data_types': 'gdxpds.read_gdx',
+    'iter_dataframe': 'gdxpds.read_gdx',
+    'read_many': 'gdxpds.read_gdx',
+    'to_gdx': 'gdxpds.write_gdx',
+    'to_parquet': 'gdxpds.parquet',
+}
+_LAZY_SUBMODULES = ['cache', 'gdx', 'handles', 'instrumentation', 'metadata', 'parquet', 'read_gdx', 'special', 'tools', 'write_gdx']
+
+__all__ = ['Error', 'load_gdxcc'] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        _ensure_gdxcc()
+        value = importlib.import_module(f'gdxpds.{name}')
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
-from gdxpds.read_gdx import to_dataframes, list_symbols, to_dataframe, get_data_types
-from gdxpds.write_gdx import to_gdx
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
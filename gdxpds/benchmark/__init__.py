@@ -0,0 +1,4 @@
+'''
+Benchmarks of gdxpds performance. Each module can be run as a script, e.g., 
+``python -m gdxpds.benchmark.import_time``, and reports its results as JSON.
+'''
@@ -0,0 +1,91 @@
+'''
+Measures the start-up cost of gdxpds, each statement timed in a fresh 
+interpreter:
+
+.. code:: bash
+
+   python -m gdxpds.benchmark.import_time --repeat 10
+
+'import gdxpds' only loads the package itself. gdxcc is initialized, and 
+pandas imported, on first use, which 'import gdxpds.gdx' forces and so 
+measures the full cost that used to be paid on every 'import gdxpds'.
+'''
+
+import argparse
+from collections import OrderedDict
+import json
+import statistics
+import subprocess as subp
+import sys
+
+STATEMENTS = OrderedDict([
+    ('import gdxpds', 'import gdxpds'),
+    ('import gdxpds; load_gdxcc', 'import gdxpds; gdxpds.load_gdxcc()'),
+    ('import gdxpds.gdx', 'import gdxpds.gdx'),
+    ('import pandas', 'import pandas'),
+])
+"""Statements timed by :py:func:`run`, by label"""
+
+TIMER = "import time; _start = time.perf_counter(); {}; print(time.perf_counter() - _start)"
+
+
+def time_statement(statement, repeat=5):
+    """
+    Times statement in repeat fresh interpreters.
+
+    Parameters
+    ----------
+    statement : str
+        Python code to run
+    repeat : int
+        Number of interpreters to start
+
+    Returns
+    -------
+    list of float
+        Elapsed seconds, one per run
+    """
+    result = []
+    for _i in range(repeat):
+        out = subp.check_output([sys.executable, '-c', TIMER.format(statement)])
+        result.append(float(out.decode().strip().splitlines()[-1]))
+    return result
+
+
+def run(repeat=5, statements=STATEMENTS):
+    """
+    Parameters
+    ----------
+    repeat : int
+        Number of fresh interpreters per statement
+    statements : dict of str to str
+        Statements to time, by label
+
+    Returns
+    -------
+    dict
+        For each label, the min and median elapsed seconds
+    """
+    result = OrderedDict()
+    for label, statement in statements.items():
+        times = time_statement(statement, repeat=repeat)
+        result[label] = {'min_s': min(times), 'median_s': statistics.median(times)}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-r', '--repeat', type=int, default=5, 
+                        help="Number of fresh interpreters per statement")
+    parser.add_argument('-o', '--output', help="Path of JSON file to write results to")
+    args = parser.parse_args()
+
+    result = {'benchmark': 'import_time', 'repeat': args.repeat, 'results': run(repeat=args.repeat)}
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+'''
+Peak-memory benchmark on synthetic data (see :py:mod:`gdxpds.benchmark.synthetic`),
+measured with tracemalloc:
+
+.. code:: bash
+
+   python -m gdxpds.benchmark.memory --records 200000 --output memory.json
+
+tracemalloc sees the memory allocated through Python, including numpy and
+pandas buffers, but not memory allocated inside the GDX library itself. Each
+result also lists the bytes of the resulting frames as reported by
+:py:meth:`GdxFile.memory_report <gdxpds.gdx.GdxFile.memory_report>`, and the
+estimate it gives before loading.
+'''
+
+import argparse
+from collections import OrderedDict
+import json
+import logging
+import os
+import runpy
+import shutil
+import tempfile
+import tracemalloc
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+import gdxpds
+from gdxpds.benchmark.synthetic import generate
+from gdxpds.gdx import GdxFile
+
+logger = logging.getLogger(__name__)
+
+
+def peak_memory(func, *args, **kwargs):
+    """
+    Returns (result, peak bytes traced by tracemalloc) of func(*args, **kwargs)
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start, _peak = tracemalloc.get_traced_memory()
+    try:
+        result = func(*args, **kwargs)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak - start
+
+
+def find_script(name):
+    """
+    Returns the path to the gdxpds command line script name (e.g.,
+    'gdx_to_csv.py'), whether installed or in a source checkout, or None.
+    """
+    ret = shutil.which(name)
+    if ret is None:
+        candidate = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(gdxpds.__file__))),
+                                 'bin', name)
+        if os.path.isfile(candidate):
+            ret = candidate
+    return ret
+
+
+def run(records=100000, dims=3, uels=None, special_density=0.01, workdir=None,
+        gams_dir=None):
+    """
+    Measures the peak memory of to_dataframes, to_gdx, and the gdx_to_csv and
+    csv_to_gdx command line conversions.
+
+    Parameters
+    ----------
+    records, dims, uels, special_density
+        As for :py:func:`gdxpds.benchmark.synthetic.generate`
+    workdir : None or str
+        Directory for the files written. A temporary directory by default.
+    gams_dir : None or str
+        optional path to GAMS directory
+
+    Returns
+    -------
+    dict
+        Parameters and, for each benchmark, peak_bytes
+    """
+    results = OrderedDict()
+    with tempfile.TemporaryDirectory(dir=workdir) as tmpdir:
+        filename = os.path.join(tmpdir, 'synthetic.gdx')
+        with generate(filename, records=records, dims=dims, uels=uels,
+                      special_density=special_density, gams_dir=gams_dir):
+            pass
+
+        with GdxFile(gams_dir=gams_dir) as f:
+            f.read(filename)
+            estimated_bytes = int(f.memory_report()['bytes'].sum())
+
+        dfs, peak = peak_memory(gdxpds.to_dataframes, filename, gams_dir=gams_dir)
+        frame_bytes = sum(int(df.memory_usage(deep=True, index=True).sum()) for df in dfs.values())
+        results['to_dataframes'] = {'peak_bytes': peak,
+                                    'frame_bytes': frame_bytes,
+                                    'estimated_bytes': estimated_bytes}
+
+        out_file = os.path.join(tmpdir, 'to_gdx.gdx')
+        def to_gdx():
+            with gdxpds.to_gdx(dfs, out_file, gams_dir=gams_dir):
+                pass
+        _result, peak = peak_memory(to_gdx)
+        results['to_gdx'] = {'peak_bytes': peak, 'frame_bytes': frame_bytes}
+        del dfs
+
+        gdx_to_csv = find_script('gdx_to_csv.py')
+        csv_to_gdx = find_script('csv_to_gdx.py')
+        if (gdx_to_csv is None) or (csv_to_gdx is None):
+            logger.warning("Not measuring the command line conversions, because "
+                           "gdx_to_csv.py and csv_to_gdx.py were not found.")
+        else:
+            csv_dir = os.path.join(tmpdir, 'csvs')
+            convert = runpy.run_path(gdx_to_csv)['convert_gdx_to_csv']
+            _result, peak = peak_memory(convert, filename, csv_dir, gams_dir=gams_dir)
+            results['gdx_to_csv'] = {'peak_bytes': peak}
+
+            csvs = [os.path.join(csv_dir, name) for name in sorted(os.listdir(csv_dir))]
+            convert = runpy.run_path(csv_to_gdx)['convert_csv_to_gdx']
+            _result, peak = peak_memory(convert, csvs, os.path.join(tmpdir, 'csv_to_gdx.gdx'),
+                                        gams_dir=gams_dir)
+            results['csv_to_gdx'] = {'peak_bytes': peak}
+
+    return OrderedDict([
+        ('benchmark', 'memory'),
+        ('gdxpds_version', gdxpds.__version__),
+        ('parameters', OrderedDict([('records', records), ('dims', dims), ('uels', uels),
+                                    ('special_density', special_density)])),
+        ('results', results)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reports the peak memory traced while "
+                                                 "converting synthetic data.")
+    parser.add_argument('-n', '--records', type=int, default=100000,
+                        help="Number of records per synthetic symbol")
+    parser.add_argument('-d', '--dims', type=int, default=3,
+                        help="Number of dimensions per synthetic symbol")
+    parser.add_argument('-u', '--uels', type=int, help="Number of labels per dimension")
+    parser.add_argument('-s', '--special-density', type=float, default=0.01,
+                        help="Fraction of values that are special values")
+    parser.add_argument('-o', '--output', help="Path of JSON file to write results to")
+    parser.add_argument('-g', '--gams-dir', help="Path to GAMS installation directory")
+    args = parser.parse_args()
+
+    result = run(records=args.records, dims=args.dims, uels=args.uels,
+                 special_density=args.special_density, gams_dir=args.gams_dir)
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+'''
+Generator of synthetic GDX data for benchmarks. Symbols of every
+:py:class:`GamsDataType <gdxpds.gdx.GamsDataType>` but Alias can be generated
+with a given number of records, dimensionality, number of unique element
+labels (UELs) per dimension, and density of special values.
+
+.. code:: bash
+
+   python -m gdxpds.benchmark.synthetic out.gdx --records 1000000 --dims 3
+'''
+
+import argparse
+from collections import OrderedDict
+import logging
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+from gdxpds.tools import Error
+from gdxpds.gdx import GdxFile, GdxSymbol, GamsDataType
+from gdxpds.special import NUMPY_SPECIAL_VALUES
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DATA_TYPES = (GamsDataType.Set, GamsDataType.Parameter,
+              GamsDataType.Variable, GamsDataType.Equation)
+"""Data types :py:func:`generate_symbol` supports"""
+
+SPECIAL_VALUES = [np.nan, np.inf, -np.inf, NUMPY_SPECIAL_VALUES[-1]]
+"""Special values :py:func:`generate_symbol` draws from"""
+
+
+def generate_symbol(name, data_type, records=10000, dims=2, uels=None,
+                    special_density=0.0, seed=0):
+    """
+    Generates the dataframe of a synthetic symbol.
+
+    Parameters
+    ----------
+    name : str
+        Symbol name, also used to prefix dimension names
+    data_type : :py:class:`GamsDataType <gdxpds.gdx.GamsDataType>` or str
+        One of :py:data:`DATA_TYPES`
+    records : int
+        Number of records
+    dims : int
+        Number of dimensions, at least 1
+    uels : None or int
+        Number of distinct labels per dimension. If None, the smallest number
+        that can hold records is used. Labels are shared across dimensions
+        and symbols.
+    special_density : float
+        Fraction of the values that are special values, drawn uniformly from
+        :py:data:`SPECIAL_VALUES`. Ignored for Sets.
+    seed : int
+        Random seed
+
+    Returns
+    -------
+    pd.DataFrame
+        Dim columns followed by value columns, records in sorted order
+    """
+    data_type = data_type if isinstance(data_type, GamsDataType) else GamsDataType[data_type]
+    if data_type not in DATA_TYPES:
+        raise Error(f"Cannot generate {data_type}. Expected one of {DATA_TYPES}.")
+    if dims < 1:
+        raise Error(f"dims must be at least 1. Was passed {dims!r}.")
+    if uels is None:
+        uels = max(int(np.ceil(records ** (1.0 / dims))), 1)
+        while uels ** dims < records:
+            uels += 1
+    if uels ** dims < records:
+        raise Error(f"Cannot generate {records} distinct records with {dims} "
+                    f"dimensions of {uels} labels each.")
+    rng = np.random.default_rng(seed)
+
+    # distinct records, as flat indices into the full cross product
+    index = np.sort(rng.choice(uels ** dims, size=records, replace=False))
+    codes = np.unravel_index(index, (uels,) * dims)
+    labels = np.array([f"u{i}" for i in range(uels)], dtype=object)
+    dim_names = [f"{name}_d{i}" for i in range(dims)]
+    df = pd.DataFrame(OrderedDict((dim_name, labels[code])
+                                  for dim_name, code in zip(dim_names, codes)))
+    if data_type == GamsDataType.Set:
+        df['Value'] = True
+        return df
+
+    symbol = GdxSymbol(name, data_type, dims=dim_names)
+    value_col_names = symbol.value_col_names
+    values = rng.random((records, len(value_col_names))) * 100.0
+    if special_density > 0:
+        mask = rng.random(values.shape) < special_density
+        values[mask] = rng.choice(SPECIAL_VALUES, size=int(mask.sum()))
+    for i, value_col_name in enumerate(value_col_names):
+        df[value_col_name] = values[:, i]
+    return df
+
+
+def generate(filename=None, records=10000, dims=2, uels=None, special_density=0.0,
+             data_types=DATA_TYPES, seed=0, gams_dir=None):
+    """
+    Generates a GDX file with one synthetic symbol per data type, named after
+    the data type in lower case (e.g., 'parameter').
+
+    Parameters
+    ----------
+    filename : None or pathlib.Path or str
+        If not None, the file is written there
+    records, dims, uels, special_density, seed
+        As for :py:func:`generate_symbol`
+    data_types : list of :py:class:`GamsDataType <gdxpds.gdx.GamsDataType>` or str
+        Data types of the symbols to generate
+    gams_dir : None or str
+        optional path to GAMS directory
+
+    Returns
+    -------
+    :py:class:`GdxFile <gdxpds.gdx.GdxFile>`
+        The generated, loaded, file
+    """
+    result = GdxFile(gams_dir=gams_dir)
+    for i, data_type in enumerate(data_types):
+        data_type = data_type if isinstance(data_type, GamsDataType) else GamsDataType[data_type]
+        name = data_type.name.lower()
+        df = generate_symbol(name, data_type, records=records, dims=dims, uels=uels,
+                             special_density=special_density, seed=seed + i)
+        result.append(GdxSymbol(name, data_type, dims=list(df.columns[:dims])))
+        result[-1].set_dataframe(df, copy=False)
+    if filename is not None:
+        result.write(filename)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Writes a GDX file of synthetic data.")
+    parser.add_argument('filename', help="Path of the GDX file to write")
+    parser.add_argument('-n', '--records', type=int, default=10000,
+                        help="Number of records per symbol")
+    parser.add_argument('-d', '--dims', type=int, default=2,
+                        help="Number of dimensions per symbol")
+    parser.add_argument('-u', '--uels', type=int,
+                        help="Number of labels per dimension")
+    parser.add_argument('-s', '--special-density', type=float, default=0.0,
+                        help="Fraction of values that are special values")
+    parser.add_argument('-t', '--data-types', nargs='+', default=[t.name for t in DATA_TYPES],
+                        choices=[t.name for t in DATA_TYPES],
+                        help="Data types of the symbols to generate")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('-g', '--gams-dir', help="Path to GAMS installation directory")
+    args = parser.parse_args()
+
+    with generate(args.filename, records=args.records, dims=args.dims, uels=args.uels,
+                  special_density=args.special_density, data_types=args.data_types,
+                  seed=args.seed, gams_dir=args.gams_dir):
+        pass
+
+
+if __name__ == "__main__":
+    main()
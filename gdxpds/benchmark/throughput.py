@@ -0,0 +1,193 @@
+'''
+Read/write throughput benchmark on synthetic data (see
+:py:mod:`gdxpds.benchmark.synthetic`), reported in records per second:
+
+.. code:: bash
+
+   python -m gdxpds.benchmark.throughput --records 200000 --output new.json
+   python -m gdxpds.benchmark.throughput --records 200000 --baseline new.json
+
+With --baseline, each benchmark is also reported as a ratio to the baseline
+records per second, and --min-ratio makes the run fail if any ratio is lower.
+'''
+
+import argparse
+from collections import OrderedDict
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+import gdxpds
+from gdxpds.benchmark.synthetic import generate
+from gdxpds.gdx import append_dense_parameter, GdxFile, READ_ENGINES
+import gdxpds.special as special
+
+logger = logging.getLogger(__name__)
+
+
+def best_time(func, repeat=3, setup=None):
+    """
+    Returns the shortest of repeat timings of func(). If setup is given,
+    func(setup()) is timed instead, and setup is not included in the timing.
+    """
+    result = None
+    for _i in range(repeat):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result
+
+
+def run(records=100000, dims=3, uels=None, special_density=0.01, repeat=3,
+        workdir=None, gams_dir=None):
+    """
+    Runs all throughput benchmarks.
+
+    Parameters
+    ----------
+    records : int
+        Number of records per synthetic symbol
+    dims : int
+        Number of dimensions per synthetic symbol
+    uels : None or int
+        Number of labels per dimension
+    special_density : float
+        Fraction of values that are special values
+    repeat : int
+        Number of timings per benchmark, of which the best is reported
+    workdir : None or str
+        Directory for the synthetic GDX file. A temporary directory by default.
+    gams_dir : None or str
+        optional path to GAMS directory
+
+    Returns
+    -------
+    dict
+        Parameters and, for each benchmark, records, best_s and records_per_s
+    """
+    results = OrderedDict()
+
+    def record(name, num_records, seconds):
+        results[name] = {'records': num_records,
+                         'best_s': seconds,
+                         'records_per_s': num_records / seconds if seconds > 0 else float('inf')}
+        logger.info(f"{name}: {results[name]['records_per_s']:.0f} records/s")
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmpdir:
+        filename = os.path.join(tmpdir, 'synthetic.gdx')
+        with generate(None, records=records, dims=dims, uels=uels,
+                      special_density=special_density, gams_dir=gams_dir) as gdx:
+            total_records = gdx.num_elements
+
+            def write(f):
+                with f:
+                    f.write(filename)
+            record('write', total_records, best_time(write, repeat=repeat, setup=gdx.clone))
+
+            # the synthetic parameter's records, written from a dense array
+            parameter = gdx['parameter']
+            dense_values = parameter.to_numpy_dense()
+            coords = parameter.dense_coords()
+            def write_dense(f):
+                with f:
+                    append_dense_parameter(f, 'parameter', dense_values, coords)
+                    f.write(os.path.join(tmpdir, 'dense.gdx'))
+            record('write_dense', parameter.num_records,
+                   best_time(write_dense, repeat=repeat, 
+                             setup=lambda: GdxFile(gams_dir=gams_dir)))
+
+            values = gdx['parameter'].dataframe['Value'].to_numpy(dtype=float)
+            record('np_to_gdx_values', len(values),
+                   best_time(special.np_to_gdx_values, repeat=repeat, setup=values.copy))
+            gdx_values = special.np_to_gdx_values(values.copy())
+            record('gdx_to_np_values', len(gdx_values),
+                   best_time(special.gdx_to_np_values, repeat=repeat, setup=gdx_values.copy))
+
+        for engine in READ_ENGINES:
+            def read(f):
+                with f:
+                    f.read(filename)
+                    for symbol in f:
+                        symbol.load()
+            record(f'read_{engine}', total_records,
+                   best_time(read, repeat=repeat,
+                             setup=lambda: GdxFile(gams_dir=gams_dir, read_engine=engine)))
+
+        record('to_dataframes', total_records,
+               best_time(lambda: gdxpds.to_dataframes(filename, gams_dir=gams_dir), repeat=repeat))
+
+    return OrderedDict([
+        ('benchmark', 'throughput'),
+        ('gdxpds_version', gdxpds.__version__),
+        ('parameters', OrderedDict([('records', records), ('dims', dims), ('uels', uels),
+                                    ('special_density', special_density), ('repeat', repeat)])),
+        ('results', results)])
+
+
+def compare(result, baseline):
+    """
+    Parameters
+    ----------
+    result : dict
+        As returned by :py:func:`run`
+    baseline : dict
+        As returned by :py:func:`run`, e.g., for an earlier version
+
+    Returns
+    -------
+    dict of str to float
+        For each benchmark in both, the ratio of result to baseline records_per_s
+    """
+    ret = OrderedDict()
+    for name, res in result['results'].items():
+        if name in baseline['results']:
+            ret[name] = res['records_per_s'] / baseline['results'][name]['records_per_s']
+    return ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reports gdxpds read/write throughput "
+                                                 "on synthetic data in records/s.")
+    parser.add_argument('-n', '--records', type=int, default=100000,
+                        help="Number of records per synthetic symbol")
+    parser.add_argument('-d', '--dims', type=int, default=3,
+                        help="Number of dimensions per synthetic symbol")
+    parser.add_argument('-u', '--uels', type=int, help="Number of labels per dimension")
+    parser.add_argument('-s', '--special-density', type=float, default=0.01,
+                        help="Fraction of values that are special values")
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help="Number of timings per benchmark, of which the best is reported")
+    parser.add_argument('-o', '--output', help="Path of JSON file to write results to")
+    parser.add_argument('-b', '--baseline', help="Path of JSON results to compare against")
+    parser.add_argument('--min-ratio', type=float,
+                        help="With --baseline, fail if any benchmark is slower than this "
+                             "ratio of the baseline records/s")
+    parser.add_argument('-g', '--gams-dir', help="Path to GAMS installation directory")
+    args = parser.parse_args()
+
+    result = run(records=args.records, dims=args.dims, uels=args.uels,
+                 special_density=args.special_density, repeat=args.repeat,
+                 gams_dir=args.gams_dir)
+    if args.baseline:
+        with open(args.baseline) as f:
+            result['ratio_to_baseline'] = compare(result, json.load(f))
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    if args.baseline and (args.min_ratio is not None):
+        slow = {name: ratio for name, ratio in result['ratio_to_baseline'].items()
+                if ratio < args.min_ratio}
+        if slow:
+            sys.exit(f"Slower than {args.min_ratio} of baseline: {slow}")
+
+
+if __name__ == "__main__":
+    main()
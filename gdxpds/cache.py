@@ -0,0 +1,186 @@
+'''
+Optional in-process cache of decoded symbols, so that reading the same symbols
+of an unchanged GDX file again and again does not decode them each time. Used
+by :py:func:`gdxpds.to_dataframe` and :py:func:`gdxpds.to_dataframes` when
+called with cache=True (the shared :py:data:`symbol_cache`) or with a
+:py:class:`SymbolCache`.
+'''
+
+from collections import OrderedDict
+from collections.abc import Iterable
+import logging
+import threading
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+from gdxpds.metadata import _file_key
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+"""Default bound on the bytes of the frames held by a :py:class:`SymbolCache`"""
+
+
+def _copy_on_write():
+    """
+    Whether pandas copy-on-write is in effect, in which case shallow copies
+    of cached frames are safe to hand out
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except Exception:
+        return False
+
+
+def _freeze(value):
+    """
+    Returns a hashable equivalent of the load option value, e.g., of a filters
+    dict
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(labels)) for key, labels in value.items()))
+    if isinstance(value, str) or not isinstance(value, Iterable):
+        return value
+    return tuple(sorted(str(label) for label in value))
+
+
+class SymbolCache(object):
+    """
+    Least-recently-used store of symbol dataframes, keyed by the GDX file's
+    real path, size and modification time, the symbol name, and the load
+    options. Entries of a file that has since changed are never returned, and
+    are dropped as soon as the new version of the file is cached. Thread-safe.
+
+    Frames are handed out as copies, so callers may modify them freely. With
+    pandas copy-on-write in effect (always, as of pandas 3.0), these are
+    shallow copies that cost microseconds.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            Bound on the deep memory usage of the frames held. Least recently
+            used entries are dropped to stay within it, and frames larger than
+            max_bytes are not cached at all.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """
+        Bytes of the frames currently held
+
+        Returns
+        -------
+        int
+        """
+        return self._nbytes
+
+    @staticmethod
+    def key(gdx_file, symbol_name, **options):
+        """
+        Returns the key under which symbol_name, as read from the current
+        version of gdx_file with options, is cached.
+
+        Parameters
+        ----------
+        gdx_file : pathlib.Path or str
+            Path to an existing GDX file
+        symbol_name : str
+        options
+            Load options that affect the frame, e.g., load_set_text=True
+
+        Returns
+        -------
+        tuple
+        """
+        return _file_key(gdx_file) + (symbol_name, _freeze(options))
+
+    def get(self, key):
+        """
+        Returns a copy of the frame cached under key, or None.
+
+        Parameters
+        ----------
+        key : tuple
+            As returned by :py:meth:`key`
+
+        Returns
+        -------
+        None or pd.DataFrame
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._copy(entry[0])
+
+    def put(self, key, df):
+        """
+        Caches df under key, unless it is larger than :py:attr:`max_bytes`,
+        and returns a copy of it for the caller to use.
+
+        Parameters
+        ----------
+        key : tuple
+            As returned by :py:meth:`key`
+        df : pd.DataFrame
+            Frame to cache. The cache takes ownership of it.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        nbytes = int(df.memory_usage(deep=True, index=True).sum())
+        if nbytes > self.max_bytes:
+            logger.debug(f"Not caching {key[3]!r} from '{key[0]}', because its {nbytes} "
+                         f"bytes exceed max_bytes = {self.max_bytes}.")
+            return df
+        with self._lock:
+            # drop this entry's earlier value, and entries of earlier versions
+            # of the same file
+            for other in [other for other in self._entries if (other == key) or
+                          ((other[0] == key[0]) and (other[1:3] != key[1:3]))]:
+                self._drop(other)
+            self._entries[key] = (df, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return self._copy(df)
+
+    def clear(self):
+        """
+        Drops all entries
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _drop(self, key):
+        _df, nbytes = self._entries.pop(key)
+        self._nbytes -= nbytes
+
+    @staticmethod
+    def _copy(df):
+        return df.copy(deep=not _copy_on_write())
+
+
+symbol_cache = SymbolCache()
+"""The :py:class:`SymbolCache` used by the gdxpds.read_gdx functions when passed cache=True"""
@@ -8,19 +8,21 @@ including translation between GDX and numpy special values.
 from __future__ import absolute_import, print_function
 from builtins import super
 
-import atexit
 from collections import defaultdict, OrderedDict
+from concurrent.futures import as_completed, ProcessPoolExecutor
 
 try:
-    from collections.abc import MutableSequence
+    from collections.abc import Iterable, MutableSequence
 except ImportError:
-    from collections import MutableSequence
+    from collections import Iterable, MutableSequence
 
 import copy
 from ctypes import c_bool
 from enum import Enum
+from itertools import chain, repeat, takewhile
 import logging
 from numbers import Number
+import sys
 
 # try to import gdx loading utility
 HAVE_GDX2PY = False
@@ -32,7 +34,10 @@ except ImportError: pass
 
 # gdxpds needs to be imported before pandas to try to avoid library conflict on 
 # Linux that causes a segmentation fault.
-from gdxpds import Error
+from gdxpds import _ensure_gdxcc, Error
+_ensure_gdxcc()
+from gdxpds.handles import handle_pool
+from gdxpds import instrumentation
 from gdxpds.tools import NeedsGamsDir
 
 import gdxcc
@@ -100,9 +105,47 @@ class GdxError(Error):
         super().__init__(msg)
 
 
+READ_ENGINES = ('str', 'raw')
+"""
+Engines available to :py:meth:`GdxSymbol.load`. Both call GDX once per record. 
+'str' reads with gdxDataReadStr, receiving new label strings for every record. 
+'raw' reads integer UEL codes with gdxDataReadRaw into one preallocated array 
+and builds the dimension columns with a single np.take per dimension on the 
+file's :py:attr:`GdxFile.uels` table, so labels are shared rather than 
+allocated per record.
+"""
+
+DTYPE_BACKENDS = ('numpy', 'pyarrow')
+"""
+Backends available for the columns of loaded symbols. 'numpy' gives object 
+(or pd.Categorical) dimension columns and numpy value columns. 'pyarrow' gives 
+pd.ArrowDtype columns built directly from the raw read buffers: dimension 
+columns are Arrow dictionary arrays of str sharing one dictionary of the 
+file's UELs, and value columns are Arrow float64 (bool for Sets) arrays.
+"""
+
+# gdxDataReadFilteredStart action for dimensions that are not filtered
+DOMC_UNMAPPED = -2
+
+
+def _read_map(H):
+    return gdxcc.gdxDataReadMap(H, 0)
+
+
+def _import_xarray():
+    try:
+        import xarray
+    except ImportError:
+        raise Error("GdxSymbol.to_xarray requires xarray. Install it with "
+                    "'pip install xarray' or 'pip install gdxpds[xarray]'.")
+    return xarray
+
+
 class GdxFile(MutableSequence, NeedsGamsDir):
 
-    def __init__(self,gams_dir=None,lazy_load=True):
+    def __init__(self,gams_dir=None,lazy_load=True,read_engine='str',
+                 categorical_dims=False,raw_specials=False,bool_set_values=False,
+                 workers=None,memory_budget=None,dtype_backend='numpy'):
         """
         Initializes a GdxFile object by connecting to GAMS and creating a pointer.
 
@@ -117,23 +160,88 @@ class GdxFile(MutableSequence, NeedsGamsDir):
             accessed later after the corresponding calls to :py:meth:`GdxSymbol.load`. 
             If False, all data are automatically loaded and the full GDX file is 
             available in memory after the call to :py:meth:`read`.
-        """
+        read_engine : str
+            Default engine used by :py:meth:`GdxSymbol.load`. One of 
+            :py:data:`READ_ENGINES`.
+        categorical_dims : bool
+            If True (default is False), :py:meth:`GdxSymbol.load` returns 
+            dimension columns as pd.Categorical, with categories equal to this 
+            file's :py:attr:`uels` in GDX order. Implies the 'raw' engine.
+        raw_specials : bool
+            If True (default is False), :py:meth:`GdxSymbol.load` keeps GDX 
+            special values as-is rather than converting them to their numpy 
+            equivalents.
+        bool_set_values : bool
+            If True (default is False), the value column of this file's Sets is 
+            a numpy bool column rather than a column of `c_bool` objects. Every 
+            record read from GDX is a set member and so is loaded as True.
+        workers : None or int
+            Number of processes used to load the symbols when :py:meth:`read` 
+            is called with lazy_load False. See :py:meth:`load_symbols`.
+        memory_budget : None or int
+            If not None, the number of bytes the loaded symbols of the file 
+            read are allowed to use. Whenever a load takes them over budget, 
+            the least recently used symbols that have not been modified are 
+            unloaded, and they are transparently reloaded from :py:attr:`filename` 
+            (with the same load options) the next time their 
+            :py:attr:`GdxSymbol.dataframe` is accessed. Symbols whose 
+            dataframe has been set are :py:attr:`GdxSymbol.dirty` and are 
+            never evicted. Note that changes made in place to a dataframe 
+            are not detected; assign modified frames back to the symbol to 
+            keep them.
+        dtype_backend : str
+            One of :py:data:`DTYPE_BACKENDS`. 'pyarrow' (requires pyarrow) 
+            implies the 'raw' engine and bool_set_values.
+        """
+        if read_engine not in READ_ENGINES:
+            raise Error(f"Unknown read_engine {read_engine!r}. Expected one of {READ_ENGINES}.")
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise Error(f"Unknown dtype_backend {dtype_backend!r}. Expected one of {DTYPE_BACKENDS}.")
+        if dtype_backend == 'pyarrow':
+            try:
+                import pyarrow
+            except ImportError:
+                raise Error("dtype_backend='pyarrow' requires pyarrow. Install it with "
+                            "'pip install pyarrow'.")
         self.lazy_load = lazy_load
+        self.read_engine = read_engine
+        self.categorical_dims = categorical_dims
+        self.raw_specials = raw_specials
+        self.bool_set_values = bool_set_values
+        self.workers = workers
+        self.memory_budget = memory_budget
+        self.dtype_backend = dtype_backend
+        # loaded symbols of the file read, in least recently used order, and 
+        # their bytes. only kept up to date if memory_budget is not None
+        self._resident = OrderedDict()
         self._version = None
         self._producer = None
         self._filename = None
+        self._uels = None
+        self._uel_dtype = None
+        self._arrow_uels = None
         self._symbols = OrderedDict()
+        self._H = None
 
+        _ensure_gdxcc(gams_dir)
         NeedsGamsDir.__init__(self,gams_dir=gams_dir)
         self._H = self._create_gdx_object()
         self.universal_set = GdxSymbol('*',GamsDataType.Set,dims=1,file=None,index=0)
         self.universal_set._file = self
-
-        atexit.register(gdxcc.gdxFree, self.H)
         return
 
     def cleanup(self):
-        gdxcc.gdxFree(self.H)
+        """
+        Closes any open file and returns :py:attr:`H` to the shared 
+        :py:data:`handle pool <gdxpds.handles.handle_pool>`. Symbols that are 
+        not loaded can no longer be loaded afterwards. Safe to call more than 
+        once.
+        """
+        H = getattr(self, '_H', None)
+        if H is None:
+            return
+        self._H = None
+        handle_pool.release(H, self.gams_dir)
 
     def __enter__(self):
         return self
@@ -155,7 +263,14 @@ class GdxFile(MutableSequence, NeedsGamsDir):
         -------
         :py:class:`GdxFile`
         """
-        result = GdxFile(gams_dir=self.gams_dir,lazy_load=False)
+        result = GdxFile(gams_dir=self.gams_dir,lazy_load=False,
+                         read_engine=self.read_engine,
+                         categorical_dims=self.categorical_dims,
+                         raw_specials=self.raw_specials,
+                         bool_set_values=self.bool_set_values,
+                         workers=self.workers,
+                         memory_budget=self.memory_budget,
+                         dtype_backend=self.dtype_backend)
         for symbol in self:
             result.append(symbol.clone())
             result[-1]._file = result
@@ -179,6 +294,49 @@ class GdxFile(MutableSequence, NeedsGamsDir):
         """
         return self._H
 
+    @property
+    def resident_bytes(self):
+        """
+        Bytes used by the loaded symbols counted against 
+        :py:attr:`memory_budget`, as measured when they were loaded or set. 
+        Always 0 if there is no memory_budget.
+
+        Returns
+        -------
+        int
+        """
+        return sum(self._resident.values())
+
+    def _track(self, symbol):
+        """
+        Records the size of symbol, which has just been loaded or set, as 
+        most recently used, and evicts other symbols if over budget.
+        """
+        if self.memory_budget is None:
+            return
+        self._resident[symbol] = symbol.memory_usage(deep=True)
+        self._resident.move_to_end(symbol)
+        total = sum(self._resident.values())
+        for other in list(self._resident):
+            if total <= self.memory_budget:
+                break
+            if (other is symbol) or other.dirty:
+                continue
+            total -= self._resident[other]
+            logger.debug(f"Evicting {other.name!r} from memory to stay within "
+                         f"memory_budget = {self.memory_budget} bytes.")
+            other._evict()
+        if total > self.memory_budget:
+            logger.info(f"Loaded symbols use {total} bytes, more than memory_budget = "
+                        f"{self.memory_budget}, but the rest are in use or modified.")
+
+    def _touch(self, symbol):
+        if symbol in self._resident:
+            self._resident.move_to_end(symbol)
+
+    def _untrack(self, symbol):
+        self._resident.pop(symbol, None)
+
     @property
     def filename(self):
         """
@@ -204,6 +362,50 @@ class GdxFile(MutableSequence, NeedsGamsDir):
         """
         return self._producer
 
+    @property
+    def uels(self):
+        """
+        Unique element labels (UELs) of the file that was :py:meth:`read`, in 
+        GDX order. The table is read from the file once and then cached. The 
+        raw UEL code i used by gdxDataReadRaw corresponds to uels[i-1].
+
+        Returns
+        -------
+        numpy.ndarray of str
+        """
+        if self._uels is None:
+            self._uels = self._read_uels()
+        return self._uels
+
+    @property
+    def uel_dtype(self):
+        """
+        Categorical dtype whose categories are :py:attr:`uels`. Shared by all 
+        categorical dimension columns loaded from this file.
+
+        Returns
+        -------
+        pandas.CategoricalDtype
+        """
+        if self._uel_dtype is None:
+            self._uel_dtype = pd.CategoricalDtype(categories=self.uels)
+        return self._uel_dtype
+
+    @property
+    def arrow_uels(self):
+        """
+        :py:attr:`uels` as an Arrow string array. The dictionary shared by all 
+        dimension columns loaded from this file with dtype_backend 'pyarrow'.
+
+        Returns
+        -------
+        pyarrow.StringArray
+        """
+        if self._arrow_uels is None:
+            import pyarrow as pa
+            self._arrow_uels = pa.array(self.uels, type=pa.string())
+        return self._arrow_uels
+
     @property
     def num_elements(self):
         """
@@ -236,6 +438,9 @@ class GdxFile(MutableSequence, NeedsGamsDir):
         if not rc[0]:
             raise GdxError(self.H,f"Could not open {filename!r}")
         self._filename = filename
+        self._uels = None
+        self._uel_dtype = None
+        self._arrow_uels = None
 
         # read in meta-data ...
         # ... for the file
@@ -263,10 +468,87 @@ class GdxFile(MutableSequence, NeedsGamsDir):
 
         # read all symbols if not lazy_load
         if not self.lazy_load:
-            for symbol in self:
-                symbol.load()
+            self.load_symbols(workers=self.workers)
+        return
+
+    def load_symbols(self, symbols=None, load_set_text=False, workers=None):
+        """
+        Loads the symbols that are not loaded yet, optionally spreading the 
+        reads across a pool of processes.
+
+        Parameters
+        ----------
+        symbols : None or list of str
+            Names of the symbols to load. If None, all symbols are loaded.
+        load_set_text : bool
+            As for :py:meth:`GdxSymbol.load`
+        workers : None or int
+            If greater than 1, the symbols are read by up to this many 
+            processes, each of which opens its own gdxcc handle on 
+            :py:attr:`filename`. The workers send back raw UEL codes and 
+            values, which are far cheaper to transfer than frames of labels, 
+            and the dataframes are then built here exactly as 
+            :py:meth:`GdxSymbol.load` builds them with the 'raw' engine. 
+            Symbol order and metadata are unaffected.
+        """
+        selected = list(self) if symbols is None else [self[name] for name in symbols]
+        selected = [symbol for symbol in selected if not symbol.loaded]
+        if (workers is None) or (workers <= 1) or (len(selected) < 2):
+            for symbol in selected:
+                symbol.load(load_set_text=load_set_text)
+            return
+        if self.filename is None:
+            raise Error("Symbols can only be loaded in parallel from a file that has been read.")
+
+        # one task per worker, balanced by number of records, so that each 
+        # worker opens the file only once
+        batches = [[] for _i in range(min(workers, len(selected)))]
+        batch_records = [0] * len(batches)
+        for symbol in sorted(selected, key=lambda symbol: symbol.num_records, reverse=True):
+            i = batch_records.index(min(batch_records))
+            batches[i].append(symbol.name)
+            batch_records[i] += symbol.num_records + 1
+
+        logger.debug(f"Loading {len(selected)} symbols from '{self.filename}' "
+                     f"with {len(batches)} worker processes.")
+        with ProcessPoolExecutor(max_workers=len(batches)) as pool:
+            futures = [pool.submit(_read_raw_records, str(self.filename), self.gams_dir, batch) 
+                       for batch in batches]
+            for future in as_completed(futures):
+                for name, records in future.result():
+                    symbol = self[name]
+                    _engine, categorical_dims, convert_specials = symbol._load_options(
+                        'raw', None, None)
+                    symbol._set_loaded_data(symbol._load_raw(load_set_text=load_set_text,
+                                                             categorical_dims=categorical_dims,
+                                                             convert_specials=convert_specials,
+                                                             records=records))
+                    symbol._finish_load(dict(load_set_text=load_set_text, engine='raw',
+                                             categorical_dims=categorical_dims,
+                                             raw_specials=not convert_specials))
         return
 
+    def memory_report(self, deep=True):
+        """
+        Tabulates the memory used by each symbol, see :py:meth:`GdxSymbol.memory_usage`.
+
+        Parameters
+        ----------
+        deep : bool
+            As for :py:meth:`GdxSymbol.memory_usage`
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by symbol name, with columns 'data_type', 'num_records', 
+            'loaded' and 'bytes'. For symbols that are not loaded, 'bytes' is 
+            an estimate.
+        """
+        return pd.DataFrame([[symbol.data_type.name, symbol.num_records, symbol.loaded,
+                              symbol.memory_usage(deep=deep)] for symbol in self],
+                            index=pd.Index([symbol.name for symbol in self], name='symbol'),
+                            columns=['data_type', 'num_records', 'loaded', 'bytes'])
+
     def write(self,filename):
         """
         Writes this :py:class:`GdxFile` to filename
@@ -280,6 +562,21 @@ class GdxFile(MutableSequence, NeedsGamsDir):
             if not symbol.loaded:
                 raise Error("All symbols must be loaded before this file can be written.")
 
+        self.open_write(filename)
+        for i, symbol in enumerate(self,start=1):
+            self._write_symbol(symbol, i)
+        self.close_write()
+
+    def open_write(self, filename):
+        """
+        Opens filename for writing and writes the universal set, so that 
+        symbols can then be streamed into it one at a time with 
+        :py:meth:`write_symbol`. Finish with :py:meth:`close_write`.
+
+        Parameters
+        ----------
+        filename : pathlib.Path or str
+        """
         ret = gdxcc.gdxOpenWrite(self.H,str(filename),"gdxpds")
         if not ret:
             raise GdxError(self.H, f"Could not open {filename!r} for writing. "
@@ -289,15 +586,37 @@ class GdxFile(MutableSequence, NeedsGamsDir):
         # write the universal set
         self.universal_set.write()
 
-        for i, symbol in enumerate(self,start=1):
-            try:
-                symbol.write(index=i)
-            except:
-                logger.error("Unable to write {} to {}".format(symbol,filename))
-                raise
+    def write_symbol(self, symbol, unload=True):
+        """
+        Appends symbol to this file and writes it to the file opened with 
+        :py:meth:`open_write`, so that large files can be written with 
+        about one symbol in memory at a time.
 
+        Parameters
+        ----------
+        symbol : :py:class:`GdxSymbol`
+            Loaded symbol that is not yet in this file
+        unload : bool
+            If True (the default), symbol's data are dropped once written
+        """
+        self.append(symbol)
+        self._write_symbol(symbol, len(self))
+        if unload:
+            symbol.unload()
+
+    def close_write(self):
+        """
+        Finishes the file opened with :py:meth:`open_write`
+        """
         gdxcc.gdxClose(self.H)
 
+    def _write_symbol(self, symbol, index):
+        try:
+            symbol.write(index=index)
+        except:
+            logger.error("Unable to write {} to {}".format(symbol,self.filename))
+            raise
+
     def __repr__(self):
         return "GdxFile(self,gams_dir={},lazy_load={})".format(
                    repr(self.gams_dir),
@@ -357,7 +676,7 @@ class GdxFile(MutableSequence, NeedsGamsDir):
             If int, the index into the list of symbols. If str, the name of the symbol to 
             be accessed.
         """
-        del self._symbols[self._name_key(key)]
+        self._untrack(self._symbols.pop(self._name_key(key)))
         return
 
     def __len__(self):
@@ -427,12 +746,39 @@ class GdxFile(MutableSequence, NeedsGamsDir):
         self._symbols = OrderedDict([(symbol.name, symbol) for cur_key, symbol in self._symbols])
         return        
 
+    def _read_uels(self):
+        if self.filename is None:
+            raise Error("The UEL table is only available after a file has been read.")
+        ret, uel_count, _high_map = gdxcc.gdxUMUelInfo(self.H)
+        if ret != 1:
+            raise GdxError(self.H,"Could not get UEL information")
+        uel_get = gdxcc.gdxUMUelGet
+        H = self.H
+        result = np.empty(uel_count, dtype=object)
+        for i in range(uel_count):
+            ret, label, _uel_map = uel_get(H, i + 1)
+            if ret != 1:
+                raise GdxError(H,f"Could not get UEL {i + 1}")
+            result[i] = label
+        return result
+
     def _create_gdx_object(self):
-        H = gdxcc.new_gdxHandle_tp()
-        rc = gdxcc.gdxCreateD(H,self.gams_dir,gdxcc.GMS_SSSIZE)
-        if not rc:
-            raise GdxError(H,rc[1])
-        return H
+        return handle_pool.acquire(self.gams_dir)
+
+
+def _read_raw_records(filename, gams_dir, names):
+    """
+    :py:meth:`GdxFile.load_symbols` worker. Opens its own handle on filename 
+    and returns [(name, (codes, values))] for the named symbols, as read by 
+    :py:meth:`GdxSymbol._iter_raw_records`.
+    """
+    with GdxFile(gams_dir=gams_dir) as f:
+        f.read(filename)
+        result = []
+        for name in names:
+            [records] = f[name]._iter_raw_records()
+            result.append((name, records))
+    return result
 
 
 class GamsDataType(Enum):
@@ -549,14 +895,19 @@ class GdxSymbol(object):
         self._name = name
         self.description = description
         self._loaded = False
+        self._dirty = False
+        self._evicted = False
+        self._reload_options = None
+        # (values, labels, skip_value) set by set_dense, if any
+        self._dense = None
         self._data_type = GamsDataType(data_type)
         self._variable_type = None; self.variable_type = variable_type
         self._equation_type = None; self.equation_type = equation_type
+        self._file = file
+        self._index = index       
         self._dataframe = None; self._dims = None
         self.dims = dims       
         assert self._dataframe is not None
-        self._file = file
-        self._index = index       
 
         # adding this flag to implement ability to load set text instead of boolean values
         self._fixup_set_vals = True
@@ -597,6 +948,8 @@ class GdxSymbol(object):
         -------
         :py:class:`GdxSymbol`
         """
+        if self.evicted:
+            self._reload()
         if not self.loaded:
             raise Error("Symbol {} cannot be cloned because it is not yet loaded.".format(repr(self.name)))
 
@@ -606,7 +959,11 @@ class GdxSymbol(object):
                            description=self.description,
                            variable_type=self.variable_type,
                            equation_type=self.equation_type)
-        result.dataframe = copy.deepcopy(self.dataframe)
+        if self._dense is not None:
+            values, labels, skip_value = self._dense
+            result.set_dense(values.copy(), labels, skip_value=skip_value)
+        else:
+            result.set_dataframe(copy.deepcopy(self.dataframe), copy=False)
         assert result.loaded
         return result
 
@@ -744,7 +1101,7 @@ class GdxSymbol(object):
         value_col = GamsValueType(value_col_name)
         if self.data_type == GamsDataType.Set:
             assert value_col == GamsValueType.Level
-            return c_bool(True)
+            return True if self._bool_set_values else c_bool(True)
         if (self.data_type == GamsDataType.Variable) and (
                (value_col == GamsValueType.Lower) or 
                (value_col == GamsValueType.Upper)):
@@ -778,6 +1135,14 @@ class GdxSymbol(object):
         """
         return self._index
 
+    @property
+    def _bool_set_values(self):
+        return (self.file is not None) and (self.file.bool_set_values or self._arrow)
+
+    @property
+    def _arrow(self):
+        return (self.file is not None) and (self.file.dtype_backend == 'pyarrow')
+
     @property
     def loaded(self):
         """
@@ -789,6 +1154,31 @@ class GdxSymbol(object):
         """
         return self._loaded
 
+    @property
+    def evicted(self):
+        """
+        Whether this symbol was unloaded to stay within 
+        :py:attr:`GdxFile.memory_budget`, in which case accessing 
+        :py:attr:`dataframe` reloads it
+
+        Returns
+        -------
+        bool
+        """
+        return self._evicted
+
+    @property
+    def dirty(self):
+        """
+        Whether :py:attr:`dataframe` has been set since this symbol was 
+        loaded, which keeps it from being evicted
+
+        Returns
+        -------
+        bool
+        """
+        return self._dirty
+
     @property
     def full_typename(self):
         if self.data_type == GamsDataType.Parameter and self.dims == 0:
@@ -852,14 +1242,39 @@ class GdxSymbol(object):
         -------
         pd.DataFrame
         """
+        if self._evicted:
+            self._reload()
+        elif (self._file is not None) and self._file._resident:
+            self._file._touch(self)
+        if self._dense is not None:
+            self._materialize_dense()
         return self._dataframe
 
     @dataframe.setter
     def dataframe(self, data):
+        self.set_dataframe(data)
+
+    def set_dataframe(self, data, copy=True):
+        """
+        Sets :py:attr:`dataframe`, establishing dimensions and value columns 
+        from data in the same way as assigning to :py:attr:`dataframe`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame or list or other data accepted by pd.DataFrame
+            Dim columns followed by value columns, or just dim columns, in 
+            which case value columns are appended with default values
+        copy : bool
+            If True (the default), a pd.DataFrame passed in as data is copied. 
+            If False, it is adopted as-is, which avoids doubling peak memory 
+            for large frames, but means that data itself may be modified (e.g., 
+            its columns renamed and its value columns filled in or fixed up).
+        """
         try:        
+            self._dense = None
             # get data in common format and start dealing with dimensions    
             if isinstance(data, pd.DataFrame):
-                df = data.copy()
+                df = data.copy() if copy else data
                 has_col_names = True
             else:
                 df = pd.DataFrame(data)
@@ -916,6 +1331,111 @@ class GdxSymbol(object):
             logger.error("Unable to set dataframe for {} to\n{}\n\nIn process dataframe: {}".format(self,data,self._dataframe))
             raise
 
+        if self.data_type == GamsDataType.Set:
+            self._fixup_set_value()
+        self._dirty = True
+        if (self._file is not None) and (self in self._file._resident):
+            self._file._track(self)
+        return
+
+    def set_dense(self, values, coords, skip_value=0.0):
+        """
+        Sets the data of this Parameter from a dense array with one axis per 
+        dimension. The array is kept as-is, without building the long 
+        :py:attr:`dataframe`, and :py:meth:`write` writes the records 
+        straight from it. :py:attr:`dataframe` is only built if it is 
+        accessed.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Numeric array with :py:attr:`num_dims` axes. Special values are 
+            written as for :py:attr:`dataframe`.
+        coords : list of sequences
+            Labels along each axis of values, written as str
+        skip_value : None or float
+            Cells equal to skip_value are not records. Defaults to 0.0, the 
+            GAMS default for Parameters, so that only nonzeros are written. 
+            If np.nan, NaN cells are not records. If None, every cell is a 
+            record.
+        """
+        if self.data_type != GamsDataType.Parameter:
+            raise Error(f"Cannot set dense values for {self!r}, which is not a Parameter.")
+        values = np.asarray(values)
+        if values.ndim != self.num_dims:
+            raise Error(f"Cannot set {values.ndim}-dimensional values for {self!r}, "
+                f"which has {self.num_dims} dimensions.")
+        if len(coords) != self.num_dims:
+            raise Error(f"Expected labels for the {self.num_dims} dimensions of {self!r}, "
+                f"got {len(coords)}.")
+        labels = []
+        for i, dim_labels in enumerate(coords):
+            dim_labels = np.asarray([str(label) for label in dim_labels], dtype=object)
+            if len(dim_labels) != values.shape[i]:
+                raise Error(f"Axis {i} of the values for {self.name!r} has length "
+                    f"{values.shape[i]}, but {len(dim_labels)} labels.")
+            if not pd.Index(dim_labels, dtype=object).is_unique:
+                raise Error(f"The labels of dimension {i} of {self!r} repeat.")
+            labels.append(dim_labels)
+        self._init_dataframe()
+        self._dense = (values, labels, skip_value)
+        self._dirty = True
+        if (self._file is not None) and (self in self._file._resident):
+            self._file._track(self)
+
+    def _dense_keep(self):
+        """
+        Returns a bool array, shaped like the dense payload set by 
+        :py:meth:`set_dense`, that is True for the cells that are records, 
+        or None if every cell is a record.
+        """
+        values, _labels, skip_value = self._dense
+        if skip_value is None:
+            return None
+        values = values.astype(float, copy=False)
+        if np.isnan(skip_value):
+            # NaN never compares equal, not even to itself
+            return ~np.isnan(values)
+        return values != skip_value
+
+    def _dense_payload_records(self):
+        """
+        Returns the records of the dense payload set by :py:meth:`set_dense`.
+
+        Returns
+        -------
+        (tuple of numpy.ndarray, numpy.ndarray)
+            Position of each record along each axis, and its float value
+        """
+        values = self._dense[0]
+        flat = values.astype(float, copy=False).reshape(-1)
+        keep = self._dense_keep()
+        if keep is None:
+            keep = np.arange(flat.size)
+        else:
+            keep = np.flatnonzero(keep.reshape(-1))
+        positions = np.unravel_index(keep, values.shape) if self.num_dims else ()
+        return positions, flat[keep]
+
+    def _materialize_dense(self):
+        positions, values = self._dense_payload_records()
+        labels = self._dense[1]
+        self._dense = None
+        columns = [labels[i][positions[i]] for i in range(self.num_dims)]
+        columns.append(values.copy())
+        self._adopt_dataframe(pd.DataFrame(dict(enumerate(columns)), copy=False))
+        if (self._file is not None) and (self in self._file._resident):
+            self._file._track(self)
+
+    def _adopt_dataframe(self, df):
+        """
+        Trusted, copy-free alternative to :py:meth:`set_dataframe` for frames 
+        built by this package that already hold one column per dimension 
+        followed by one column per value column.
+        """
+        assert len(df.columns) == self.num_dims + len(self.value_cols)
+        df.columns = self.dims + self.value_col_names
+        self._dataframe = df
         if self.data_type == GamsDataType.Set:
             self._fixup_set_value()
         return
@@ -924,7 +1444,8 @@ class GdxSymbol(object):
         self._dataframe = pd.DataFrame([],columns=self.dims + self.value_col_names)
         if self.data_type == GamsDataType.Set:
             colname = self._dataframe.columns[-1]
-            replace_df_column(self._dataframe,colname,self._dataframe[colname].astype(c_bool))
+            set_value_type = bool if self._bool_set_values else c_bool
+            replace_df_column(self._dataframe,colname,self._dataframe[colname].astype(set_value_type))
         return
 
     def _append_default_values(self,df):
@@ -944,17 +1465,25 @@ class GdxSymbol(object):
         advantage of speaking the GDX bindings data type language, and also 
         fills in any missing values, so users no longer need to actually specify
         self.dataframe['Value'] = True.
+
+        If :py:attr:`GdxFile.bool_set_values`, the column is instead made a 
+        numpy bool column, which is left as-is if it already is one.
         """
         assert self.data_type == GamsDataType.Set
 
         colname = self._dataframe.columns[-1]
         assert colname == self.value_col_names[0], f"Unexpected final column {colname!r} in Set dataframe"
-        if self._dataframe[colname].isnull().values.any():
-            logger.warning(f"Filling null values in {self} with True. To be "
-                "filled:\n{self._dataframe[self._dataframe[colname].isnull()]}")
-            replace_df_column(self._dataframe, colname, self._dataframe[colname].fillna(value=True))
-        if self._fixup_set_vals:
-            replace_df_column(self._dataframe,colname,self._dataframe[colname].apply(lambda x: c_bool(x)))
+        with instrumentation.span('fixup_set_values', symbol=self.name, 
+                                  records=len(self._dataframe.index)):
+            if self._dataframe[colname].isnull().values.any():
+                logger.warning(f"Filling null values in {self} with True. To be "
+                    "filled:\n{self._dataframe[self._dataframe[colname].isnull()]}")
+                replace_df_column(self._dataframe, colname, self._dataframe[colname].fillna(value=True))
+            if self._fixup_set_vals and self._bool_set_values:
+                if self._dataframe[colname].dtype.kind != 'b':
+                    replace_df_column(self._dataframe,colname,self._dataframe[colname].astype(bool))
+            elif self._fixup_set_vals:
+                replace_df_column(self._dataframe,colname,self._dataframe[colname].apply(lambda x: c_bool(x)))
         self._fixup_set_vals = True
         return
 
@@ -967,8 +1496,13 @@ class GdxSymbol(object):
         -------
         int
         """
+        if self._dense is not None:
+            keep = self._dense_keep()
+            if keep is None:
+                return int(self._dense[0].size)
+            return int(np.count_nonzero(keep))
         if self.loaded:
-            return len(self.dataframe.index)
+            return len(self._dataframe.index)
         return self._num_records
 
     def __repr__(self):
@@ -991,7 +1525,8 @@ class GdxSymbol(object):
         s += ", loaded" if self.loaded else ", not loaded"
         return s
 
-    def load(self, load_set_text=False):
+    def load(self, load_set_text=False, engine=None, categorical_dims=None, 
+             raw_specials=None, filters=None, max_bytes=None):
         """
         Loads this :py:class:`GdxSymbol` from its :py:attr:`file`, thereby popluating
         :py:attr:`dataframe`.
@@ -1001,20 +1536,447 @@ class GdxSymbol(object):
         load_set_text : bool
             If True (default is False) and this symbol is a :class:`GamsDataType.Set <GamsDataType>`,
             loads the GDX Text field into the :py:attr:`dataframe` rather than a `c_bool`.
+        engine : None or str
+            One of :py:data:`READ_ENGINES`. If None, :py:attr:`GdxFile.read_engine` 
+            is used. Both engines produce the same :py:attr:`dataframe`.
+        categorical_dims : None or bool
+            If True, dimension columns are returned as pd.Categorical with the 
+            file's UELs as categories. If None, :py:attr:`GdxFile.categorical_dims` 
+            is used. Categorical dimensions are always read with the 'raw' engine.
+        raw_specials : None or bool
+            If True, GDX special values are kept as-is rather than converted to 
+            their numpy equivalents. If None, :py:attr:`GdxFile.raw_specials` 
+            is used.
+        filters : None or dict
+            If not None, only the records whose labels are listed in filters 
+            are loaded, e.g., {'r': ['p1', 'p2'], 't': [2030]}. Keys are 
+            dimension names or positions, and an Error is raised if a key does 
+            not designate exactly one dimension. Values are labels or lists of 
+            labels. Every label, whatever its type, is converted with str() and 
+            matched exactly against the file's labels, so 2030 selects '2030', 
+            but 2030.0 looks for '2030.0'. Labels that are not in the file 
+            match no records (they are logged at INFO level). An empty dict, 
+            like any filters of a scalar, selects all records. The filters are 
+            applied by gdxcc while reading, so non-matching records are never 
+            converted. After a filtered load, :py:attr:`dataframe` holds only 
+            the selected records. Filtered loads are always read with the 
+            'raw' engine.
+        max_bytes : None or int
+            If not None, an Error is raised without reading any records if 
+            :py:meth:`memory_usage` estimates that the loaded 
+            :py:attr:`dataframe` would use more than max_bytes. With filters, 
+            the estimate is for all records, and so is an upper bound.
         """
         if self.loaded:
+            if filters is not None:
+                raise Error(f"Cannot apply filters to {self!r} because it is already "
+                    "loaded. Call unload first.")
             logger.info("Nothing to do. Symbol already loaded.")
             return
         if not self.file:
             raise Error("Cannot load {} because there is no file pointer".format(repr(self)))
         if not self.index:
             raise Error("Cannot load {} because there is no symbol index".format(repr(self)))
+        engine, categorical_dims, convert_specials = self._load_options(
+            engine, categorical_dims, raw_specials)
+        if max_bytes is not None:
+            estimate = self.memory_usage()
+            if estimate > max_bytes:
+                raise Error(f"Not loading {self.name!r}, because its {self.num_records} "
+                    f"records are estimated to need {estimate} bytes, more than "
+                    f"max_bytes = {max_bytes}.")
+        with instrumentation.span('load', symbol=self.name, engine=engine) as load_span:
+            if filters is not None:
+                self._set_loaded_data(self._load_raw(load_set_text=load_set_text,
+                                                     categorical_dims=categorical_dims,
+                                                     convert_specials=convert_specials,
+                                                     filters=self._filter_codes(filters)))
+            elif engine == 'str' and self.data_type == GamsDataType.Parameter and HAVE_GDX2PY:
+                self.dataframe = gdx2py.par2list(self.file.filename,self.name) 
+            elif engine == 'raw':
+                # special values are converted in the raw value buffer
+                self._set_loaded_data(self._load_raw(load_set_text=load_set_text,
+                                                     categorical_dims=categorical_dims,
+                                                     convert_specials=convert_specials))
+            else:
+                self._set_loaded_data(self._load_str(load_set_text=load_set_text))
+                if convert_specials:
+                    with instrumentation.span('convert_specials', symbol=self.name):
+                        special.convert_gdx_to_np_svs(self._dataframe, self.num_dims, inplace=True)
+            self._finish_load(dict(load_set_text=load_set_text, engine=engine,
+                                   categorical_dims=categorical_dims,
+                                   raw_specials=not convert_specials, filters=filters))
+            if instrumentation.enabled():
+                load_span.set(records=self.num_records, bytes=self.memory_usage(deep=False))
+        return
 
-        if self.data_type == GamsDataType.Parameter and HAVE_GDX2PY:
-            self.dataframe = gdx2py.par2list(self.file.filename,self.name) 
-            self._loaded = True
-            return
+    def _finish_load(self, options):
+        """
+        Marks this symbol as freshly loaded with the :py:meth:`load` keyword 
+        arguments options, which are reused if it is evicted and reloaded.
+        """
+        self._loaded = True
+        self._dirty = False
+        self._evicted = False
+        self._reload_options = options
+        if self._file is not None:
+            self._file._track(self)
+
+    def _evict(self):
+        self.unload()
+        self._evicted = True
+
+    def _reload(self):
+        if self.file.H is None:
+            raise Error(f"Cannot reload evicted symbol {self.name!r} because its "
+                "file has been closed.")
+        logger.debug(f"Reloading evicted symbol {self.name!r}.")
+        self.load(**self._reload_options)
+
+    def iter_chunks(self, chunksize=1000000, load_set_text=False, engine=None, 
+                    categorical_dims=None, raw_specials=None):
+        """
+        Iterates over this :py:class:`GdxSymbol`'s records in batches read 
+        directly from its :py:attr:`file`, without loading :py:attr:`dataframe`. 
+        Memory use is thus bounded by chunksize rather than by the size of the 
+        symbol.
+
+        The batches are consistently typed, have the same columns as 
+        :py:attr:`dataframe` would, and special values are already converted. 
+        Their indexes continue from one batch to the next. 
+        Other symbols should not be read from the same :py:class:`GdxFile` 
+        until the iteration is finished.
 
+        Parameters
+        ----------
+        chunksize : int
+            Maximum number of records per batch
+        load_set_text : bool
+            As for :py:meth:`load`
+        engine : None or str
+            As for :py:meth:`load`
+        categorical_dims : None or bool
+            As for :py:meth:`load`
+        raw_specials : None or bool
+            As for :py:meth:`load`
+
+        Yields
+        ------
+        pd.DataFrame
+        """
+        if not self.file:
+            raise Error("Cannot read {} because there is no file pointer".format(repr(self)))
+        if not self.index:
+            raise Error("Cannot read {} because there is no symbol index".format(repr(self)))
+        if chunksize < 1:
+            raise Error(f"chunksize must be a positive integer. Was passed {chunksize!r}.")
+        engine, categorical_dims, convert_specials = self._load_options(
+            engine, categorical_dims, raw_specials)
+        set_text = load_set_text and (self.data_type == GamsDataType.Set)
+
+        if engine == 'raw':
+            blocks = ((self._dim_columns(codes, categorical=categorical_dims), values) 
+                      for codes, values in self._iter_raw_records(chunksize=chunksize))
+        else:
+            blocks = self._iter_str_records(chunksize=chunksize)
+        start = 0
+        for dim_columns, values in blocks:
+            if len(values) == 0:
+                continue
+            columns = self._block_columns(dim_columns, values, 
+                                          load_set_text=set_text,
+                                          convert_specials=convert_specials)
+            # like pd.read_csv chunks, the index continues from batch to batch
+            df = pd.DataFrame(dict(enumerate(columns)), 
+                              index=pd.RangeIndex(start, start + len(values)),
+                              copy=False)
+            start += len(values)
+            if (self.data_type == GamsDataType.Set) and not (set_text or self._bool_set_values):
+                # same representation as _fixup_set_value gives loaded symbols
+                i = len(columns) - 1
+                df[i] = df[i].apply(lambda x: c_bool(x))
+            df.columns = self.dims + self.value_col_names
+            yield df
+
+    def to_numpy_dense(self, value_col=None, coords=None, fill_value=None, 
+                       raw_specials=None, max_bytes=None):
+        """
+        Returns this symbol's values as a dense array with one axis per 
+        dimension, labeled as given by :py:meth:`dense_coords`. The array is 
+        prefilled with fill_value and the records are placed in a single 
+        vectorized scatter, rather than by pivoting :py:attr:`dataframe`.
+
+        If this symbol is :py:attr:`loaded`, its :py:attr:`dataframe` is used. 
+        Otherwise the raw UEL codes and values are read from :py:attr:`file`, 
+        and the symbol stays unloaded.
+
+        Parameters
+        ----------
+        value_col : None or str
+            One of :py:attr:`value_col_names`. Defaults to 'Value' for 
+            Parameters and 'Level' for Variables and Equations. Sets and 
+            Aliases give a bool array of membership and ignore value_col.
+        coords : None or list or dict
+            As for :py:meth:`dense_coords`. Records whose labels are not in 
+            the coordinates are left out.
+        fill_value : None or scalar
+            Value of the cells that have no record. Defaults to 
+            :py:meth:`get_value_col_default` for value_col, and to False 
+            for Sets.
+        raw_specials : None or bool
+            As for :py:meth:`load`. Only applies when reading from the file.
+        max_bytes : None or int
+            If not None, an Error is raised before the array is allocated if 
+            it would use more than max_bytes.
+
+        Returns
+        -------
+        numpy.ndarray
+            float, or bool for Sets, with shape 
+            tuple(len(labels) for labels in self.dense_coords(coords))
+        """
+        return self._to_dense(value_col=value_col, coords=coords, fill_value=fill_value,
+                              raw_specials=raw_specials, max_bytes=max_bytes)[0]
+
+    def to_xarray(self, value_col=None, coords=None, fill_value=None, 
+                  raw_specials=None, max_bytes=None):
+        """
+        Returns :py:meth:`to_numpy_dense` as an xarray.DataArray named after 
+        this symbol, with :py:meth:`dense_coords` as coordinates. Repeated 
+        dimension names (e.g., '*') are made unique by appending their 
+        position. Requires xarray.
+
+        Parameters
+        ----------
+        value_col, coords, fill_value, raw_specials, max_bytes
+            As for :py:meth:`to_numpy_dense`
+
+        Returns
+        -------
+        xarray.DataArray
+        """
+        xr = _import_xarray()
+        values, labels = self._to_dense(value_col=value_col, coords=coords, 
+                                        fill_value=fill_value, raw_specials=raw_specials, 
+                                        max_bytes=max_bytes)
+        dims = [dim if self.dims.count(dim) == 1 else f'{dim}_{i}' 
+                for i, dim in enumerate(self.dims)]
+        attrs = {'description': self.description, 'data_type': self.data_type.name, 
+                 'domain': list(self.dims)}
+        if self.data_type not in (GamsDataType.Set, GamsDataType.Alias):
+            attrs['value_col'] = self._dense_value_col(value_col)
+        return xr.DataArray(values, coords=dict(zip(dims, labels)), dims=dims, 
+                            name=self.name, attrs=attrs)
+
+    def dense_coords(self, coords=None):
+        """
+        Labels along each axis of :py:meth:`to_numpy_dense` and 
+        :py:meth:`to_xarray`.
+
+        Parameters
+        ----------
+        coords : None or list or dict
+            Labels to use for some or all dimensions, as a list with one entry 
+            per dimension, or as a dict keyed by dimension name or position. 
+            Labels are compared as str. Dimensions that are not given (or are 
+            given as None) take the labels of the one-dimensional Set of 
+            :py:attr:`file` that they are named after, in record order, if 
+            there is one. Otherwise, they take the labels used by this 
+            symbol's records, in GDX (UEL) order for symbols read from a file, 
+            and in order of first appearance for symbols created in memory.
+
+        Returns
+        -------
+        list of numpy.ndarray of str
+        """
+        return self._dense_coords(coords, self._dense_records()[0])
+
+    def _to_dense(self, value_col=None, coords=None, fill_value=None, raw_specials=None, 
+                  max_bytes=None):
+        """
+        Returns
+        -------
+        (numpy.ndarray, list of numpy.ndarray of str)
+            :py:meth:`to_numpy_dense` and :py:meth:`dense_coords`
+        """
+        is_set = self.data_type in (GamsDataType.Set, GamsDataType.Alias)
+        if is_set:
+            dtype = bool
+            if fill_value is None:
+                fill_value = False
+        else:
+            value_col = self._dense_value_col(value_col)
+            dtype = float
+            if fill_value is None:
+                fill_value = self.get_value_col_default(value_col)
+        keys, values = self._dense_records(value_col=value_col, raw_specials=raw_specials)
+        labels = self._dense_coords(coords, keys)
+        shape = tuple(len(dim_labels) for dim_labels in labels)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        if (max_bytes is not None) and (nbytes > max_bytes):
+            raise Error(f"Not building the dense array of {self.name!r}, because its "
+                f"shape {shape} needs {nbytes} bytes, more than max_bytes = {max_bytes}.")
+
+        # position of each record along each axis, -1 if not in the coordinates, 
+        # looked up through the (small) label tables rather than record by record
+        codes, tables = keys
+        positions = np.empty(codes.shape, dtype=np.intp)
+        for i, dim_labels in enumerate(labels):
+            lookup = pd.Index(dim_labels, dtype=object).get_indexer(tables[i])
+            positions[:, i] = lookup[codes[:, i]]
+        keep = (positions >= 0).all(axis=1)
+        if not keep.all():
+            logger.info(f"Leaving {int((~keep).sum())} records of {self.name!r} out of "
+                "its dense array, because their labels are not in its coordinates.")
+            positions = positions[keep]
+            values = values[keep]
+
+        result = np.full(shape, fill_value, dtype=dtype)
+        if is_set:
+            values = True
+        if self.num_dims == 0:
+            if len(positions):
+                result[()] = values if is_set else values[-1]
+        else:
+            result[tuple(positions.T)] = values
+        return result, labels
+
+    def _dense_value_col(self, value_col):
+        if value_col is None:
+            value_col = self.value_col_names[0]
+        if value_col not in self.value_col_names:
+            raise Error(f"{value_col} is not one of the value columns for "
+                f"this GdxSymbol, which is a {self.data_type}")
+        return value_col
+
+    def _dense_records(self, value_col=None, raw_specials=None):
+        """
+        Returns the keys and values of this symbol's records, for building 
+        dense arrays.
+
+        Returns
+        -------
+        ((numpy.ndarray, list of numpy.ndarray), numpy.ndarray)
+            Keys as integer codes with shape (n, num_dims) into one table of 
+            str labels per dimension: the file's :py:attr:`GdxFile.uels` if 
+            read from the file, or the factorized labels of :py:attr:`dataframe`. 
+            Values are those of value_col as float (arbitrary if value_col is 
+            None).
+        """
+        if self._dense is not None:
+            positions, values = self._dense_payload_records()
+            codes = np.stack(positions, axis=1) if self.num_dims else np.empty((len(values), 0), dtype=np.intp)
+            return (codes, self._dense[1]), values
+        if self.loaded:
+            df = self._dataframe
+            codes = np.empty((len(df.index), self.num_dims), dtype=np.intp)
+            tables = []
+            for i in range(self.num_dims):
+                codes[:, i], uniques = pd.factorize(df.iloc[:, i])
+                tables.append(np.asarray([str(label) for label in uniques], dtype=object))
+            if value_col is None:
+                return (codes, tables), np.empty(len(df.index))
+            values = df.iloc[:, self.num_dims + self.value_col_names.index(value_col)]
+            return (codes, tables), values.to_numpy(dtype=float, na_value=np.nan)
+        if (not self.file) or (not self.index):
+            raise Error(f"Cannot read {self!r} because there is no file pointer or symbol index")
+        if self.file.H is None:
+            raise Error(f"Cannot read {self.name!r} because its file has been closed.")
+        [(codes, values)] = self._iter_raw_records()
+        keys = (codes - 1, [np.asarray(self.file.uels, dtype=object)] * self.num_dims)
+        if value_col is None:
+            return keys, np.empty(len(values))
+        values = np.ascontiguousarray(values[:, GamsValueType(value_col).value])
+        _raw_specials = self.file.raw_specials if raw_specials is None else raw_specials
+        return keys, special.gdx_to_np_values(values, raw_specials=_raw_specials)
+
+    def _dense_coords(self, coords, keys):
+        """
+        Resolves :py:meth:`dense_coords` given the record keys returned by 
+        :py:meth:`_dense_records`.
+        """
+        result = [None] * self.num_dims
+        if isinstance(coords, dict):
+            for key, labels in coords.items():
+                result[self._dim_position(key, 'set coordinates for')] = labels
+        elif coords is not None:
+            if len(coords) != self.num_dims:
+                raise Error(f"Expected coordinates for the {self.num_dims} dimensions "
+                    f"of {self!r}, got {len(coords)}.")
+            result = list(coords)
+        codes, tables = keys
+        for i, labels in enumerate(result):
+            if labels is None:
+                labels = self._domain_labels(self.dims[i])
+            if labels is None:
+                # labels used, in table order
+                used = np.zeros(len(tables[i]), dtype=bool)
+                used[codes[:, i]] = True
+                labels = pd.unique(tables[i][used])
+                if self.loaded and self.index and (self.file.H is not None):
+                    # same GDX order as when read from the file
+                    order = pd.Index(self.file.uels, dtype=object).get_indexer(labels)
+                    if (order >= 0).all():
+                        labels = labels[np.argsort(order)]
+            labels = np.asarray([str(label) for label in labels], dtype=object)
+            if not pd.Index(labels, dtype=object).is_unique:
+                raise Error(f"The coordinates of dimension {i} of {self!r} repeat labels.")
+            result[i] = labels
+        return result
+
+    def _domain_labels(self, dim):
+        """
+        Returns the labels of the one-dimensional Set of :py:attr:`file` named 
+        dim, or None if there is no such set or it has no records.
+        """
+        if (dim == '*') or (dim == self.name) or (self.file is None) or (dim not in self.file):
+            return None
+        domain = self.file[dim]
+        if (domain.data_type not in (GamsDataType.Set, GamsDataType.Alias)) or (domain.num_dims != 1):
+            return None
+        if domain.loaded:
+            labels = domain._dataframe.iloc[:, 0].astype(str).to_numpy(dtype=object)
+        elif domain.index and (self.file.H is not None):
+            [(codes, _values)] = domain._iter_raw_records()
+            labels = self.file.uels[codes[:, 0] - 1]
+        else:
+            return None
+        # no records, e.g., for an Alias, whose records are those of its set
+        return labels if len(labels) else None
+
+    def _load_options(self, engine, categorical_dims, raw_specials):
+        """
+        Resolves :py:meth:`load` options against the :py:attr:`file` defaults.
+
+        Returns
+        -------
+        (str, bool, bool)
+            engine, categorical_dims, and whether special values are to be 
+            converted to their numpy equivalents
+        """
+        if engine is None:
+            engine = self.file.read_engine
+        if engine not in READ_ENGINES:
+            raise Error(f"Unknown engine {engine!r}. Expected one of {READ_ENGINES}.")
+        if categorical_dims is None:
+            categorical_dims = self.file.categorical_dims
+        if categorical_dims or self._arrow:
+            engine = 'raw'
+        if raw_specials is None:
+            raw_specials = self.file.raw_specials
+        convert_specials = not (raw_specials or 
+            (self.data_type in (GamsDataType.Set, GamsDataType.Alias)))
+        return engine, categorical_dims, convert_specials
+
+    def _set_loaded_data(self, data):
+        if isinstance(data, pd.DataFrame):
+            self._adopt_dataframe(data)
+        else:
+            # let the dataframe setter establish the empty frame
+            assert len(data) == 0
+            self.dataframe = data
+
+    def _load_str(self, load_set_text=False):
         _ret, records = gdxcc.gdxDataReadStrStart(self.file.H,self.index)
 
         def reader():
@@ -1023,25 +1985,363 @@ class GdxSymbol(object):
                 yield gdxcc.gdxDataReadStr(handle)
 
         vc = self.value_cols  # do this for speed in the next line
-        if load_set_text and (self.data_type == GamsDataType.Set):
-            data = [elements + [gdxcc.gdxGetElemText(self.file.H,int(values[col_ind]))[1] 
-                                for _col_name, col_ind in vc] 
-                    for _ret, elements, values, _afdim in reader()]
-            self._fixup_set_vals = False
+        with instrumentation.span('read_records', symbol=self.name, records=records):
+            if load_set_text and (self.data_type == GamsDataType.Set):
+                data = [elements + [gdxcc.gdxGetElemText(self.file.H,int(values[col_ind]))[1] 
+                                    for _col_name, col_ind in vc] 
+                        for _ret, elements, values, _afdim in reader()]
+                self._fixup_set_vals = False
+            elif (self.data_type == GamsDataType.Set) and self._bool_set_values:
+                data = [elements + [True] for _ret, elements, _values, _afdim in reader()]
+            else:
+                data = [elements + [values[col_ind] for col_name, col_ind in vc] for ret, elements, values, afdim in reader()]
+        # leave the read context so that the file can be written afterwards
+        gdxcc.gdxDataReadDone(self.file.H)
+        if not data:
+            return data
+        with instrumentation.span('build_dataframe', symbol=self.name, records=len(data)):
+            return pd.DataFrame(data)
+
+    def _load_raw(self, load_set_text=False, categorical_dims=False, convert_specials=False,
+                  filters=None, records=None):
+        if records is None:
+            [(codes, values)] = self._iter_raw_records(filters=filters)
         else:
-            data = [elements + [values[col_ind] for col_name, col_ind in vc] for ret, elements, values, afdim in reader()]
-        self.dataframe = data
-        if not self.data_type in (GamsDataType.Set, GamsDataType.Alias):
-            self.dataframe = special.convert_gdx_to_np_svs(self.dataframe, self.num_dims)
-        self._loaded = True
-        return
+            # already read, e.g., by a GdxFile.load_symbols worker
+            codes, values = records
+        if len(codes) == 0 and not categorical_dims:
+            return []
+        set_text = load_set_text and (self.data_type == GamsDataType.Set)
+        with instrumentation.span('build_dataframe', symbol=self.name, records=len(codes)):
+            columns = self._block_columns(self._dim_columns(codes, categorical=categorical_dims), 
+                                          values, 
+                                          load_set_text=set_text, 
+                                          convert_specials=convert_specials)
+            if set_text:
+                self._fixup_set_vals = False
+            return pd.DataFrame(dict(enumerate(columns)), copy=False)
+
+    def _block_columns(self, dim_columns, values, load_set_text=False, convert_specials=False):
+        """
+        Returns dim_columns followed by this symbol's value columns, taken 
+        from a raw (n, gdxcc.GMS_VAL_MAX) value block.
+        """
+        columns = list(dim_columns)
+        columns.extend(self._value_columns(values, convert_specials=convert_specials))
+        if load_set_text:
+            columns[-1] = self._elem_text(columns[-1])
+        elif (self.data_type == GamsDataType.Set) and self._bool_set_values:
+            columns[-1] = np.ones(len(values), dtype=bool)
+        if self._arrow:
+            import pyarrow as pa
+            # numeric buffers are wrapped rather than copied
+            columns[self.num_dims:] = [pd.arrays.ArrowExtensionArray(
+                pa.array(column, type=pa.string() if load_set_text else None)) 
+                for column in columns[self.num_dims:]]
+        return columns
+
+    def _value_columns(self, values, convert_specials=False):
+        """
+        Selects this symbol's value columns out of a raw (n, gdxcc.GMS_VAL_MAX)
+        value block, converting special values in place if requested.
+        """
+        values = np.asfortranarray(values[:, [col_ind for _col_name, col_ind in self.value_cols]])
+        if convert_specials:
+            with instrumentation.span('convert_specials', symbol=self.name, records=len(values)):
+                special.gdx_to_np_values(values)
+        return [values[:, i] for i in range(values.shape[1])]
+
+    def _iter_raw_records(self, chunksize=None, filters=None):
+        """
+        Reads this symbol's records with gdxDataReadRaw, or, if filters are 
+        given, with a gdxDataReadMap filtered read.
+
+        Parameters
+        ----------
+        chunksize : None or int
+            Maximum number of records per yielded block. If None, all records 
+            are returned in a single block.
+        filters : None or list
+            As returned by :py:meth:`_filter_codes`
+
+        Yields
+        ------
+        (numpy.ndarray, numpy.ndarray)
+            Raw UEL codes with shape (n, num_dims) and values with shape 
+            (n, gdxcc.GMS_VAL_MAX), still in GDX special value encoding. At 
+            least one (possibly empty) block is yielded.
+        """
+        H = self.file.H
+        num_dims = self.num_dims
+        width = num_dims + gdxcc.GMS_VAL_MAX
+        if (filters is not None) and all(codes is None for codes in filters):
+            # e.g., filters={}, or any filters of a scalar: nothing is filtered
+            filters = None
+        if (filters is not None) and any((codes is not None) and (len(codes) == 0) for codes in filters):
+            # no label of some filter is in the file, so nothing can match
+            yield (np.empty((0, num_dims), dtype=np.int64), 
+                   np.empty((0, gdxcc.GMS_VAL_MAX), dtype=float))
+            return
+        try:
+            if filters is None:
+                ret, records = gdxcc.gdxDataReadRawStart(H,self.index)
+                read_raw = gdxcc.gdxDataReadRaw
+            else:
+                # records is only an upper bound, the read stops at the last match
+                ret, records = self._start_filtered_read(filters)
+                read_raw = _read_map
+            if ret != 1:
+                raise GdxError(H,f"Could not start reading data for symbol {self.name!r}")
+            remaining = records
+            while True:
+                n = remaining if chunksize is None else min(chunksize, remaining)
+                with instrumentation.span('read_records', symbol=self.name) as read_span:
+                    # gdxcc reads one record per call, so the records are 
+                    # streamed into a single float block without building 
+                    # per-record arrays. UEL codes are exact in float64.
+                    reads = map(read_raw, repeat(H, n))
+                    if filters is None:
+                        flat = np.fromiter(chain.from_iterable(rec[1] + rec[2] for rec in reads), 
+                                           dtype=float, count=n * width)
+                    else:
+                        # the filtered read is past the last match once ret is 0
+                        reads = takewhile(lambda rec: rec[0], reads)
+                        flat = np.fromiter(chain.from_iterable(rec[1] + rec[2] for rec in reads), 
+                                           dtype=float)
+                    block = flat.reshape(-1, width)
+                    if len(block) < n:
+                        remaining = n = len(block)
+                    read_span.set(records=n)
+                remaining -= n
+                with instrumentation.span('build_arrays', symbol=self.name, records=n):
+                    block = (block[:, :num_dims].astype(np.int64), block[:, num_dims:])
+                yield block
+                if remaining <= 0:
+                    break
+        finally:
+            gdxcc.gdxDataReadDone(H)
+
+    def _filter_codes(self, filters):
+        """
+        Resolves :py:meth:`load` filters into the raw UEL codes to keep.
+
+        Returns
+        -------
+        list of None or numpy.ndarray
+            One entry per dimension: None if the dimension is not filtered, 
+            otherwise the sorted codes of the filter labels that are in the file
+        """
+        result = [None] * self.num_dims
+        for key, labels in filters.items():
+            pos = self._dim_position(key, 'filter on')
+            if result[pos] is not None:
+                raise Error(f"Dimension {pos} of {self!r} is filtered more than once.")
+            if isinstance(labels, str) or not isinstance(labels, Iterable):
+                labels = [labels]
+            # one rule for all label types: compare str(label)
+            codes = []; missing = []
+            for label in (str(label) for label in labels):
+                ret, uel_nr, _map = gdxcc.gdxUMFindUEL(self.file.H, label)
+                if ret and (uel_nr > 0):
+                    codes.append(uel_nr)
+                else:
+                    missing.append(label)
+            if missing:
+                logger.info(f"Filter labels {missing} for dimension {pos} of {self.name!r} "
+                            "are not in the file and match no records.")
+            result[pos] = np.unique(np.array(codes, dtype=np.int64))
+        return result
+
+    def _dim_position(self, key, action):
+        """
+        Returns the position of the dimension designated by key, a dimension 
+        name or position, or raises an Error saying that key cannot be used to 
+        action (e.g., 'filter on').
+        """
+        if isinstance(key, int):
+            if not (0 <= key < self.num_dims):
+                raise Error(f"Cannot {action} dimension {key} of {self!r}, "
+                    f"which has {self.num_dims} dimensions.")
+            return key
+        positions = [i for i, dim in enumerate(self.dims) if dim == key]
+        if len(positions) != 1:
+            raise Error(f"Cannot {action} dimension {key!r} of {self!r}. "
+                "Dimension names must be unique to be used as keys; "
+                "otherwise pass the dimension position.")
+        return positions[0]
+
+    def _start_filtered_read(self, filters):
+        """
+        Starts a gdxDataReadFilteredStart read of this symbol. Filter labels 
+        are mapped to their own raw UEL numbers, so that every key returned 
+        by gdxDataReadMap is a raw code.
+        """
+        H = self.file.H
+        if not gdxcc.gdxUELRegisterMapStart(H):
+            raise GdxError(H, "Could not start registering UEL map")
+        try:
+            for code in np.unique(np.concatenate([codes for codes in filters if codes is not None])):
+                if not gdxcc.gdxUELRegisterMap(H, int(code), self.file.uels[code - 1]):
+                    raise GdxError(H, f"Could not register UEL {self.file.uels[code - 1]!r}")
+        except:
+            # leave the Regis-Map context, which gdxDataReadDone cannot end
+            gdxcc.gdxUELRegisterDone(H)
+            raise
+        if not gdxcc.gdxUELRegisterDone(H):
+            raise GdxError(H, "Could not register UEL map")
+        action = gdxcc.intArray(gdxcc.GMS_MAX_INDEX_DIM)
+        for i, codes in enumerate(filters):
+            if codes is None:
+                action[i] = DOMC_UNMAPPED
+                continue
+            filter_nr = i + 1
+            gdxcc.gdxFilterRegisterStart(H, filter_nr)
+            for code in codes:
+                gdxcc.gdxFilterRegister(H, int(code))
+            if not gdxcc.gdxFilterRegisterDone(H):
+                raise GdxError(H, f"Could not register filter for dimension {i}")
+            action[i] = filter_nr
+        ret, records = gdxcc.gdxDataReadFilteredStart(H, self.index, action)
+        if ret != 1:
+            raise GdxError(H, f"Could not start filtered read of symbol {self.name!r}")
+        return ret, records
+
+    def _iter_str_records(self, chunksize):
+        """
+        Reads this symbol's records with gdxDataReadStr, in blocks of at most 
+        chunksize records.
+
+        Yields
+        ------
+        (list of numpy.ndarray, numpy.ndarray)
+            Dimension columns (object arrays of str) and values with shape 
+            (n, gdxcc.GMS_VAL_MAX), still in GDX special value encoding
+        """
+        H = self.file.H
+        ret, records = gdxcc.gdxDataReadStrStart(H,self.index)
+        if ret != 1:
+            raise GdxError(H,f"Could not start reading data for symbol {self.name!r}")
+        num_dims = self.num_dims
+        read_str = gdxcc.gdxDataReadStr
+        try:
+            remaining = records
+            while remaining > 0:
+                n = min(chunksize, remaining)
+                keys = []; vals = []
+                keys_extend = keys.extend; vals_extend = vals.extend
+                with instrumentation.span('read_records', symbol=self.name, records=n):
+                    for _i in range(n):
+                        _ret, elements, values, _afdim = read_str(H)
+                        keys_extend(elements)
+                        vals_extend(values)
+                remaining -= n
+                with instrumentation.span('build_arrays', symbol=self.name, records=n):
+                    labels = np.empty(n * num_dims, dtype=object)
+                    labels[:] = keys
+                    labels = labels.reshape(n, num_dims)
+                    block = ([labels[:, i] for i in range(num_dims)],
+                             np.array(vals, dtype=float).reshape(n, gdxcc.GMS_VAL_MAX))
+                yield block
+        finally:
+            gdxcc.gdxDataReadDone(H)
+
+    def _dim_columns(self, codes, categorical=False):
+        """
+        Converts raw UEL codes into a list of dimension columns, either object 
+        arrays of str or pd.Categorical columns sharing :py:attr:`GdxFile.uel_dtype`, 
+        or, with dtype_backend 'pyarrow', Arrow dictionary arrays sharing 
+        :py:attr:`GdxFile.arrow_uels`.
+        """
+        if self._arrow:
+            import pyarrow as pa
+            uels = self.file.arrow_uels
+            return [pd.arrays.ArrowExtensionArray(pa.DictionaryArray.from_arrays(
+                        (codes[:, i] - 1).astype(np.int32), uels)) 
+                    for i in range(self.num_dims)]
+        if categorical:
+            dtype = self.file.uel_dtype
+            return [pd.Categorical.from_codes(codes[:, i] - 1, dtype=dtype) 
+                    for i in range(self.num_dims)]
+        uels = self.file.uels
+        return [np.take(uels, codes[:, i] - 1) for i in range(self.num_dims)]
+
+    def _elem_text(self, text_indices):
+        """
+        Looks up the GDX Text field for an array of set values, calling 
+        gdxGetElemText only once per distinct text.
+        """
+        indices, inverse = np.unique(text_indices.astype(int), return_inverse=True)
+        texts = np.empty(len(indices), dtype=object)
+        for i, text_index in enumerate(indices):
+            texts[i] = gdxcc.gdxGetElemText(self.file.H,int(text_index))[1]
+        return texts[inverse]
 
     def unload(self):
         """
         Drops this :py:class:`GdxSymbol`'s :py:attr:`dataframe`
         """
+        if self._file is not None:
+            self._file._untrack(self)
         self.dataframe = None
         self._loaded = False
+        self._dirty = False
+        self._evicted = False
+
+    def memory_usage(self, deep=True):
+        """
+        Bytes used by :py:attr:`dataframe` if :py:attr:`loaded`, otherwise an 
+        estimate of the bytes it will use once loaded with the :py:attr:`file` 
+        defaults, based on :py:attr:`num_records`, :py:attr:`num_dims`, 
+        :py:attr:`value_cols`, and the sizes of the file's labels.
+
+        Parameters
+        ----------
+        deep : bool
+            As for pd.DataFrame.memory_usage. If True (the default), the 
+            memory of str labels and other objects is included.
+
+        Returns
+        -------
+        int
+        """
+        if self._dense is not None:
+            values, labels, _skip_value = self._dense
+            return int(values.nbytes + sum(pd.Series(dim_labels, dtype=object).memory_usage(
+                deep=deep, index=False) for dim_labels in labels))
+        if self.loaded:
+            return int(self._dataframe.memory_usage(deep=deep, index=True).sum())
+        return self._estimate_memory_usage(deep=deep)
+
+    def _estimate_memory_usage(self, deep=True):
+        n = self.num_records
+        # a RangeIndex has a small, fixed size
+        result = 132
+        if self.num_dims > 0:
+            uels = self.file.uels
+            if self._arrow:
+                # int32 indices into the shared dictionary, counted once per column
+                result += self.num_dims * (n * 4 + self.file.arrow_uels.nbytes) if n else 0
+            elif self.file.categorical_dims:
+                dtype = self.file.uel_dtype
+                code_size = pd.Categorical.from_codes([], dtype=dtype).codes.itemsize
+                # pandas counts the shared categories once per column
+                result += self.num_dims * (n * code_size + dtype.categories.memory_usage(deep=deep))
+            elif len(uels):
+                # measured on a sample, so as to use the str dtype pandas infers 
+                # (python objects, or Arrow strings if pyarrow is installed)
+                sample = pd.Series(uels[::max(len(uels) // 1000, 1)])
+                label_size = sample.memory_usage(deep=deep, index=False) / len(sample)
+                result += self.num_dims * n * label_size
+        if self.data_type == GamsDataType.Set:
+            if self._arrow:
+                result += (n + 7) // 8
+            elif self._bool_set_values:
+                result += n
+            else:
+                result += n * (8 + (sys.getsizeof(c_bool(True)) if deep else 0))
+        else:
+            result += n * len(self.value_cols) * 8
+        return int(result)
 
     def write(self,index=None): 
         """
@@ -1052,6 +2352,12 @@ class GdxSymbol(object):
         if self.file is None:
             raise Error(f"Cannot write {self!r} because there is no file pointer")
 
+        with instrumentation.span('write', symbol=self.name) as write_span:
+            self._write(index=index)
+            write_span.set(records=self.num_records)
+        return
+
+    def _write(self, index=None):
         if self.data_type == GamsDataType.Set:
             self._fixup_set_value()
 
@@ -1071,12 +2377,19 @@ class GdxSymbol(object):
             userinfo = self.variable_type.value
         elif self.equation_type is not None:
             userinfo = self.equation_type.value
-        if not gdxcc.gdxDataWriteStrStart(self.file.H,
-                                          self.name,
-                                          self.description,
-                                          self.num_dims,
-                                          self.data_type.value,
-                                          userinfo):
+        if self._dense is not None:
+            # dense payloads are written with raw UEL codes, which have to be 
+            # registered before the data write starts
+            axis_codes = self._register_dense_uels()
+            write_start = gdxcc.gdxDataWriteRawStart
+        else:
+            write_start = gdxcc.gdxDataWriteStrStart
+        if not write_start(self.file.H,
+                           self.name,
+                           self.description,
+                           self.num_dims,
+                           self.data_type.value,
+                           userinfo):
             raise GdxError(self.file.H,"Could not start writing data for symbol {}".format(repr(self.name)))
         # set domain information
         if self.num_dims > 0:
@@ -1085,25 +2398,131 @@ class GdxSymbol(object):
                     raise GdxError(self.file.H,"Could not set domain information for {}. Domains are {}".format(repr(self.name),repr(self.dims)))
             else:
                 logger.info("Not writing domain information because symbol index is unknown.")
+        if self._dense is not None:
+            self._write_dense(axis_codes)
+            return
         values = gdxcc.doubleArray(gdxcc.GMS_VAL_MAX)
-        # make sure index is clean -- needed for merging in convert_np_to_gdx_svs
-        self.dataframe = self.dataframe.reset_index(drop=True)
-        # convert special numeric values if appropriate
-        to_write = self.dataframe.copy() if (self.data_type in (GamsDataType.Set, GamsDataType.Alias)) else special.convert_np_to_gdx_svs(self.dataframe, self.num_dims)
+        df = self.dataframe
+        # convert special numeric values if appropriate. this works on a float
+        # array of the value columns rather than on copies of the dataframe
+        with instrumentation.span('prepare_values', symbol=self.name, records=len(df.index)):
+            to_write = self._write_values(df)
+        if not (self.data_type in (GamsDataType.Set, GamsDataType.Alias)):
+            with instrumentation.span('convert_specials', symbol=self.name, records=len(to_write)):
+                special.np_to_gdx_values(to_write)
         # write each row
-        for row in to_write.itertuples(index=False, name=None):
-            dims = [str(x) for x in row[:self.num_dims]]
-            vals = row[self.num_dims:]
-            for _col_name, col_ind in self.value_cols:
-                values[col_ind] = float(0.0)
+        if self.num_dims > 0:
+            dim_rows = zip(*[df.iloc[:, i].tolist() for i in range(self.num_dims)])
+        else:
+            dim_rows = [()] * len(df.index)
+        col_inds = [col_ind for _col_name, col_ind in self.value_cols]
+        H = self.file.H
+        write_str = gdxcc.gdxDataWriteStr
+        with instrumentation.span('write_records', symbol=self.name, records=len(to_write)):
+            for dims, vals in zip(dim_rows, to_write.tolist()):
+                for col_ind, val in zip(col_inds, vals):
+                    values[col_ind] = val
+                write_str(H,[str(x) for x in dims],values)
+            gdxcc.gdxDataWriteDone(self.file.H)
+        return
+
+    def _register_dense_uels(self):
+        """
+        Registers each label of the dense payload set by :py:meth:`set_dense` 
+        once, and returns the raw UEL codes of the labels along each axis.
+        """
+        H = self.file.H
+        labels = self._dense[1]
+        with instrumentation.span('register_uels', symbol=self.name):
+            if not gdxcc.gdxUELRegisterRawStart(H):
+                raise GdxError(H,f"Could not start registering UELs for symbol {self.name!r}")
+            for axis_labels in labels:
+                for label in axis_labels.tolist():
+                    if not gdxcc.gdxUELRegisterRaw(H,label):
+                        raise GdxError(H,f"Could not register UEL {label!r} for symbol {self.name!r}")
+            gdxcc.gdxUELRegisterDone(H)
+            # labels already in the file keep their codes, so look them all up
+            return [np.array([gdxcc.gdxUMFindUEL(H,label)[1] for label in axis_labels.tolist()], 
+                             dtype=np.int64) 
+                    for axis_labels in labels]
+
+    def _write_dense(self, axis_codes):
+        """
+        Writes the records of the dense payload set by :py:meth:`set_dense` 
+        with gdxDataWriteRaw, taking UEL codes and values from the arrays 
+        rather than from a dataframe.
+
+        Parameters
+        ----------
+        axis_codes : list of numpy.ndarray
+            Raw UEL code of each label along each axis, as returned by 
+            :py:meth:`_register_dense_uels`
+        """
+        num_dims = self.num_dims
+        with instrumentation.span('prepare_values', symbol=self.name) as prepare_span:
+            positions, to_write = self._dense_payload_records()
+            codes = np.empty((len(to_write), num_dims), dtype=np.int64)
+            for i in range(num_dims):
+                codes[:, i] = axis_codes[i][positions[i]]
+            # raw records must be written in ascending code order, which is 
+            # the order of positions if the codes ascend along every axis
+            if not all((np.diff(axis) > 0).all() for axis in axis_codes):
+                order = np.lexsort(codes.T[::-1])
+                codes = codes[order]
+                to_write = to_write[order]
+            prepare_span.set(records=len(to_write))
+        with instrumentation.span('convert_specials', symbol=self.name, records=len(to_write)):
+            special.np_to_gdx_values(to_write)
+        H = self.file.H
+        keys = gdxcc.intArray(gdxcc.GMS_MAX_INDEX_DIM)
+        values = gdxcc.doubleArray(gdxcc.GMS_VAL_MAX)
+        col_ind = GamsValueType.Level.value
+        write_raw = gdxcc.gdxDataWriteRaw
+        if (num_dims > 0) and (len(to_write) > 0):
+            # records that share their codes along the outer axes are written 
+            # together, so per record only the last key is set
+            outer = codes[:, :-1]
+            starts = np.flatnonzero(np.r_[True, (outer[1:] != outer[:-1]).any(axis=1)])
+            groups = zip(codes[starts, :-1].tolist(), 
+                         np.split(codes[:, -1], starts[1:]), 
+                         np.split(to_write, starts[1:]))
+            last = num_dims - 1
+        else:
+            # a scalar has no keys, so setting keys[0] is harmless
+            groups = [([], np.zeros(len(to_write), dtype=np.int64), to_write)]
+            last = 0
+        with instrumentation.span('write_records', symbol=self.name, records=len(to_write)):
+            for outer_codes, last_codes, group_values in groups:
+                for i, code in enumerate(outer_codes):
+                    keys[i] = code
+                for code, val in zip(last_codes.tolist(), group_values.tolist()):
+                    keys[last] = code
+                    values[col_ind] = val
+                    if not write_raw(H, keys, values):
+                        raise GdxError(H,f"Could not write record of symbol {self.name!r}")
+            gdxcc.gdxDataWriteDone(H)
+
+    def _write_values(self, df):
+        """
+        Returns the value columns of df as a new float array of shape 
+        (num_records, len(value_cols)). Entries that are not numbers (e.g., 
+        `c_bool` set values) are written as 0.0.
+        """
+        result = np.empty((len(df.index), len(self.value_cols)), dtype=float)
+        for i in range(len(self.value_cols)):
+            col = df.iloc[:, self.num_dims + i]
+            if (self.data_type == GamsDataType.Set) and (col.dtype.kind == 'b'):
+                # set membership is given by the record itself, and the set 
+                # level holds the text index, so write the same 0.0 as c_bool
+                result[:, i] = 0.0
+            elif col.dtype.kind in 'fiub':
+                result[:, i] = col.to_numpy(dtype=float, na_value=np.nan)
+            else:
                 try:
-                    if isinstance(vals[col_ind],Number):
-                        values[col_ind] = float(vals[col_ind])
+                    result[:, i] = [float(x) if isinstance(x, Number) else 0.0 for x in col.tolist()]
                 except: 
-                    raise Error("Unable to set element {} from {}.".format(col_ind,vals))
-            gdxcc.gdxDataWriteStr(self.file.H,dims,values)
-        gdxcc.gdxDataWriteDone(self.file.H)
-        return
+                    raise Error(f"Unable to set values for {self.name!r} from column {col.name!r}.")
+        return result
 
 
 # ------------------------------------------------------------------------------
@@ -1111,7 +2530,7 @@ class GdxSymbol(object):
 # ------------------------------------------------------------------------------
 
 def append_set(gdx_file, set_name, df, cols=None, dim_names=None, 
-        description=None):
+        description=None, copy=True):
     """
     Convenience function that appends set_name to gdx_file as a 
     :class:`GamsDataType.Set <GamsDataType>` :class:`GdxSymbol` using data in 
@@ -1136,9 +2555,13 @@ def append_set(gdx_file, set_name, df, cols=None, dim_names=None,
         dataframe, these will also be the dimension names
     description : None or str
         passed directly to :class:`GdxSymbol`
+    copy : bool
+        passed to :py:meth:`GdxSymbol.set_dataframe`. If False, the symbol 
+        shares df's data rather than holding a copy of it.
     """
     # ensure df is DataFrame and not Series
-    logger.debug(f"Defining set {set_name!r} based on:\n{df!r}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Defining set {set_name!r} based on:\n{df!r}")
     tmp = pd.DataFrame(df)
     # select down to data we actually want
     if cols is not None:
@@ -1152,14 +2575,15 @@ def append_set(gdx_file, set_name, df, cols=None, dim_names=None,
     gdx_file.append(GdxSymbol(set_name, GamsDataType.Set, 
         dims = list(tmp.columns), description = description))
     # define the data for the symbol
-    gdx_file[-1].dataframe = tmp
+    gdx_file[-1].set_dataframe(tmp, copy=copy)
     # debug description of what happened
-    logger.debug(f"Added set {set_name!r} to {gdx_file!r} using processed data:\n{tmp!r}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Added set {set_name!r} to {gdx_file!r} using processed data:\n{tmp!r}")
     return
 
 
 def append_parameter(gdx_file, param_name, df, cols=None, dim_names=None, 
-        description=None):
+        description=None, copy=True):
     """
     Convenience function that appends param_name to gdx_file as a 
     :class:`GamsDataType.Parameter <GamsDataType>` :class:`GdxSymbol` using 
@@ -1184,9 +2608,13 @@ def append_parameter(gdx_file, param_name, df, cols=None, dim_names=None,
         the final dataframe, these will also be the dimension names
     description : None or str
         passed directly to :class:`GdxSymbol`
+    copy : bool
+        passed to :py:meth:`GdxSymbol.set_dataframe`. If False, the symbol 
+        shares df's data rather than holding a copy of it.
     """
     # pre-process the data
-    logger.debug(f"Defining parameter {param_name!r} based on:\n{df!r}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Defining parameter {param_name!r} based on:\n{df!r}")
     tmp = pd.DataFrame(df)
     if cols is not None:
         tmp = tmp[cols]
@@ -1199,7 +2627,69 @@ def append_parameter(gdx_file, param_name, df, cols=None, dim_names=None,
     gdx_file.append(GdxSymbol(param_name, GamsDataType.Parameter,
         dims = list(tmp.columns)[:-1], description = description))
     # define the data for the symbol
-    gdx_file[-1].dataframe = tmp
+    gdx_file[-1].set_dataframe(tmp, copy=copy)
     # debug descripton of what happened
-    logger.debug(f"Added parameter {param_name!r} to {gdx_file!r} using processed data:\n{tmp!r}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Added parameter {param_name!r} to {gdx_file!r} using processed data:\n{tmp!r}")
+    return
+
+
+def append_dense_parameter(gdx_file, param_name, values, coords=None, dim_names=None, 
+        description=None, skip_value=0.0):
+    """
+    Convenience function that appends param_name to gdx_file as a 
+    :class:`GamsDataType.Parameter <GamsDataType>` :class:`GdxSymbol` holding 
+    the dense array values (see :py:meth:`GdxSymbol.set_dense`). Unlike 
+    melting the array into a long dataframe for :py:func:`append_parameter`, 
+    no dataframe is built, and the records are written straight from the 
+    array.
+
+    Parameters
+    ----------
+    gdx_file : :class:`GdxFile`
+        file to which new :class:`GdxSymbol` is to be added
+    param_name : str
+        name of the :class:`GdxSymbol` to be added
+    values : numpy.ndarray or xarray.DataArray
+        parameter values, with one axis per dimension
+    coords : None or list of sequences
+        labels along each axis of values. Required for numpy arrays. For 
+        DataArrays, defaults to their coordinates.
+    dim_names : None or list of str
+        dimension names. Defaults to the 'domain' attribute of DataArrays 
+        (as set by :py:meth:`GdxSymbol.to_xarray`) or else their dims, and 
+        to '*' for each axis of numpy arrays.
+    description : None or str
+        passed directly to :class:`GdxSymbol`. Defaults to the 'description' 
+        attribute of DataArrays.
+    skip_value : None or float
+        passed to :py:meth:`GdxSymbol.set_dense`. By default, zeros are not 
+        written.
+    """
+    if hasattr(values, 'dims') and hasattr(values, 'coords'):
+        # xarray.DataArray
+        if coords is None:
+            missing = [dim for dim in values.dims if dim not in values.coords]
+            if missing:
+                raise Error(f"Cannot append {param_name!r}, because its DataArray has "
+                    f"no coordinates for dimensions {missing}.")
+            coords = [values.coords[dim].values for dim in values.dims]
+        if dim_names is None:
+            domain = values.attrs.get('domain')
+            dim_names = list(domain) if (domain is not None) and (len(domain) == values.ndim) \
+                else [str(dim) for dim in values.dims]
+        if description is None:
+            description = values.attrs.get('description')
+        values = values.values
+    values = np.asarray(values)
+    if coords is None:
+        raise Error(f"Cannot append {param_name!r}, because no labels were given "
+            "for the axes of its values.")
+    if dim_names is None:
+        dim_names = ['*'] * values.ndim
+    gdx_file.append(GdxSymbol(param_name, GamsDataType.Parameter,
+        dims = list(dim_names), description = description or ''))
+    gdx_file[-1].set_dense(values, coords, skip_value=skip_value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Added parameter {param_name!r} to {gdx_file!r} from values of shape {values.shape}.")
     return
@@ -0,0 +1,109 @@
+'''
+Process-wide pool of gdxcc handles, so that opening many GDX files does not
+create and free a GDX object for each one.
+'''
+
+import atexit
+from collections import defaultdict
+import logging
+import threading
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+from gdxpds.tools import Error
+
+import gdxcc
+
+logger = logging.getLogger(__name__)
+
+
+class HandlePool(object):
+    """
+    Bounded pool of idle gdxcc handles, kept per GAMS directory. Handles are
+    checked out with :py:meth:`acquire` and returned with :py:meth:`release`,
+    which closes any file still open on them. Thread-safe.
+    """
+
+    def __init__(self, max_size=8):
+        """
+        Parameters
+        ----------
+        max_size : int
+            Maximum number of idle handles kept. Handles released beyond this
+            are freed.
+        """
+        self.max_size = max_size
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @property
+    def num_idle(self):
+        """
+        Number of idle handles currently in the pool
+
+        Returns
+        -------
+        int
+        """
+        with self._lock:
+            return sum(len(handles) for handles in self._idle.values())
+
+    def acquire(self, gams_dir):
+        """
+        Checks out a handle created with gams_dir, reusing an idle one if
+        possible.
+
+        Parameters
+        ----------
+        gams_dir : str
+
+        Returns
+        -------
+        gdxcc handle
+        """
+        with self._lock:
+            if self._idle[gams_dir]:
+                return self._idle[gams_dir].pop()
+        H = gdxcc.new_gdxHandle_tp()
+        rc = gdxcc.gdxCreateD(H, gams_dir, gdxcc.GMS_SSSIZE)
+        if not rc[0]:
+            raise Error(f"Unable to create GDX object with gams_dir {gams_dir!r}: {rc[1]}")
+        return H
+
+    def release(self, H, gams_dir):
+        """
+        Closes any file open on H and returns it to the pool, or frees it if
+        the pool is full or H has recorded errors.
+
+        Parameters
+        ----------
+        H : gdxcc handle
+            As returned by :py:meth:`acquire`. Must not be used by the caller
+            afterwards.
+        gams_dir : str
+            The gams_dir H was acquired with
+        """
+        # closing a handle that has no open file is harmless
+        gdxcc.gdxClose(H)
+        if gdxcc.gdxErrorCount(H) == 0:
+            with self._lock:
+                if sum(len(handles) for handles in self._idle.values()) < self.max_size:
+                    self._idle[gams_dir].append(H)
+                    return
+        gdxcc.gdxFree(H)
+
+    def clear(self):
+        """
+        Frees all idle handles
+        """
+        with self._lock:
+            idle = [H for handles in self._idle.values() for H in handles]
+            self._idle.clear()
+        for H in idle:
+            gdxcc.gdxFree(H)
+
+
+handle_pool = HandlePool()
+"""The :py:class:`HandlePool` shared by all :py:class:`GdxFiles <gdxpds.gdx.GdxFile>`"""
+
+atexit.register(handle_pool.clear)
@@ -0,0 +1,211 @@
+'''
+Instrumentation of the load and write hot paths. Code paths are wrapped in
+named spans (e.g., 'load' and its phases 'read_records', 'build_dataframe',
+...), which are reported to the listeners registered in this process. With no
+listeners registered, spans cost one check and record nothing.
+
+.. code:: python
+
+   import gdxpds
+   from gdxpds import instrumentation
+
+   with instrumentation.Recorder() as recorder:
+       dfs = gdxpds.to_dataframes('results.gdx')
+   print(recorder.to_dataframe().groupby('name')['duration_s'].sum())
+
+Setting the environment variable GDXPDS_TRACE=1 registers :py:func:`log_span`
+for the whole process, so that every span is logged at INFO level.
+'''
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SPAN_NAMES = {
+    'load': "GdxSymbol.load, from start to finish",
+    'read_records': "gdxcc data reads and building the lists of their results",
+    'build_arrays': "converting the lists read into numpy arrays",
+    'build_dataframe': "constructing the pd.DataFrame and its columns",
+    'convert_specials': "converting between GDX and numpy special values",
+    'fixup_set_values': "converting Set values to c_bool or bool",
+    'write': "GdxSymbol.write, from start to finish",
+    'prepare_values': "gathering the value columns to be written into an array",
+    'write_records': "gdxcc data writes",
+}
+"""Spans reported by gdxpds, and what they measure"""
+
+_listeners = []
+_lock = threading.Lock()
+
+
+class Span(object):
+    """
+    A timed, named section of code. Passed to listeners when it ends.
+
+    Attributes
+    ----------
+    name : str
+        One of :py:data:`SPAN_NAMES`
+    symbol : None or str
+        Name of the symbol being processed
+    start : float
+        time.perf_counter() when the span started
+    duration_s : None or float
+        Elapsed seconds, set when the span ends
+    attrs : dict
+        Additional measurements, e.g., 'records' and 'bytes'
+    """
+    __slots__ = ('name', 'symbol', 'start', 'duration_s', 'attrs')
+
+    def __init__(self, name, symbol=None, **attrs):
+        self.name = name
+        self.symbol = symbol
+        self.attrs = attrs
+        self.start = None
+        self.duration_s = None
+
+    def set(self, **attrs):
+        """
+        Records measurements, e.g., span.set(records=n)
+        """
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.duration_s = time.perf_counter() - self.start
+        for listener in list(_listeners):
+            try:
+                listener(self)
+            except Exception:
+                logger.exception(f"Instrumentation listener {listener!r} failed")
+        return False
+
+    def __repr__(self):
+        return f"Span({self.name!r}, symbol={self.symbol!r}, duration_s={self.duration_s}, {self.attrs})"
+
+
+class _NullSpan(object):
+    """
+    Shared span used when no listener is registered
+    """
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, symbol=None, **attrs):
+    """
+    Returns a context manager that times the code it wraps and reports it to
+    the registered listeners, or a shared no-op if there are none.
+
+    Parameters
+    ----------
+    name : str
+        What is being timed, see :py:data:`SPAN_NAMES`
+    symbol : None or str
+        Name of the symbol being processed
+    attrs
+        Initial measurements, e.g., records=n
+
+    Returns
+    -------
+    :py:class:`Span`
+    """
+    if not _listeners:
+        return _NULL_SPAN
+    return Span(name, symbol=symbol, **attrs)
+
+
+def enabled():
+    """
+    Returns
+    -------
+    bool
+        True if any listener is registered, that is, if spans are being reported
+    """
+    return bool(_listeners)
+
+
+def add_listener(listener):
+    """
+    Registers listener for this process.
+
+    Parameters
+    ----------
+    listener : callable
+        Called with each :py:class:`Span` when it ends. Exceptions it raises
+        are logged and otherwise ignored.
+    """
+    with _lock:
+        _listeners.append(listener)
+
+
+def remove_listener(listener):
+    """
+    Unregisters listener, if it is registered
+    """
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def log_span(span):
+    """
+    Listener that logs each span at INFO level to this module's logger
+    """
+    logger.info(f"{span.name} {span.symbol or ''} {span.duration_s * 1000.0:.3f} ms {span.attrs}")
+
+
+class Recorder(object):
+    """
+    Listener that keeps the spans it is passed. Used as a context manager, it
+    registers itself on entry and unregisters itself on exit.
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    def __call__(self, span):
+        self.spans.append(span)
+
+    def __enter__(self):
+        add_listener(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        remove_listener(self)
+        return False
+
+    def to_dataframe(self):
+        """
+        Returns
+        -------
+        pd.DataFrame
+            One row per recorded span, in the order the spans ended, with
+            columns 'name', 'symbol', 'duration_s' and one column per
+            measurement (e.g., 'records', 'bytes')
+        """
+        import pandas as pd
+        return pd.DataFrame([dict(name=span.name, symbol=span.symbol,
+                                  duration_s=span.duration_s, **span.attrs)
+                             for span in self.spans])
+
+
+if os.environ.get('GDXPDS_TRACE', '0') not in ('', '0'):
+    add_listener(log_span)
@@ -0,0 +1,198 @@
+'''
+Optional on-disk cache of GDX file catalogs (symbol names, data types,
+dimensions, record counts and descriptions), so that repeated catalog queries
+on unchanged files do not need to open them with gdxcc.
+'''
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+from gdxpds.tools import get_cache_dir
+from gdxpds.gdx import GdxFile
+
+logger = logging.getLogger(__name__)
+
+METADATA_VERSION = 1
+"""Version of the sidecar format. Entries of any other version are ignored."""
+
+
+class MetadataCache(object):
+    """
+    Sidecar store of GDX file metadata, keyed by the file's real path, size and
+    modification time. One small JSON file is kept per GDX file, so many
+    processes can share the cache without coordination.
+
+    Each symbol is described by a dict with the keys 'name', 'data_type',
+    'dims', 'num_records', 'description', 'variable_type' and 'equation_type'.
+    Types are stored as :py:class:`GamsDataType <gdxpds.gdx.GamsDataType>`,
+    etc. member names, or None.
+    """
+
+    def __init__(self, cache_dir=None):
+        """
+        Parameters
+        ----------
+        cache_dir : None or pathlib.Path or str
+            Directory in which to store the metadata. If None, the 'metadata'
+            sub-directory of :py:func:`gdxpds.tools.get_cache_dir` is used.
+        """
+        self.cache_dir = get_cache_dir('metadata') if cache_dir is None else cache_dir
+
+    @property
+    def cache_dir(self):
+        """
+        Directory in which the metadata are stored
+
+        Returns
+        -------
+        pathlib.Path
+        """
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, value):
+        self._cache_dir = Path(value)
+
+    def symbols(self, gdx_file, gams_dir=None):
+        """
+        Returns the metadata of gdx_file, from the cache if the file is
+        unchanged, otherwise by reading the file and then caching the result.
+
+        Parameters
+        ----------
+        gdx_file : pathlib.Path or str
+            Path to the GDX file
+        gams_dir : None or pathlib.Path or str
+            optional path to GAMS directory, only used if gdx_file is read
+
+        Returns
+        -------
+        list of dict
+            One dict per symbol, in file order
+        """
+        ret = self.get(gdx_file)
+        if ret is None:
+            ret = read_metadata(gdx_file, gams_dir=gams_dir)
+            self.put(gdx_file, ret)
+        return ret
+
+    def get(self, gdx_file):
+        """
+        Returns the cached metadata of gdx_file, or None if there is no entry
+        for the file as it is now.
+
+        Parameters
+        ----------
+        gdx_file : pathlib.Path or str
+
+        Returns
+        -------
+        None or list of dict
+        """
+        key = _file_key(gdx_file)
+        try:
+            with open(self._entry_path(key), 'r') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable metadata cache entry for '{gdx_file}': {e}")
+            return None
+        if (entry.get('version') != METADATA_VERSION) or (entry.get('key') != list(key)):
+            return None
+        return entry['symbols']
+
+    def put(self, gdx_file, symbols):
+        """
+        Stores symbols as the metadata of gdx_file as it is now. Failures to
+        write are logged rather than raised, since the cache is only an
+        optimization.
+
+        Parameters
+        ----------
+        gdx_file : pathlib.Path or str
+        symbols : list of dict
+            As returned by :py:func:`read_metadata`
+        """
+        key = _file_key(gdx_file)
+        entry = {'version': METADATA_VERSION, 'key': list(key), 'symbols': symbols}
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            # atomic, so concurrent readers see either the old or the new entry
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Unable to cache metadata for '{gdx_file}' in '{self.cache_dir}': {e}")
+
+    def clear(self):
+        """
+        Deletes all entries in :py:attr:`cache_dir`
+        """
+        if not self.cache_dir.is_dir():
+            return
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink()
+
+    def _entry_path(self, key):
+        name = hashlib.sha1(key[0].encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{name}.json"
+
+
+def _file_key(gdx_file):
+    """
+    Returns (realpath, size, mtime in ns) of gdx_file, which must exist
+    """
+    path = os.path.realpath(gdx_file)
+    stat = os.stat(path)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+def read_metadata(gdx_file, gams_dir=None):
+    """
+    Reads the metadata of all symbols in gdx_file without loading their data.
+
+    Parameters
+    ----------
+    gdx_file : pathlib.Path or str
+        Path to the GDX file to read
+    gams_dir : None or pathlib.Path or str
+        optional path to GAMS directory
+
+    Returns
+    -------
+    list of dict
+        One dict per symbol, in file order, as described in :py:class:`MetadataCache`
+    """
+    with GdxFile(gams_dir=gams_dir, lazy_load=True) as f:
+        f.read(gdx_file)
+        return [symbol_metadata(symbol) for symbol in f]
+
+
+def symbol_metadata(symbol):
+    """
+    Returns the metadata of symbol without loading its data.
+
+    Parameters
+    ----------
+    symbol : :py:class:`GdxSymbol <gdxpds.gdx.GdxSymbol>`
+
+    Returns
+    -------
+    dict
+        As described in :py:class:`MetadataCache`
+    """
+    return {'name': symbol.name,
+            'data_type': symbol.data_type.name,
+            'dims': list(symbol.dims),
+            'num_records': symbol.num_records,
+            'description': symbol.description,
+            'variable_type': None if symbol.variable_type is None else symbol.variable_type.name,
+            'equation_type': None if symbol.equation_type is None else symbol.equation_type.name}
@@ -0,0 +1,163 @@
+'''
+Export of GDX files to Parquet, one file per symbol. Requires pyarrow, which
+is installed with the 'parquet' extra (pip install gdxpds[parquet]).
+
+Each symbol is streamed into its Parquet file in row groups of at most
+chunksize records, so memory use is bounded by chunksize rather than by the
+size of the symbol. Dimension columns are dictionary-encoded strings, and the
+symbol's metadata is stored as JSON under the b'gdxpds' key of the file's
+schema metadata:
+
+.. code:: python
+
+   import json
+   import pyarrow.parquet as pq
+
+   metadata = json.loads(pq.read_schema('out/CONVqmnallm.parquet').metadata[b'gdxpds'])
+'''
+
+from collections import OrderedDict
+import json
+import logging
+import os
+
+# gdxpds needs to be imported before pandas to try to avoid library conflict on
+# Linux that causes a segmentation fault.
+from gdxpds.tools import Error
+from gdxpds.gdx import GdxFile, GamsDataType
+from gdxpds.metadata import symbol_metadata
+import gdxpds.special as special
+from gdxpds._version import __version__
+
+logger = logging.getLogger(__name__)
+
+METADATA_KEY = b'gdxpds'
+"""Key of the symbol metadata in the Parquet schema metadata"""
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise Error("Writing Parquet files requires pyarrow. Install it with "
+                    "'pip install pyarrow' or 'pip install gdxpds[parquet]'.")
+    return pyarrow, pyarrow.parquet
+
+
+def _column_names(symbol):
+    """
+    Returns the column names of symbol's dataframe, with repeated dimension
+    names (e.g., '*') made unique by appending their position
+    """
+    names = list(symbol.dims) + list(symbol.value_col_names)
+    return [name if names.count(name) == 1 else f'{name}_{i}' for i, name in enumerate(names)]
+
+
+def _schema(pa, symbol, load_set_text=False, raw_specials=False):
+    """
+    Returns the pyarrow schema of symbol's Parquet file, including its metadata
+    """
+    fields = [pa.field(name, pa.dictionary(pa.int32(), pa.string()))
+              for name in _column_names(symbol)[:symbol.num_dims]]
+    for name in _column_names(symbol)[symbol.num_dims:]:
+        if symbol.data_type == GamsDataType.Set:
+            fields.append(pa.field(name, pa.string() if load_set_text else pa.bool_()))
+        else:
+            fields.append(pa.field(name, pa.float64()))
+    metadata = symbol_metadata(symbol)
+    metadata['gdxpds_version'] = __version__
+    metadata['source'] = str(symbol.file.filename)
+    metadata['raw_specials'] = raw_specials
+    if raw_specials:
+        # how to decode the values, in gdxGetSpecialValues order
+        metadata['special_values'] = [float(value) for value in special.SPECIAL_VALUES]
+    return pa.schema(fields, metadata={METADATA_KEY: json.dumps(metadata).encode('utf-8')})
+
+
+def write_symbol(symbol, path, chunksize=1000000, load_set_text=False, raw_specials=False,
+                 compression='snappy'):
+    """
+    Streams symbol into a Parquet file at path.
+
+    Parameters
+    ----------
+    symbol : :py:class:`GdxSymbol <gdxpds.gdx.GdxSymbol>`
+        Symbol of a :py:class:`GdxFile <gdxpds.gdx.GdxFile>` that has been read
+        with bool_set_values=True. It does not need to be loaded.
+    path : pathlib.Path or str
+    chunksize, load_set_text, raw_specials, compression
+        As for :py:func:`to_parquet`
+    """
+    pa, pq = _import_pyarrow()
+    if not symbol.file.bool_set_values:
+        raise Error(f"Cannot write {symbol.name!r} to Parquet because its file "
+                    "was not read with bool_set_values=True.")
+    schema = _schema(pa, symbol, load_set_text=load_set_text, raw_specials=raw_specials)
+    names = _column_names(symbol)
+    with pq.ParquetWriter(str(path), schema, compression=compression) as writer:
+        for df in symbol.iter_chunks(chunksize=chunksize, load_set_text=load_set_text,
+                                     categorical_dims=True, raw_specials=raw_specials):
+            df.columns = names
+            for name in names[:symbol.num_dims]:
+                # only the labels used go into each row group's dictionary
+                df[name] = df[name].cat.remove_unused_categories()
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+
+
+def to_parquet(gdx_file, out_dir, symbols=None, gams_dir=None, chunksize=1000000,
+               load_set_text=False, raw_specials=False, compression='snappy'):
+    """
+    Exports the symbols of gdx_file to out_dir as one Parquet file per symbol,
+    named after the symbol.
+
+    Parameters
+    ----------
+    gdx_file : pathlib.Path or str
+        Path to the GDX file to read
+    out_dir : pathlib.Path or str
+        Directory to write to. Created if it does not exist.
+    symbols : None or list of str
+        If not None, only these symbols are exported. Raises an Error if any
+        are not in the file.
+    gams_dir : None or pathlib.Path or str
+        optional path to GAMS directory
+    chunksize : int
+        Maximum number of records read at a time, and so per row group
+    load_set_text : bool
+        If True (default is False), the value column of Sets holds the GDX
+        Text field rather than True.
+    raw_specials : bool
+        If True (default is False), GDX special values are written as-is,
+        which keeps undefined and NA distinct, and are listed in the metadata
+        under 'special_values'. Otherwise they are converted to their numpy
+        equivalents, see :py:data:`gdxpds.special.NUMPY_SPECIAL_VALUES`.
+    compression : str
+        Parquet compression codec, e.g., 'snappy', 'zstd' or 'none'
+
+    Returns
+    -------
+    dict of str to str
+        Path of the file written for each symbol, in file order
+    """
+    _import_pyarrow()
+    result = OrderedDict()
+    with GdxFile(gams_dir=gams_dir, lazy_load=True, read_engine='raw',
+                 bool_set_values=True) as f:
+        f.read(gdx_file)
+        if symbols is None:
+            selected = list(f)
+        else:
+            missing = [name for name in symbols if name not in f]
+            if missing:
+                raise Error(f"No symbols named {missing} in '{gdx_file}'.")
+            selected = [f[name] for name in symbols]
+        os.makedirs(out_dir, exist_ok=True)
+        for symbol in selected:
+            path = os.path.join(out_dir, symbol.name + '.parquet')
+            if os.path.exists(path):
+                logger.info(f"Overwriting '{path}'")
+            write_symbol(symbol, path, chunksize=chunksize, load_set_text=load_set_text,
+                         raw_specials=raw_specials, compression=compression)
+            result[symbol.name] = path
+    return result
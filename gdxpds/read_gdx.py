@@ -1,16 +1,23 @@
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
 # gdxpds needs to be imported before pandas to try to avoid library conflict on 
 # Linux that causes a segmentation fault.
-from gdxpds.tools import Error
+from gdxpds.tools import Error, GamsDirFinder
 from gdxpds.gdx import GdxFile, GamsDataType
+from gdxpds.metadata import MetadataCache
+from gdxpds.cache import SymbolCache, symbol_cache
 
 logger = logging.getLogger(__name__)
 
 class Translator(object):
-    def __init__(self,gdx_file,gams_dir=None,lazy_load=False):
-        self.__gdx = GdxFile(gams_dir=gams_dir,lazy_load=lazy_load)
+    def __init__(self,gdx_file,gams_dir=None,lazy_load=False,categorical_dims=False,
+                 bool_set_values=False,dtype_backend='numpy'):
+        self.__gdx = GdxFile(gams_dir=gams_dir,lazy_load=lazy_load,
+                             categorical_dims=categorical_dims,
+                             bool_set_values=bool_set_values,
+                             dtype_backend=dtype_backend)
         self.__gdx.read(gdx_file)
         self.__dataframes = None
 
@@ -35,7 +42,10 @@ class Translator(object):
     @gdx_file.setter
     def gdx_file(self,value):
         self.__gdx.__del__()
-        self.__gdx = GdxFile(gams_dir=self.gdx.gams_dir,lazy_load=self.gdx.lazy_load)
+        self.__gdx = GdxFile(gams_dir=self.gdx.gams_dir,lazy_load=self.gdx.lazy_load,
+                             categorical_dims=self.gdx.categorical_dims,
+                             bool_set_values=self.gdx.bool_set_values,
+                             dtype_backend=self.gdx.dtype_backend)
         self.__gdx.read(value)
         self.__dataframes = None
 
@@ -45,13 +55,7 @@ class Translator(object):
 
     @property
     def dataframes(self):
-        if self.__dataframes is None:
-            self.__dataframes = OrderedDict()
-            for symbol in self.gdx:
-                if not symbol.loaded:
-                    symbol.load()
-                self.__dataframes[symbol.name] = symbol.dataframe.copy()
-        return self.__dataframes
+        return self._get_dataframes()
 
     @property
     def symbols(self):
@@ -61,28 +65,73 @@ class Translator(object):
     def data_types(self):
         return {symbol.name: symbol.data_type for symbol in self.gdx}
 
-    def dataframe(self, symbol_name, load_set_text=False):
+    def dataframe(self, symbol_name, load_set_text=False, copy=True, filters=None):
         if not symbol_name in self.gdx:
             raise Error("No symbol named '{}' in '{}'.".format(symbol_name, self.gdx_file))
+        if filters is not None:
+            # read just the slice, and do not leave it behind as if it were 
+            # the whole symbol
+            symbol = self.gdx[symbol_name]
+            symbol.unload()
+            symbol.load(load_set_text=load_set_text, filters=filters)
+            df = symbol.dataframe
+            symbol.unload()
+            return df
         if not self.gdx[symbol_name].loaded:
             self.gdx[symbol_name].load(load_set_text=load_set_text)
         # This was returning { symbol_name: dataframe }, which seems intuitively off.
-        return self.gdx[symbol_name].dataframe.copy()
+        df = self.gdx[symbol_name].dataframe
+        return df.copy() if copy else df
     
-    def _get_dataframes(self, load_set_text=False):
-        if self.__dataframes is None:
-            self.__dataframes = OrderedDict()
-            for symbol in self.__gdx:
-                if not symbol.loaded:
-                    symbol.load(load_set_text=load_set_text)
-                self.__dataframes[symbol.name] = symbol.dataframe.copy()
-        return self.__dataframes
+    def _get_dataframes(self, load_set_text=False, symbols=None, data_types=None, copy=True,
+                        workers=None):
+        select_all = (symbols is None) and (data_types is None)
+        if select_all and (self.__dataframes is not None):
+            return self.__dataframes
+        result = OrderedDict()
+        selected = self._select_symbols(symbols=symbols, data_types=data_types)
+        self.gdx.load_symbols(symbols=[symbol.name for symbol in selected],
+                              load_set_text=load_set_text,
+                              workers=workers)
+        for symbol in selected:
+            result[symbol.name] = symbol.dataframe.copy() if copy else symbol.dataframe
+        if select_all:
+            self.__dataframes = result
+        return result
+
+    def _select_symbols(self, symbols=None, data_types=None):
+        """
+        Returns the list of :py:class:`GdxSymbol` named in symbols (in that 
+        order; all symbols in file order if None), filtered down to those of 
+        data_types if not None.
+        """
+        if symbols is None:
+            selected = list(self.gdx)
+        else:
+            if isinstance(symbols, str):
+                symbols = [symbols]
+            missing = [name for name in symbols if not name in self.gdx]
+            if missing:
+                raise Error("No symbols named {} in '{}'.".format(missing, self.gdx_file))
+            selected = [self.gdx[name] for name in symbols]
+        if data_types is not None:
+            if isinstance(data_types, (str, GamsDataType)):
+                data_types = [data_types]
+            data_types = [data_type if isinstance(data_type, GamsDataType) else GamsDataType[data_type]
+                          for data_type in data_types]
+            selected = [symbol for symbol in selected if symbol.data_type in data_types]
+        return selected
     
 
-def to_dataframes(gdx_file,gams_dir=None,load_set_text=False):
+def to_dataframes(gdx_file,gams_dir=None,load_set_text=False,categorical_dims=False,
+                  bool_set_values=False,symbols=None,data_types=None,workers=None,
+                  cache=False,dtype_backend='numpy'):
     """
     Primary interface for converting a GAMS GDX file to pandas DataFrames.
 
+    Only the requested symbols are read, and the DataFrames are handed back as 
+    loaded, without a defensive copy.
+
     Parameters
     ----------
     gdx_file : pathlib.Path or str
@@ -92,19 +141,168 @@ def to_dataframes(gdx_file,gams_dir=None,load_set_text=False):
     load_set_text : bool
         If True (default is False), then for every symbol that is a Set, loads 
         the GDX Text field into the dataframe rather than a `c_bool`.
+    categorical_dims : bool
+        If True (default is False), dimension columns are returned as 
+        pd.Categorical with categories in GDX UEL order.
+    bool_set_values : bool
+        If True (default is False), the value column of every Set is a numpy 
+        bool column rather than a column of `c_bool` objects.
+    symbols : None or str or list of str
+        If not None, only these symbols are read, and the result is in this 
+        order. Raises an Error if any are not in the file.
+    data_types : None or :py:class:`GamsDataType` or str or list of those
+        If not None, only symbols of these data types (e.g., 
+        GamsDataType.Parameter or 'Parameter') are read.
+    workers : None or int
+        If greater than 1, the symbols are loaded by a pool of this many 
+        processes. See :py:meth:`GdxFile.load_symbols 
+        <gdxpds.gdx.GdxFile.load_symbols>`.
+    cache : bool or :py:class:`SymbolCache <gdxpds.cache.SymbolCache>`
+        If True (default is False) or a SymbolCache, the frames are taken from 
+        and added to that cache (True uses :py:data:`gdxpds.cache.symbol_cache`), 
+        so that symbols of an unchanged file are only decoded once. If symbols 
+        are listed and all of them are cached, the file is not even opened.
+    dtype_backend : str
+        'numpy' (the default) or 'pyarrow', in which case the columns are 
+        pd.ArrowDtype, see :py:data:`gdxpds.gdx.DTYPE_BACKENDS`.
 
     Returns
     -------
     dict of str to pd.DataFrame
-        Returns a dict of Pandas DataFrames, one item for each symbol in the GDX
-        file, keyed with the symbol name.
+        Returns a dict of Pandas DataFrames, one item for each selected symbol 
+        in the GDX file, keyed with the symbol name.
+    """
+    cache = _get_symbol_cache(cache)
+    if cache is not None:
+        return _cached_dataframes(cache,gdx_file,gams_dir=gams_dir,
+                                  load_set_text=load_set_text,
+                                  categorical_dims=categorical_dims,
+                                  bool_set_values=bool_set_values,
+                                  symbols=symbols,data_types=data_types,workers=workers,
+                                  dtype_backend=dtype_backend)
+    translator = Translator(gdx_file,gams_dir=gams_dir,lazy_load=True,
+                            categorical_dims=categorical_dims,
+                            bool_set_values=bool_set_values,
+                            dtype_backend=dtype_backend)
+    return translator._get_dataframes(load_set_text=load_set_text,
+                                      symbols=symbols,
+                                      data_types=data_types,
+                                      copy=False,
+                                      workers=workers)
+
+
+def _cached_dataframes(cache,gdx_file,gams_dir=None,load_set_text=False,
+                       categorical_dims=False,bool_set_values=False,symbols=None,
+                       data_types=None,workers=None,dtype_backend='numpy'):
+    """
+    :py:func:`to_dataframes` through cache
+    """
+    def key(name):
+        return cache.key(gdx_file,name,load_set_text=load_set_text,
+                         categorical_dims=categorical_dims,
+                         bool_set_values=bool_set_values,
+                         dtype_backend=dtype_backend)
+
+    result = OrderedDict()
+    if (symbols is not None) and (data_types is None):
+        for name in ([symbols] if isinstance(symbols, str) else symbols):
+            result[name] = cache.get(key(name))
+            if result[name] is None:
+                break
+        else:
+            return result
+    translator = Translator(gdx_file,gams_dir=gams_dir,lazy_load=True,
+                            categorical_dims=categorical_dims,
+                            bool_set_values=bool_set_values,
+                            dtype_backend=dtype_backend)
+    selected = [symbol.name for symbol in translator._select_symbols(symbols=symbols,
+                                                                     data_types=data_types)]
+    for name in selected:
+        if result.get(name) is None:
+            result[name] = cache.get(key(name))
+    missing = [name for name in selected if result[name] is None]
+    if missing:
+        loaded = translator._get_dataframes(load_set_text=load_set_text,
+                                            symbols=missing,
+                                            copy=False,
+                                            workers=workers)
+        for name, df in loaded.items():
+            result[name] = cache.put(key(name),df)
+    return OrderedDict((name, result[name]) for name in selected)
+
+
+def _get_symbol_cache(cache):
+    if isinstance(cache, SymbolCache):
+        return cache
+    return symbol_cache if cache else None
+
+
+def read_many(paths,symbols=None,workers=None,gams_dir=None,load_set_text=False,
+              categorical_dims=False,bool_set_values=False,data_types=None):
+    """
+    Interface for reading the same symbols from many GDX files, e.g., the 
+    scenarios of an ensemble, optionally spread across a pool of processes.
+
+    The GAMS directory is found once, and each worker process initializes 
+    gdxcc once when it starts rather than once per file.
+
+    Parameters
+    ----------
+    paths : list of pathlib.Path or str
+        Paths to the GDX files to read
+    symbols : None or str or list of str
+        If not None, only these symbols are read from each file. Raises an 
+        Error if any are not in a file.
+    workers : None or int
+        If greater than 1, the files are read by a pool of this many 
+        processes. Otherwise they are read one after another in this process.
+    gams_dir : None or pathlib.Path or str
+        optional path to GAMS directory
+    load_set_text : bool
+        As for :py:func:`to_dataframes`
+    categorical_dims : bool
+        As for :py:func:`to_dataframes`
+    bool_set_values : bool
+        As for :py:func:`to_dataframes`
+    data_types : None or :py:class:`GamsDataType` or str or list of those
+        As for :py:func:`to_dataframes`
+
+    Returns
+    -------
+    dict of pathlib.Path or str to dict of str to pd.DataFrame
+        For each of paths, in order, the dict of DataFrames that 
+        :py:func:`to_dataframes` would return
+    """
+    gams_dir = GamsDirFinder(gams_dir=None if gams_dir is None else str(gams_dir)).gams_dir
+    kwargs = dict(gams_dir=gams_dir, load_set_text=load_set_text, 
+                  categorical_dims=categorical_dims, bool_set_values=bool_set_values, 
+                  symbols=symbols, data_types=data_types)
+    paths = list(paths)
+    if (workers is None) or (workers <= 1) or (len(paths) < 2):
+        return OrderedDict((path, _read_one(path, kwargs)) for path in paths)
+    logger.debug(f"Reading {len(paths)} GDX files with {workers} worker processes.")
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths)),
+                             initializer=_init_worker,
+                             initargs=(gams_dir,)) as pool:
+        results = pool.map(_read_one, paths, [kwargs] * len(paths))
+        return OrderedDict(zip(paths, results))
+
+
+def _init_worker(gams_dir):
+    """
+    :py:func:`read_many` worker initializer. Loads gdxcc and the special 
+    values once per process, unless they were inherited from the parent.
     """
-    if load_set_text:
-        return Translator(gdx_file,gams_dir=gams_dir,lazy_load=True)._get_dataframes(load_set_text=load_set_text)
-    return Translator(gdx_file,gams_dir=gams_dir).dataframes
+    import gdxpds
+    if not gdxpds.special.SPECIAL_VALUES:
+        gdxpds.load_gdxcc(gams_dir=gams_dir)
 
 
-def list_symbols(gdx_file,gams_dir=None):
+def _read_one(path, kwargs):
+    return to_dataframes(str(path), **kwargs)
+
+
+def list_symbols(gdx_file,gams_dir=None,metadata_cache=False):
     """
     Returns the list of symbols available in gdx_file.
 
@@ -114,16 +312,23 @@ def list_symbols(gdx_file,gams_dir=None):
         Path to the GDX file to read
     gams_dir : None or pathlib.Path or str
         optional path to GAMS directory
+    metadata_cache : bool or :py:class:`MetadataCache <gdxpds.metadata.MetadataCache>`
+        If True (default is False), or a MetadataCache, the answer is served 
+        from the on-disk metadata cache if gdx_file is unchanged, without 
+        opening it. True uses the default cache directory.
 
     Returns
     -------
     list of str
         List of symbol names
     """
+    if metadata_cache:
+        return [symbol['name'] for symbol in 
+                _get_metadata_cache(metadata_cache).symbols(gdx_file,gams_dir=gams_dir)]
     return Translator(gdx_file,gams_dir=gams_dir,lazy_load=True).symbols
 
 
-def get_data_types(gdx_file,gams_dir=None):
+def get_data_types(gdx_file,gams_dir=None,metadata_cache=False):
     """
     Returns a dict of the symbols' :py:class:`GamsDataTypes <GamsDataType>`.
     
@@ -133,17 +338,28 @@ def get_data_types(gdx_file,gams_dir=None):
         Path to the GDX file to read
     gams_dir : None or pathlib.Path or str
         optional path to GAMS directory
+    metadata_cache : bool or :py:class:`MetadataCache <gdxpds.metadata.MetadataCache>`
+        As for :py:func:`list_symbols`
 
     Returns
     -------
     dict of str to :py:class:GamsDataType`
         Map of symbol names to the corresponding :py:class:GamsDataType`
     """
+    if metadata_cache:
+        return {symbol['name']: GamsDataType[symbol['data_type']] for symbol in 
+                _get_metadata_cache(metadata_cache).symbols(gdx_file,gams_dir=gams_dir)}
     return Translator(gdx_file,gams_dir=gams_dir,lazy_load=True).data_types
 
 
+def _get_metadata_cache(metadata_cache):
+    return metadata_cache if isinstance(metadata_cache, MetadataCache) else MetadataCache()
+
 
-def to_dataframe(gdx_file,symbol_name,gams_dir=None,old_interface=True,load_set_text=False):
+
+def to_dataframe(gdx_file,symbol_name,gams_dir=None,old_interface=True,load_set_text=False,
+                 categorical_dims=False,bool_set_values=False,filters=None,cache=False,
+                 dtype_backend='numpy'):
     """
     Interface for getting the data for a single symbol
 
@@ -161,6 +377,24 @@ def to_dataframe(gdx_file,symbol_name,gams_dir=None,old_interface=True,load_set_
     load_set_text : bool
         If True (default is False) and symbol_name is a Set, loads the GDX Text 
         field into the dataframe rather than a `c_bool`.
+    categorical_dims : bool
+        If True (default is False), dimension columns are returned as 
+        pd.Categorical with categories in GDX UEL order.
+    bool_set_values : bool
+        If True (default is False) and symbol_name is a Set, the value column is 
+        a numpy bool column rather than a column of `c_bool` objects.
+    filters : None or dict
+        If not None, only the records matching filters are read, e.g., 
+        {'r': ['p1', 'p2'], 't': [2030]}. See :py:meth:`GdxSymbol.load 
+        <gdxpds.gdx.GdxSymbol.load>`.
+    cache : bool or :py:class:`SymbolCache <gdxpds.cache.SymbolCache>`
+        If True (default is False) or a SymbolCache, the frame is taken from 
+        and added to that cache (True uses :py:data:`gdxpds.cache.symbol_cache`), 
+        so that repeated reads of an unchanged file cost a lookup rather than 
+        a decode.
+    dtype_backend : str
+        'numpy' (the default) or 'pyarrow', in which case the columns are 
+        pd.ArrowDtype, see :py:data:`gdxpds.gdx.DTYPE_BACKENDS`.
     
     Returns
     -------
@@ -170,7 +404,64 @@ def to_dataframe(gdx_file,symbol_name,gams_dir=None,old_interface=True,load_set_
         pd.DataFrame. Otherwise (if not old_interface), returns just the 
         pd.DataFrame.
     """
-    df = Translator(gdx_file,gams_dir=gams_dir,lazy_load=True).dataframe(
-        symbol_name,
-        load_set_text=load_set_text)
+    cache = _get_symbol_cache(cache)
+    if cache is not None:
+        key = cache.key(gdx_file,symbol_name,load_set_text=load_set_text,
+                        categorical_dims=categorical_dims,
+                        bool_set_values=bool_set_values,
+                        filters=filters,
+                        dtype_backend=dtype_backend)
+        df = cache.get(key)
+    if (cache is None) or (df is None):
+        df = Translator(gdx_file,gams_dir=gams_dir,lazy_load=True,
+                        categorical_dims=categorical_dims,
+                        bool_set_values=bool_set_values,
+                        dtype_backend=dtype_backend).dataframe(
+            symbol_name,
+            load_set_text=load_set_text,
+            copy=False,
+            filters=filters)
+        if cache is not None:
+            df = cache.put(key,df)
     return {symbol_name: df} if old_interface else df
+
+
+def iter_dataframe(gdx_file,symbol_name,chunksize=1000000,gams_dir=None,load_set_text=False,
+                   categorical_dims=False,bool_set_values=False):
+    """
+    Interface for streaming the data for a single symbol in batches, so that 
+    symbols larger than memory can be processed
+
+    Parameters
+    ----------
+    gdx_file : pathlib.Path or str
+        Path to the GDX file to read
+    symbol_name : str
+        Name of the symbol whose data are to be read
+    chunksize : int
+        Maximum number of records in each yielded pd.DataFrame
+    gams_dir : None or pathlib.Path or str
+        optional path to GAMS directory
+    load_set_text : bool
+        If True (default is False) and symbol_name is a Set, loads the GDX Text 
+        field into the dataframe rather than a `c_bool`.
+    categorical_dims : bool
+        If True (default is False), dimension columns are returned as 
+        pd.Categorical with categories in GDX UEL order.
+    bool_set_values : bool
+        If True (default is False) and symbol_name is a Set, the value column is 
+        a numpy bool column rather than a column of `c_bool` objects.
+
+    Yields
+    ------
+    pd.DataFrame
+        Consecutive batches of symbol_name's records, each with the same 
+        columns and dtypes, and with special values already converted
+    """
+    translator = Translator(gdx_file,gams_dir=gams_dir,lazy_load=True,
+                            categorical_dims=categorical_dims,
+                            bool_set_values=bool_set_values)
+    if not symbol_name in translator.gdx:
+        raise Error("No symbol named '{}' in '{}'.".format(symbol_name, gdx_file))
+    yield from translator.gdx[symbol_name].iter_chunks(chunksize=chunksize,
+                                                       load_set_text=load_set_text)
@@ -1,9 +1,10 @@
-import copy
 import logging
 
 import gdxcc
 import numpy as np
 
+from gdxpds.handles import handle_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +15,101 @@ NUMPY_SPECIAL_VALUES = [None, np.nan, np.inf, -np.inf, np.finfo(float).eps]
 """
 
 
-def convert_gdx_to_np_svs(df, num_dims):
+def _specials_loaded():
+    """
+    Initializes gdxcc if that has not been attempted yet, so that values can 
+    be converted before any GdxFile is created. Returns True if the GDX 
+    special values are known.
+    """
+    if not SPECIAL_VALUES:
+        import gdxpds
+        gdxpds._ensure_gdxcc()
+    return bool(SPECIAL_VALUES)
+
+
+def gdx_to_np_values(values, raw_specials=False):
+    """
+    Converts GDX special values to the corresponding numpy versions in place.
+
+    Parameters
+    ----------
+    values : numpy.ndarray of float
+        array of symbol values as read directly from GDX. Must be writeable.
+    raw_specials : bool
+        If True, values is returned unchanged, that is, the GDX special values 
+        are kept as-is.
+
+    Returns
+    -------
+    numpy.ndarray
+        values, for which GDX special values have been converted to their 
+        numpy equivalents. Because a float array cannot hold None, undefined 
+        (SPECIAL_VALUES[0]) is converted to np.nan.
+    """
+    if raw_specials or (not _specials_loaded()) or (values.size == 0):
+        return values
+    # GDX special values are all huge, so one comparison finds the candidates
+    idx = np.nonzero(values >= min(SPECIAL_VALUES))
+    if len(idx[0]) == 0:
+        return values
+    candidates = values[idx]
+    converted = candidates.copy()
+    for gdx_val, np_val in zip(SPECIAL_VALUES, NUMPY_SPECIAL_VALUES):
+        converted[candidates == gdx_val] = np.nan if np_val is None else np_val
+    values[idx] = converted
+    return values
+
+
+def np_to_gdx_values(values, raw_specials=False):
+    """
+    Converts numpy special values to the corresponding GDX versions in place.
+
+    Parameters
+    ----------
+    values : numpy.ndarray of float
+        array of symbol values in numpy form. Must be writeable.
+    raw_specials : bool
+        If True, values is returned unchanged.
+
+    Returns
+    -------
+    numpy.ndarray
+        values, for which np.nan, np.inf, -np.inf and eps have been converted 
+        to their GDX equivalents. None and np.nan are indistinguishable in a 
+        float array; both are written as NP_TO_GDX_SVS[np.nan].
+    """
+    if raw_specials or (not _specials_loaded()) or (values.size == 0):
+        return values
+    eps = NUMPY_SPECIAL_VALUES[-1]
+    nan_mask = np.isnan(values)
+    inf_mask = np.isinf(values)
+    eps_mask = np.abs(values - eps) < eps
+    if inf_mask.any():
+        pos_mask = inf_mask & (values > 0)
+        values[pos_mask] = NP_TO_GDX_SVS[np.inf]
+        values[inf_mask & ~pos_mask] = NP_TO_GDX_SVS[-np.inf]
+    values[nan_mask] = NP_TO_GDX_SVS[np.nan]
+    values[eps_mask] = SPECIAL_VALUES[4]
+    return values
+
+
+def _convert_value_columns(df, num_dims, converter, inplace, raw_specials):
+    result = df if inplace else df.copy()
+    if raw_specials or result.empty:
+        return result
+    for col_name in list(result.columns[num_dims:]):
+        col = result[col_name]
+        if col.dtype.kind != 'f':
+            try:
+                col = col.astype(float)
+            except (TypeError, ValueError):
+                logger.debug(f"Not converting special values in non-numeric column {col_name!r}")
+                continue
+        result[col_name] = converter(col.to_numpy(dtype=float, copy=True))
+    return result
+
+
+def convert_gdx_to_np_svs(df, num_dims, inplace=False, raw_specials=False):
     """
     Converts GDX special values to the corresponding numpy versions.
 
@@ -25,21 +120,18 @@ def convert_gdx_to_np_svs(df, num_dims):
     num_dims : int
         the number of columns in df that list the dimension values for which the
         symbol value is non-zero / non-default
+    inplace : bool
+        If True, the value columns of df are replaced rather than copying df
+    raw_specials : bool
+        If True, GDX special values are kept as-is
 
     Returns
     -------
     pandas.DataFrame
-        copy of df for which all GDX special values have been converted to
-        their numpy equivalents
+        df or a copy of df for which all GDX special values have been converted 
+        to their numpy equivalents (see :py:func:`gdx_to_np_values`)
     """
-
-    # create clean copy of df
-    tmp = df.copy()
-
-    # apply the map to the value columns and merge with the dimensional information
-    tmp = (tmp.iloc[:, :num_dims]).merge(tmp.iloc[:, num_dims:].replace(GDX_TO_NP_SVS),
-                                         left_index=True, right_index=True)
-    return tmp
+    return _convert_value_columns(df, num_dims, gdx_to_np_values, inplace, raw_specials)
 
 
 def is_np_eps(val):
@@ -72,7 +164,7 @@ def is_np_sv(val):
     return np.isnan(val) or (val in NUMPY_SPECIAL_VALUES) or is_np_eps(val)
 
 
-def convert_np_to_gdx_svs(df, num_dims):
+def convert_np_to_gdx_svs(df, num_dims, inplace=False, raw_specials=False):
     """
     Converts numpy special values to the corresponding GDX versions.
 
@@ -83,28 +175,23 @@ def convert_np_to_gdx_svs(df, num_dims):
     num_dims : int
         the number of columns in df that list the dimension values for which the
         symbol value is non-zero / non-default
+    inplace : bool
+        If True, the value columns of df are replaced rather than copying df
+    raw_specials : bool
+        If True, values are left as-is
 
     Returns
     -------
     pandas.DataFrame
-        copy of df for which all numpy special values have been converted to
-        their GDX equivalents
+        df or a copy of df for which all numpy special values have been converted 
+        to their GDX equivalents (see :py:func:`np_to_gdx_values`)
     """
-
-    # get a clean copy of df
-    tmp = df.copy()
-
-    # fillna and apply map to value columns, then merge with dimensional columns
     try:
-        values = tmp.iloc[:, num_dims:].replace(NP_TO_GDX_SVS, value=None)
-        # DataFrame.replace is generally not sufficient to identify EPS values
-        values[(values - NUMPY_SPECIAL_VALUES[-1]).abs() < NUMPY_SPECIAL_VALUES[-1]] = SPECIAL_VALUES[4]
-        tmp = (tmp.iloc[:, :num_dims]).merge(values, left_index=True, right_index=True)
+        return _convert_value_columns(df, num_dims, np_to_gdx_values, inplace, raw_specials)
     except:
         logger.error("Unable to convert numpy special values to GDX special values." + \
                      "num_dims: {}, dataframe:\n{}".format(num_dims, df))
         raise
-    return tmp
 
 
 def pd_isnan(val):
@@ -209,10 +296,7 @@ def load_specials(gams_dir_finder):
     global GDX_TO_NP_SVS
     global NP_TO_GDX_SVS
 
-    H = gdxcc.new_gdxHandle_tp()
-    rc = gdxcc.gdxCreateD(H, gams_dir_finder.gams_dir, gdxcc.GMS_SSSIZE)
-    if not rc:
-        raise Exception(rc[1])
+    H = handle_pool.acquire(gams_dir_finder.gams_dir)
     # get special values
     special_values = gdxcc.doubleArray(gdxcc.GMS_SVIDX_MAX)
     gdxcc.gdxGetSpecialValues(H, special_values)
@@ -228,7 +312,7 @@ def load_specials(gams_dir_finder):
         GDX_TO_NP_SVS[gdx_val] = NUMPY_SPECIAL_VALUES[i]
         NP_TO_GDX_SVS[NUMPY_SPECIAL_VALUES[i]] = gdx_val
 
-    gdxcc.gdxFree(H)
+    handle_pool.release(H, gams_dir_finder.gams_dir)
 
 
 # These values are populated by load_specials, called in load_gdxcc
@@ -0,0 +1,45 @@
+import os
+
+import numpy as np
+import pytest
+
+import gdxpds.gdx
+from gdxpds.benchmark import memory, synthetic, throughput
+from gdxpds.test import run_dir
+from gdxpds.test.test_session import manage_rundir
+
+
+def test_synthetic(manage_rundir):
+    df = synthetic.generate_symbol('p', 'Parameter', records=500, dims=3, uels=10,
+                                   special_density=0.2)
+    assert len(df.index) == 500
+    assert not df.duplicated(subset=list(df.columns[:3])).any()
+    assert all(df[col].nunique() <= 10 for col in df.columns[:3])
+    assert 0.1 < np.mean(~np.isfinite(df['Value']) | (df['Value'] < 1e-10)) < 0.3
+
+    with pytest.raises(gdxpds.Error):
+        synthetic.generate_symbol('p', 'Parameter', records=500, dims=2, uels=10)
+
+    outdir = os.path.join(run_dir,'synthetic')
+    os.mkdir(outdir)
+    filename = os.path.join(outdir,'synthetic.gdx')
+    with synthetic.generate(filename, records=100, dims=2):
+        pass
+    dfs = gdxpds.to_dataframes(filename)
+    assert list(dfs.keys()) == ['set', 'parameter', 'variable', 'equation']
+    assert all(len(df.index) == 100 for df in dfs.values())
+
+
+def test_throughput():
+    result = throughput.run(records=100, dims=2, repeat=1)
+    assert set(result['results']) == {'write', 'write_dense', 'np_to_gdx_values', 'gdx_to_np_values', 
+                                      'read_str', 'read_raw', 'to_dataframes'}
+    assert all(res['records_per_s'] > 0 for res in result['results'].values())
+    ratios = throughput.compare(result, result)
+    assert all(ratio == 1.0 for ratio in ratios.values())
+
+
+def test_memory():
+    result = memory.run(records=100, dims=2)
+    assert {'to_dataframes', 'to_gdx'} <= set(result['results'])
+    assert all(res['peak_bytes'] > 0 for res in result['results'].values())
@@ -5,7 +5,9 @@ import gdxpds.gdx
 from gdxpds.test import base_dir, run_dir
 from gdxpds.test.test_session import manage_rundir
 
+import numpy as np
 import pandas as pd
+import pytest
 
 def roundtrip_one_gdx(filename,dirname):
     # load gdx, make map of symbols and number of records
@@ -114,4 +116,172 @@ def test_csv_roundtrip(manage_rundir):
                 cnt += 1
         break
     assert cnt == n
-    
\ No newline at end of file
+    
+
+def test_gdx_to_csv_options(manage_rundir):
+    gdx_file = os.path.join(base_dir,'OptimalCSPConfig_In.gdx')
+    expected = gdxpds.to_dataframes(gdx_file)
+    names = list(expected)
+    out_dir = os.path.join(run_dir, 'gdx_to_csv_options')
+    cmds = ['python', os.path.join(gdxpds.test.bin_prefix,'gdx_to_csv.py'),
+            '-i', gdx_file,
+            '-o', out_dir,
+            '--exclude', names[0],
+            '--workers', '2',
+            '--compression', 'gzip',
+            '--chunksize', '1000']
+    assert subp.call(cmds) == 0
+    assert sorted(os.listdir(out_dir)) == sorted(name + '.csv.gz' for name in names[1:])
+    for name in names[1:]:
+        df = pd.read_csv(os.path.join(out_dir, name + '.csv.gz'), index_col=None)
+        assert list(df.columns) == list(expected[name].columns)
+        assert len(df.index) == len(expected[name].index)
+
+    out_dir = os.path.join(run_dir, 'gdx_to_csv_symbols')
+    cmds = ['python', os.path.join(gdxpds.test.bin_prefix,'gdx_to_csv.py'),
+            '-i', gdx_file,
+            '-o', out_dir,
+            '--symbols', names[0], names[1]]
+    assert subp.call(cmds) == 0
+    assert sorted(os.listdir(out_dir)) == sorted(name + '.csv' for name in names[:2])
+
+
+def test_gdx_to_csv_zstd(manage_rundir):
+    pytest.importorskip('zstandard')
+    gdx_file = os.path.join(base_dir,'OptimalCSPConfig_In.gdx')
+    expected = gdxpds.to_dataframes(gdx_file)
+    out_dir = os.path.join(run_dir, 'gdx_to_csv_zstd')
+    cmds = ['python', os.path.join(gdxpds.test.bin_prefix,'gdx_to_csv.py'),
+            '-i', gdx_file,
+            '-o', out_dir,
+            '--compression', 'zstd']
+    assert subp.call(cmds) == 0
+    assert sorted(os.listdir(out_dir)) == sorted(name + '.csv.zst' for name in expected)
+    for name in expected:
+        df = pd.read_csv(os.path.join(out_dir, name + '.csv.zst'), index_col=None)
+        assert list(df.columns) == list(expected[name].columns)
+        assert len(df.index) == len(expected[name].index)
+
+def test_csv_to_gdx_schema(manage_rundir):
+    # a Variable and an Equation with all special values, next to the symbols 
+    # of all_generator_properties_input.gdx
+    gdx_file = os.path.join(run_dir, 'csv_to_gdx_schema_input.gdx')
+    undf, na = gdxpds.special.SPECIAL_VALUES[:2]
+    eps = gdxpds.special.NUMPY_SPECIAL_VALUES[-1]
+    with gdxpds.gdx.GdxFile(lazy_load=False) as inputs, gdxpds.gdx.GdxFile() as gdx:
+        inputs.read(os.path.join(base_dir,'all_generator_properties_input.gdx'))
+        for symbol in inputs:
+            gdx.append(symbol.clone())
+        gdx.append(gdxpds.gdx.GdxSymbol('specials_var',gdxpds.gdx.GamsDataType.Variable,
+            dims=['i'],description='Variable with special values',
+            variable_type=gdxpds.gdx.GamsVariableType.Free))
+        gdx[-1].dataframe = pd.DataFrame(
+            [['NA', np.inf, -np.inf, eps, na, 1.0],
+             ['i2', undf, 0.0, np.nan, np.inf, 1.0],
+             ['i3', eps, na, -np.inf, undf, 1.0]],
+            columns=['i'] + gdx[-1].value_col_names)
+        gdx.append(gdxpds.gdx.GdxSymbol('specials_eqn',gdxpds.gdx.GamsDataType.Equation,
+            dims=['i','j'],equation_type=gdxpds.gdx.GamsEquationType.GreaterThan))
+        gdx[-1].dataframe = pd.DataFrame(
+            [['NA', 'j1', -np.inf, eps, undf, na, 1.0],
+             ['i2', 'j2', 2.5, np.inf, -np.inf, eps, 1.0]],
+            columns=['i','j'] + gdx[-1].value_col_names)
+        gdx.write(gdx_file)
+
+    out_dir = os.path.join(run_dir, 'csv_to_gdx_schema')
+    schema = os.path.join(run_dir, 'csv_to_gdx_schema.json')
+    cmds = ['python', os.path.join(gdxpds.test.bin_prefix,'gdx_to_csv.py'),
+            '-i', gdx_file,
+            '-o', out_dir,
+            '--schema', schema]
+    assert subp.call(cmds) == 0
+
+    out_file = os.path.join(run_dir, 'csv_to_gdx_schema.gdx')
+    cmds = ['python', os.path.join(gdxpds.test.bin_prefix,'csv_to_gdx.py'),
+            '-i'] + [os.path.join(out_dir, name) for name in sorted(os.listdir(out_dir))] + [
+            '-o', out_file,
+            '--schema', schema,
+            '--workers', '2']
+    assert subp.call(cmds) == 0
+
+    def sort(symbol):
+        # by position, because dimension names such as '*' can repeat
+        df = symbol.dataframe
+        return (df.set_axis(range(len(df.columns)), axis=1)
+                  .sort_values(list(range(symbol.num_dims)))
+                  .set_axis(df.columns, axis=1).reset_index(drop=True))
+
+    with gdxpds.gdx.GdxFile(lazy_load=False, bool_set_values=True) as expected:
+        expected.read(gdx_file)
+        with gdxpds.gdx.GdxFile(lazy_load=False, bool_set_values=True) as result:
+            result.read(out_file)
+            assert [symbol.name for symbol in result] == sorted(symbol.name for symbol in expected)
+            for symbol in expected:
+                other = result[symbol.name]
+                assert other.data_type == symbol.data_type
+                assert other.dims == symbol.dims
+                assert other.description == symbol.description
+                assert other.num_records == symbol.num_records
+                # values, including special values, are kept. UNDF and NA are 
+                # both NaN in pandas.
+                pd.testing.assert_frame_equal(sort(other), sort(symbol))
+            for name in ['specials_var', 'specials_eqn']:
+                assert result[name].variable_type == expected[name].variable_type
+                assert result[name].equation_type == expected[name].equation_type
+                values = result[name].dataframe.iloc[:, len(result[name].dims):].to_numpy()
+                assert np.isinf(values).any() and np.isnan(values).any()
+                assert (values == eps).any()
+
+
+def test_infer_data_type():
+    from gdxpds.write_gdx import infer_data_type
+    df = pd.DataFrame([['a', None], ['b', 2.0]], columns=['*', 'Value'])
+    assert infer_data_type('p', df) == (gdxpds.gdx.GamsDataType.Parameter, 1)
+    df = pd.DataFrame([['a', None], ['b', 'text']], columns=['*', 'Value'])
+    assert infer_data_type('s', df) == (gdxpds.gdx.GamsDataType.Set, 1)
+
+
+def test_to_parquet_requires_pyarrow(manage_rundir, monkeypatch):
+    import sys
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    with pytest.raises(gdxpds.Error):
+        gdxpds.to_parquet(os.path.join(base_dir,'CONVqn.gdx'), os.path.join(run_dir,'no_parquet'))
+
+
+def test_to_parquet(manage_rundir):
+    pq = pytest.importorskip('pyarrow.parquet')
+    import json
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    out_dir = os.path.join(run_dir,'parquet')
+    paths = gdxpds.to_parquet(gdx_file, out_dir, chunksize=1000)
+    expected = gdxpds.to_dataframes(gdx_file, bool_set_values=True)
+    assert list(paths) == list(expected)
+    for name, path in paths.items():
+        table = pq.read_table(path)
+        metadata = json.loads(table.schema.metadata[b'gdxpds'])
+        assert metadata['name'] == name
+        assert metadata['num_records'] == len(expected[name].index)
+        df = table.to_pandas()
+        assert len(df.index) == len(expected[name].index)
+        for i in range(len(metadata['dims'])):
+            assert df.iloc[:, i].astype(str).tolist() == expected[name].iloc[:, i].astype(str).tolist()
+    assert pq.ParquetFile(paths['CONVqmnallm']).num_row_groups == 4
+
+
+def test_gdx_to_parquet(manage_rundir):
+    pq = pytest.importorskip('pyarrow.parquet')
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    expected = gdxpds.to_dataframes(gdx_file, load_set_text=True)
+    out_dir = os.path.join(run_dir,'gdx_to_parquet') + os.sep
+    cmds = ['python', os.path.join(gdxpds.test.bin_prefix,'gdx_to_parquet.py'),
+            '-i', gdx_file,
+            '-o', out_dir,
+            '--symbols', 'CONVqmnheader', 'CONVqmnallm',
+            '--chunksize', '1000',
+            '--load_set_text']
+    assert subp.call(cmds) == 0
+    assert sorted(os.listdir(out_dir)) == ['CONVqmnallm.parquet', 'CONVqmnheader.parquet']
+    assert pq.ParquetFile(os.path.join(out_dir, 'CONVqmnallm.parquet')).num_row_groups == 4
+    df = pq.read_table(os.path.join(out_dir, 'CONVqmnheader.parquet')).to_pandas()
+    # set text (empty in this file) rather than True
+    assert df.iloc[:, -1].tolist() == expected['CONVqmnheader'].iloc[:, -1].tolist()
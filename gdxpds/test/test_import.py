@@ -0,0 +1,41 @@
+import os
+import subprocess as subp
+import sys
+
+import gdxpds
+from gdxpds.benchmark import import_time
+
+package_root = os.path.dirname(os.path.dirname(os.path.abspath(gdxpds.__file__)))
+
+
+def run_python(code, monkeypatch):
+    monkeypatch.setenv('PYTHONPATH', package_root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    return subp.check_output([sys.executable, '-c', code]).decode().strip()
+
+
+def test_lazy_import(monkeypatch):
+    # importing gdxpds neither initializes gdxcc nor imports pandas
+    out = run_python("import sys, gdxpds; "
+                     "print('pandas' in sys.modules, 'gdxpds.special' in sys.modules, "
+                     "gdxpds._gdxcc_initialized)", monkeypatch)
+    assert out == 'False False False'
+
+    # but gdxcc is still initialized before pandas is imported
+    out = run_python("import sys, gdxpds; import pandas; "
+                     "print(gdxpds._gdxcc_initialized, "
+                     "len(sys.modules['gdxpds.special'].SPECIAL_VALUES) > 0)", monkeypatch)
+    assert out == 'True True'
+    # sys.modules is in import order
+    out = run_python("import sys, gdxpds; import pandas; modules = list(sys.modules); "
+                     "print(modules.index('gdxcc') < modules.index('pandas'))", monkeypatch)
+    assert out == 'True'
+
+    out = run_python("import gdxpds; print(gdxpds.gdx.GdxFile.__name__, "
+                     "gdxpds.to_dataframes.__name__)", monkeypatch)
+    assert out == 'GdxFile to_dataframes'
+
+
+def test_import_time_benchmark(monkeypatch):
+    monkeypatch.setenv('PYTHONPATH', package_root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = import_time.run(repeat=1, statements={'import gdxpds': 'import gdxpds'})
+    assert result['import gdxpds']['min_s'] > 0
@@ -1,11 +1,17 @@
+from ctypes import c_bool
 import logging
 import os
+import shutil
 
+import pandas as pd
 import pytest
 
 import gdxpds.gdx
+import gdxpds.handles
+import gdxpds.metadata
 from gdxpds import to_dataframes, list_symbols, get_data_types
-from gdxpds.test import base_dir
+from gdxpds.test import base_dir, run_dir
+from gdxpds.test.test_session import manage_rundir
 
 logger = logging.getLogger(__name__)
 
@@ -65,3 +71,469 @@ def test_unload():
         assert f['startupfuel'].loaded
         assert not f['startupfuel'].dataframe.empty
         assert 'CC' in f['startupfuel'].dataframe['*'].tolist()
+
+def test_read_engines_match():
+    for filename in ['all_generator_properties_input.gdx', 'CONVqn.gdx',
+                     'OptimalCSPConfig_In.gdx', 'OptimalCSPConfig_Out.gdx']:
+        gdx_file = os.path.join(base_dir,filename)
+        dfs = {}
+        for engine in gdxpds.gdx.READ_ENGINES:
+            with gdxpds.gdx.GdxFile(lazy_load=False,read_engine=engine) as f:
+                f.read(gdx_file)
+                dfs[engine] = {symbol.name: symbol.dataframe for symbol in f}
+        for symbol_name, df in dfs['str'].items():
+            other = dfs['raw'][symbol_name]
+            if len(df.index) and isinstance(df.iloc[0,-1], c_bool):
+                # c_bool(True) != c_bool(True), so compare the underlying values
+                df = df.copy(); other = other.copy()
+                df[df.columns[-1]] = [x.value for x in df.iloc[:,-1]]
+                other[other.columns[-1]] = [x.value for x in other.iloc[:,-1]]
+            pd.testing.assert_frame_equal(df, other)
+
+def test_read_raw_set_text():
+    filename = 'CONVqn.gdx'
+    gdx_file = os.path.join(base_dir,filename)
+    dfs = {}
+    for engine in gdxpds.gdx.READ_ENGINES:
+        with gdxpds.gdx.GdxFile(read_engine=engine) as f:
+            f.read(gdx_file)
+            f['CONVqmnheader'].load(load_set_text=True)
+            dfs[engine] = f['CONVqmnheader'].dataframe
+    pd.testing.assert_frame_equal(dfs['str'], dfs['raw'])
+
+def test_categorical_dims():
+    filename = 'CONVqn.gdx'
+    gdx_file = os.path.join(base_dir,filename)
+    dfs = to_dataframes(gdx_file)
+    cat_dfs = to_dataframes(gdx_file,categorical_dims=True)
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        uels = list(f.uels)
+        num_dims = {symbol.name: symbol.num_dims for symbol in f}
+    for symbol_name, df in dfs.items():
+        cat_df = cat_dfs[symbol_name]
+        assert list(cat_df.columns) == list(df.columns)
+        for i in range(num_dims[symbol_name]):
+            col = cat_df.iloc[:,i]
+            assert isinstance(col.dtype, pd.CategoricalDtype)
+            assert list(col.cat.categories) == uels
+            assert col.astype(object).tolist() == df.iloc[:,i].tolist()
+        if df.columns[-1] == 'Value' and num_dims[symbol_name] and len(df.index):
+            if not isinstance(df.iloc[0,-1], c_bool):
+                assert cat_df['Value'].equals(df['Value'])
+
+    df = gdxpds.to_dataframe(gdx_file,'CONVqmnallm',old_interface=False,categorical_dims=True)
+    assert isinstance(df.iloc[:,0].dtype, pd.CategoricalDtype)
+
+def test_read_selected():
+    filename = 'OptimalCSPConfig_Out.gdx'
+    gdx_file = os.path.join(base_dir,filename)
+
+    dfs = to_dataframes(gdx_file,symbols=['NetLoad','obj'])
+    assert list(dfs.keys()) == ['NetLoad','obj']
+    assert len(dfs['NetLoad'].index) == 8760
+
+    dfs = to_dataframes(gdx_file,data_types=gdxpds.gdx.GamsDataType.Equation)
+    dtypes = get_data_types(gdx_file)
+    expected = [name for name, dtype in dtypes.items() if dtype == gdxpds.gdx.GamsDataType.Equation]
+    assert list(dfs.keys()) == expected
+
+    dfs = to_dataframes(gdx_file,symbols=['NetLoad','obj'],data_types=['Variable'])
+    assert list(dfs.keys()) == ['NetLoad']
+
+    with pytest.raises(gdxpds.tools.Error) as excinfo:
+        to_dataframes(gdx_file,symbols=['NetLoad','not_a_symbol'])
+    assert "not_a_symbol" in str(excinfo.value)
+
+def test_iter_chunks():
+    filename = 'OptimalCSPConfig_Out.gdx'
+    gdx_file = os.path.join(base_dir,filename)
+    for engine in gdxpds.gdx.READ_ENGINES:
+        with gdxpds.gdx.GdxFile(read_engine=engine) as f:
+            f.read(gdx_file)
+            for symbol_name in ['NetLoad','obj']:
+                chunks = list(f[symbol_name].iter_chunks(chunksize=1000))
+                assert not f[symbol_name].loaded
+                assert all(len(chunk.index) <= 1000 for chunk in chunks)
+                assert len(set(tuple(chunk.dtypes) for chunk in chunks)) == 1
+                f[symbol_name].load()
+                pd.testing.assert_frame_equal(
+                    pd.concat(chunks), 
+                    f[symbol_name].dataframe)
+
+    chunks = list(gdxpds.iter_dataframe(gdx_file,'NetLoad',chunksize=5000))
+    assert [len(chunk.index) for chunk in chunks] == [5000, 3760]
+
+    gdx_file = os.path.join(base_dir,'OptimalCSPConfig_In.gdx')
+    chunks = list(gdxpds.iter_dataframe(gdx_file,'top',chunksize=30,bool_set_values=True))
+    assert len(chunks) == 4
+    assert all(chunk['Value'].dtype == bool for chunk in chunks)
+    chunks = list(gdxpds.iter_dataframe(gdx_file,'top',chunksize=30))
+    assert isinstance(chunks[0]['Value'].values[0], c_bool)
+
+
+def test_filtered_load(monkeypatch):
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    full = gdxpds.to_dataframe(gdx_file,'CONVqmnallm',old_interface=False)
+    expected = full[(full['bigQ'] == 'reqt') & full['m'].isin(['H17'])].reset_index(drop=True)
+    assert len(expected.index) == 28
+
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        f['CONVqmnallm'].load(filters={'bigQ': ['reqt'], 3: 'H17'})
+        pd.testing.assert_frame_equal(f['CONVqmnallm'].dataframe, expected)
+        with pytest.raises(gdxpds.Error):
+            f['CONVqmnallm'].load(filters={'bigQ': ['reqt']})
+        f['CONVqmnallm'].unload()
+        f['CONVqmnallm'].load(filters={'m': ['not_a_label']})
+        assert f['CONVqmnallm'].num_records == 0
+        f['CONVqmnallm'].unload()
+        # 't' is not a dimension
+        with pytest.raises(gdxpds.Error):
+            f['CONVqmnallm'].load(filters={'t': [2030]})
+        # an empty filter is an unfiltered read
+        f['CONVqmnallm'].load(filters={})
+        pd.testing.assert_frame_equal(f['CONVqmnallm'].dataframe, full)
+        f['CONVqmnallm'].unload()
+
+    # a failed filtered read leaves the handle usable
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        with monkeypatch.context() as m:
+            m.setattr(gdxpds.gdx.gdxcc, 'gdxUELRegisterMap', lambda *args: 0)
+            with pytest.raises(gdxpds.gdx.GdxError):
+                f['CONVqmnallm'].load(filters={'bigQ': ['reqt']})
+        f['CONVqmnallm'].load()
+        pd.testing.assert_frame_equal(f['CONVqmnallm'].dataframe, full)
+        f['CONVqmnallm'].unload()
+        f['CONVqmnallm'].load(filters={'bigQ': ['reqt']})
+        assert f['CONVqmnallm'].num_records == (full['bigQ'] == 'reqt').sum()
+
+    # filters of a scalar select its record
+    gdx_file = os.path.join(base_dir,'OptimalCSPConfig_In.gdx')
+    expected = gdxpds.to_dataframe(gdx_file,'fcr',old_interface=False)
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        f['fcr'].load(filters={})
+        pd.testing.assert_frame_equal(f['fcr'].dataframe, expected)
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+
+    # labels of any type are compared as str(label)
+    expected = full[full['allyears'].isin(['2010','2012'])].reset_index(drop=True)
+    for labels in [[2010, 2012], ['2010', '2012'], [2010, '2012', 'not_a_label']]:
+        df = gdxpds.to_dataframe(gdx_file,'CONVqmnallm',old_interface=False,
+                                 filters={'allyears': labels})
+        pd.testing.assert_frame_equal(df, expected)
+    df = gdxpds.to_dataframe(gdx_file,'CONVqmnallm',old_interface=False,
+                             filters={'allyears': [2010.0]})
+    assert len(df.index) == 0
+
+
+def test_parallel_load():
+    for filename in ['CONVqn.gdx', 'OptimalCSPConfig_In.gdx']:
+        gdx_file = os.path.join(base_dir,filename)
+        expected = to_dataframes(gdx_file,bool_set_values=True)
+        dfs = to_dataframes(gdx_file,bool_set_values=True,workers=2)
+        assert list(dfs.keys()) == list(expected.keys())
+        for name in expected:
+            pd.testing.assert_frame_equal(dfs[name], expected[name])
+
+        with gdxpds.gdx.GdxFile(lazy_load=False,workers=2) as f:
+            f.read(gdx_file)
+            assert [symbol.name for symbol in f] == list(expected.keys())
+            assert all(symbol.loaded for symbol in f)
+            assert isinstance(f['top' if 'top' in f else 'CONVqmnheader'].dataframe.iloc[0,-1], c_bool)
+
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    dfs = to_dataframes(gdx_file,load_set_text=True,workers=2)
+    expected = to_dataframes(gdx_file,load_set_text=True)
+    pd.testing.assert_frame_equal(dfs['CONVqmnheader'], expected['CONVqmnheader'])
+
+
+def test_read_many():
+    paths = [os.path.join(base_dir,filename) for filename in 
+             ['OptimalCSPConfig_Out.gdx', 'OptimalCSPConfig_In.gdx']]
+    expected = {path: to_dataframes(path,bool_set_values=True) for path in paths}
+    for workers in [None, 2]:
+        results = gdxpds.read_many(paths,workers=workers,bool_set_values=True)
+        assert list(results.keys()) == paths
+        for path in paths:
+            assert list(results[path].keys()) == list(expected[path].keys())
+            for name, df in expected[path].items():
+                pd.testing.assert_frame_equal(results[path][name], df)
+
+    results = gdxpds.read_many(paths[:1] * 2,symbols=['obj'],workers=2)
+    assert list(results[paths[0]].keys()) == ['obj']
+    with pytest.raises(gdxpds.Error):
+        gdxpds.read_many(paths,symbols=['obj'],workers=2)
+
+
+def test_metadata_cache(manage_rundir, monkeypatch):
+    outdir = os.path.join(run_dir,'metadata_cache')
+    gdx_file = os.path.join(outdir,'OptimalCSPConfig_Out.gdx')
+    os.makedirs(outdir)
+    shutil.copy(os.path.join(base_dir,'OptimalCSPConfig_Out.gdx'), gdx_file)
+    cache = gdxpds.metadata.MetadataCache(os.path.join(outdir,'cache'))
+    assert cache.get(gdx_file) is None
+    assert list_symbols(gdx_file,metadata_cache=cache) == list_symbols(gdx_file)
+    assert cache.get(gdx_file) is not None
+
+    # unchanged file is served from the cache without touching gdxcc
+    def fail(*args, **kwargs):
+        raise AssertionError("GDX file should not be read")
+    monkeypatch.setattr(gdxpds.metadata, 'read_metadata', fail)
+    assert get_data_types(gdx_file,metadata_cache=cache) == get_data_types(gdx_file)
+    symbols = {symbol['name']: symbol for symbol in cache.symbols(gdx_file)}
+    assert symbols['NetLoad']['num_records'] == 8760
+
+    # changed file is a cache miss
+    shutil.copy(os.path.join(base_dir,'OptimalCSPConfig_In.gdx'), gdx_file)
+    assert cache.get(gdx_file) is None
+    monkeypatch.undo()
+    assert list_symbols(gdx_file,metadata_cache=cache) == list_symbols(gdx_file)
+
+
+def test_handle_pool():
+    gdx_file = os.path.join(base_dir,'OptimalCSPConfig_Out.gdx')
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        H = f.H
+    assert f.H is None
+    f.cleanup()
+    # the closed handle is reused, and is in a clean state
+    with gdxpds.gdx.GdxFile() as f:
+        assert f.H is H
+        f.read(os.path.join(base_dir,'CONVqn.gdx'))
+        assert 'CONVqmnallm' in f
+        f['CONVqmnallm'].load()
+
+    pool = gdxpds.handles.HandlePool(max_size=1)
+    handles = [pool.acquire(f.gams_dir) for _i in range(2)]
+    for handle in handles:
+        pool.release(handle, f.gams_dir)
+    assert pool.num_idle == 1
+    pool.clear()
+    assert pool.num_idle == 0
+
+
+def test_memory_usage():
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    for categorical_dims in [False, True]:
+        with gdxpds.gdx.GdxFile(categorical_dims=categorical_dims) as f:
+            f.read(gdx_file)
+            estimated = f.memory_report()
+            assert not estimated['loaded'].any()
+            f.load_symbols()
+            actual = f.memory_report()
+            assert actual['loaded'].all()
+            assert (actual['bytes'] == [symbol.dataframe.memory_usage(deep=True).sum() for symbol in f]).all()
+            ratio = estimated['bytes'] / actual['bytes']
+            assert ((ratio > 0.9) & (ratio < 1.1)).all()
+
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        symbol = f['CONVqmnallm']
+        with pytest.raises(gdxpds.Error):
+            symbol.load(max_bytes=symbol.memory_usage() // 2)
+        assert not symbol.loaded
+        symbol.load(max_bytes=symbol.memory_usage() * 2)
+        assert symbol.loaded
+
+
+def test_instrumentation(manage_rundir):
+    from gdxpds import instrumentation
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    for engine in gdxpds.gdx.READ_ENGINES:
+        with instrumentation.Recorder() as recorder:
+            with gdxpds.gdx.GdxFile(read_engine=engine) as f:
+                f.read(gdx_file)
+                for symbol in f:
+                    symbol.load()
+                with f.clone() as g:
+                    g.write(os.path.join(run_dir, f'instrumentation_{engine}.gdx'))
+        spans = recorder.to_dataframe()
+        assert set(spans['name']) <= set(instrumentation.SPAN_NAMES)
+        assert {'load', 'read_records', 'build_dataframe', 'convert_specials',
+                'write', 'prepare_values', 'write_records'} <= set(spans['name'])
+        load = spans[(spans['name'] == 'load') & (spans['symbol'] == 'CONVqmnallm')].iloc[0]
+        assert load['records'] == 3914
+        assert load['bytes'] > 0
+        assert (spans['duration_s'] >= 0).all()
+        n = len(recorder.spans)
+        with gdxpds.gdx.GdxFile(read_engine=engine) as f:
+            f.read(gdx_file)
+            f['CONVqmnallm'].load()
+        assert len(recorder.spans) == n
+    assert not instrumentation.enabled()
+
+
+def test_memory_budget():
+    gdx_file = os.path.join(base_dir,'CONVqn.gdx')
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(gdx_file)
+        f.load_symbols()
+        sizes = {symbol.name: symbol.memory_usage() for symbol in f}
+        expected = {symbol.name: symbol.dataframe.copy() for symbol in f}
+
+    names = sorted(sizes, key=sizes.get, reverse=True)[:3]
+    budget = sizes[names[0]] + sizes[names[1]]
+    with gdxpds.gdx.GdxFile(memory_budget=budget) as f:
+        f.read(gdx_file)
+        for name in names:
+            f[name].load()
+        # the least recently used symbol made room for the last one
+        assert f[names[0]].evicted and not f[names[0]].loaded
+        assert f[names[1]].loaded and f[names[2]].loaded
+        assert f.resident_bytes <= budget
+
+        # transparent reload, which evicts the least recently used in turn
+        pd.testing.assert_frame_equal(f[names[0]].dataframe, expected[names[0]])
+        assert f[names[0]].loaded and not f[names[0]].evicted
+        assert f[names[1]].evicted
+
+        # modified symbols are pinned
+        df = f[names[2]].dataframe.copy()
+        df['Value'] = df['Value'] * 2
+        f[names[2]].dataframe = df
+        assert f[names[2]].dirty
+        f[names[1]].load()
+        assert not f[names[2]].evicted
+        pd.testing.assert_frame_equal(f[names[2]].dataframe, df)
+
+        f[names[1]].unload()
+        assert not f[names[1]].evicted
+        assert f[names[1]] not in f._resident
+
+
+def test_symbol_cache(manage_rundir):
+    from gdxpds.cache import SymbolCache
+    gdx_file = os.path.join(run_dir, 'symbol_cache.gdx')
+    shutil.copyfile(os.path.join(base_dir,'CONVqn.gdx'), gdx_file)
+    cache = SymbolCache()
+
+    df = gdxpds.to_dataframe(gdx_file, 'CONVqmnallm', old_interface=False, cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+    df['Value'] = 0.0
+    again = gdxpds.to_dataframe(gdx_file, 'CONVqmnallm', old_interface=False, cache=cache)
+    assert cache.hits == 1
+    expected = gdxpds.to_dataframe(gdx_file, 'CONVqmnallm', old_interface=False)
+    pd.testing.assert_frame_equal(again, expected)
+
+    # different load options are cached separately
+    gdxpds.to_dataframe(gdx_file, 'CONVqmnallm', cache=cache, filters={'m': ['April']})
+    assert len(cache) == 2
+
+    # all listed symbols cached: served without opening the file
+    symbols = ['CONVqnallyears', 'CONVqmnallm']
+    dfs = gdxpds.to_dataframes(gdx_file, symbols=symbols, cache=cache)
+    assert list(dfs) == symbols
+    hits = cache.hits
+    dfs = gdxpds.to_dataframes(gdx_file, symbols=symbols, cache=cache)
+    assert cache.hits == hits + 2
+    assert cache.nbytes == sum(entry[1] for entry in cache._entries.values())
+
+    # a changed file invalidates its entries
+    stat = os.stat(gdx_file)
+    os.utime(gdx_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    misses = cache.misses
+    gdxpds.to_dataframe(gdx_file, 'CONVqmnallm', cache=cache)
+    assert cache.misses == misses + 1
+    assert len(cache) == 1
+
+    # bounded by bytes
+    small = SymbolCache(max_bytes=cache.nbytes - 1)
+    gdxpds.to_dataframe(gdx_file, 'CONVqmnallm', cache=small)
+    assert len(small) == 0
+    gdxpds.to_dataframes(gdx_file, cache=small)
+    assert 0 < small.nbytes <= small.max_bytes
+
+
+def test_pyarrow_dtype_backend(manage_rundir):
+    pa = pytest.importorskip('pyarrow')
+    for filename in ['OptimalCSPConfig_In.gdx', 'OptimalCSPConfig_Out.gdx']:
+        gdx_file = os.path.join(base_dir,filename)
+        expected = to_dataframes(gdx_file, bool_set_values=True)
+        dfs = to_dataframes(gdx_file, dtype_backend='pyarrow')
+        assert list(dfs) == list(expected)
+        for name, df in dfs.items():
+            assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes), name
+            num_dims = sum(pa.types.is_dictionary(dtype.pyarrow_dtype) for dtype in df.dtypes)
+            assert num_dims == len(expected[name].columns) - (1 if expected[name].columns[-1] == 'Value' else 5)
+            # same data once converted back to numpy
+            converted = df.astype({col: (str if i < num_dims else dtype.numpy_dtype) 
+                                   for i, (col, dtype) in enumerate(df.dtypes.items())})
+            pd.testing.assert_frame_equal(converted, expected[name])
+
+        # loaded frames are written just as numpy ones are
+        out_files = {}
+        for dtype_backend in gdxpds.gdx.DTYPE_BACKENDS:
+            with gdxpds.gdx.GdxFile(bool_set_values=True, dtype_backend=dtype_backend) as f:
+                f.read(gdx_file)
+                f.load_symbols()
+                out_files[dtype_backend] = os.path.join(run_dir, f'{dtype_backend}_{filename}')
+                with f.clone() as g:
+                    g.write(out_files[dtype_backend])
+        written = to_dataframes(out_files['numpy'], bool_set_values=True)
+        for name, df in to_dataframes(out_files['pyarrow'], bool_set_values=True).items():
+            pd.testing.assert_frame_equal(df, written[name])
+
+    df = gdxpds.to_dataframe(gdx_file, 'z', old_interface=False, dtype_backend='pyarrow')
+    assert isinstance(df.dtypes.iloc[-1], pd.ArrowDtype)
+
+
+def test_to_numpy_dense(manage_rundir, monkeypatch):
+    import sys
+    import numpy as np
+    out_file = os.path.join(run_dir, 'dense.gdx')
+    with gdxpds.gdx.GdxFile() as f:
+        gdxpds.gdx.append_set(f, 'i', pd.DataFrame({'i': ['a', 'b', 'c']}))
+        gdxpds.gdx.append_parameter(f, 'p', pd.DataFrame(
+            [['c', 'x', 3.0], ['a', 'y', 1.0], ['a', 'x', 2.0]], columns=['i', '*', 'Value']))
+        f.write(out_file)
+
+    expected = np.array([[2.0, 1.0], [0.0, 0.0], [3.0, 0.0]])
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(out_file)
+        p = f['p']
+        # domain set labels for 'i', labels used for '*'
+        assert [list(labels) for labels in p.dense_coords()] == [['a', 'b', 'c'], ['x', 'y']]
+        np.testing.assert_array_equal(p.to_numpy_dense(), expected)
+        assert not p.loaded
+        p.load()
+        np.testing.assert_array_equal(p.to_numpy_dense(), expected)
+        np.testing.assert_array_equal(p.to_numpy_dense(fill_value=np.nan, coords={'*': ['y']}), 
+                                      [[1.0], [np.nan], [np.nan]])
+        np.testing.assert_array_equal(f['i'].to_numpy_dense(coords=[['b', 'd']]), [True, False])
+        with pytest.raises(gdxpds.Error):
+            p.to_numpy_dense(max_bytes=8)
+        with pytest.raises(gdxpds.Error):
+            p.to_numpy_dense(value_col='Level')
+
+    # matches the pivoted dataframe
+    with gdxpds.gdx.GdxFile(lazy_load=False) as f:
+        f.read(os.path.join(base_dir, 'OptimalCSPConfig_Out.gdx'))
+        symbol = f['NetLoad']
+        dense = symbol.to_numpy_dense(value_col='Marginal')
+        [labels] = symbol.dense_coords()
+        df = symbol.dataframe
+        np.testing.assert_array_equal(dense, df.set_index('*').loc[labels, 'Marginal'].to_numpy())
+        assert f['z'].to_numpy_dense() == f['z'].dataframe['Level'].iloc[0]
+
+        monkeypatch.setitem(sys.modules, 'xarray', None)
+        with pytest.raises(gdxpds.Error):
+            symbol.to_xarray()
+
+
+def test_to_xarray(manage_rundir):
+    pytest.importorskip('xarray')
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(os.path.join(base_dir, 'CONVqn.gdx'))
+        symbol = f['Upgradeqnallyears']
+        da = symbol.to_xarray()
+        assert da.name == symbol.name
+        assert list(da.dims) == ['bigQ_0', 'bigQ_1', 'n', 'allyears']
+        assert da.attrs['domain'] == symbol.dims
+        symbol.load()
+        for _i, row in symbol.dataframe.iterrows():
+            assert da.sel(bigQ_0=row.iloc[0], bigQ_1=row.iloc[1], n=row.iloc[2], 
+                          allyears=row.iloc[3]).item() == row['Value']
@@ -137,4 +137,30 @@ def test_convert_np_to_gdx_svs_eps():
     result_df = gdxpds.special.convert_np_to_gdx_svs(test_df, num_dims=1)
     expected_df = pd.Series([gdxpds.special.SPECIAL_VALUES[4], 0.0, 2.0 * np.finfo(float).eps])
     assert result_df["Value"].equals(expected_df)
-    
\ No newline at end of file
+    
+def test_special_value_arrays():
+    np_values = np.array([np.nan, np.inf, -np.inf, np.finfo(float).eps, 0.0, 2.5])
+    gdx_values = gdxpds.special.np_to_gdx_values(np_values.copy())
+    sv = gdxpds.special.SPECIAL_VALUES
+    assert list(gdx_values) == [sv[1], sv[2], sv[3], sv[4], 0.0, 2.5]
+    # conversion happens in place, and back again
+    result = gdxpds.special.gdx_to_np_values(gdx_values)
+    assert result is gdx_values
+    for val, expected in zip(result, np_values):
+        assert gdxpds.special.pd_val_equal(val, expected)
+    # undefined cannot be held as None in a float array
+    assert np.isnan(gdxpds.special.gdx_to_np_values(np.array([sv[0]]))[0])
+    # raw_specials leaves the sentinels alone
+    raw = np.array(sv)
+    assert list(gdxpds.special.gdx_to_np_values(raw.copy(), raw_specials=True)) == sv
+
+def test_raw_specials(manage_rundir):
+    filename = 'OptimalCSPConfig_Out.gdx'
+    gdx_file = os.path.join(base_dir,filename)
+    for engine in gdxpds.gdx.READ_ENGINES:
+        with gdxpds.gdx.GdxFile(read_engine=engine,raw_specials=True) as f:
+            f.read(gdx_file)
+            sym = f['CapacityValue']
+            sym.load()
+            val = sym.dataframe.iloc[0,value_column_index(sym,gdxpds.gdx.GamsValueType.Upper)]
+            assert val in gdxpds.special.SPECIAL_VALUES
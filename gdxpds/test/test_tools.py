@@ -0,0 +1,47 @@
+import os
+import stat
+import subprocess as subp
+
+import pytest
+
+from gdxpds.test import run_dir
+from gdxpds.test.test_session import manage_rundir
+from gdxpds.tools import GamsDirFinder
+
+
+def no_subprocess(*args, **kwargs):
+    raise AssertionError("GAMS directory search should not spawn a subprocess")
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="uses a POSIX 'which gams' stand-in")
+def test_gams_dir_discovery_is_cached(manage_rundir, monkeypatch):
+    outdir = os.path.join(run_dir,'gams_dir_discovery')
+    fake_gams_dir = os.path.join(outdir,'gams')
+    os.makedirs(fake_gams_dir)
+    fake_gams = os.path.join(fake_gams_dir,'gams')
+    with open(fake_gams, 'w') as f:
+        f.write('#!/bin/sh\n')
+    os.chmod(fake_gams, os.stat(fake_gams).st_mode | stat.S_IEXEC)
+    expected = os.path.realpath(fake_gams_dir)
+
+    monkeypatch.delenv('GAMS_DIR', raising=False)
+    monkeypatch.delenv('GAMSDIR', raising=False)
+    monkeypatch.setenv('PATH', fake_gams_dir + os.pathsep + os.environ.get('PATH', ''))
+    monkeypatch.setenv('GDXPDS_CACHE_DIR', os.path.join(outdir,'cache'))
+    monkeypatch.setattr(GamsDirFinder, '_found', {})
+    monkeypatch.setattr(GamsDirFinder, 'gams_dir_cache', None)
+
+    # memoized in this process
+    assert GamsDirFinder().gams_dir == expected
+    with monkeypatch.context() as m:
+        m.setattr(subp, 'check_output', no_subprocess)
+        assert GamsDirFinder().gams_dir == expected
+
+    # and, if enabled, on disk for the next process
+    monkeypatch.setenv('GDXPDS_GAMS_DIR_CACHE', '1')
+    GamsDirFinder.clear_cache()
+    assert GamsDirFinder().gams_dir == expected
+    GamsDirFinder.clear_cache()
+    with monkeypatch.context() as m:
+        m.setattr(subp, 'check_output', no_subprocess)
+        assert GamsDirFinder().gams_dir == expected
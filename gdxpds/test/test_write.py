@@ -353,3 +353,139 @@ def test_parameter_with_nulls(manage_rundir):
         assert gdx[-1].dataframe['Value'].isnull().values.any()
 
         gdx.write(os.path.join(outdir, 'parameter_with_nulls_test.gdx'))
+
+
+def test_bool_set_values(manage_rundir):
+    outdir = os.path.join(run_dir,'bool_set_values')
+    if not os.path.exists(outdir):
+        os.mkdir(outdir)
+
+    data = pd.DataFrame([['u' + str(i)] for i in range(1,11)],columns=['u'])
+    data['Value'] = True
+    filenames = {}
+    for bool_set_values in [False, True]:
+        filenames[bool_set_values] = os.path.join(outdir,f'my_set_{bool_set_values}.gdx')
+        with gdxpds.gdx.GdxFile(bool_set_values=bool_set_values) as gdx:
+            gdx.append(gdxpds.gdx.GdxSymbol('my_set',gdxpds.gdx.GamsDataType.Set,dims=['u']))
+            gdx[-1].dataframe = data
+            values = gdx[-1].dataframe['Value']
+            if bool_set_values:
+                assert values.dtype == bool
+            else:
+                assert isinstance(values.values[0], c_bool)
+            gdx.write(filenames[bool_set_values])
+
+    for bool_set_values in [False, True]:
+        for engine in gdxpds.gdx.READ_ENGINES:
+            with gdxpds.gdx.GdxFile(lazy_load=False,read_engine=engine,bool_set_values=True) as gdx:
+                gdx.read(filenames[bool_set_values])
+                df = gdx['my_set'].dataframe
+                assert df['Value'].dtype == bool
+                assert df['Value'].all()
+                assert df['u'].tolist() == data['u'].tolist()
+
+    df = gdxpds.to_dataframe(filenames[True],'my_set',old_interface=False)
+    assert isinstance(df['Value'].values[0], c_bool)
+
+
+def test_set_dataframe_without_copy(manage_rundir):
+    outdir = os.path.join(run_dir,'set_dataframe_without_copy')
+    if not os.path.exists(outdir):
+        os.mkdir(outdir)
+
+    df = pd.DataFrame([['u1','CC',8727.2],
+                       ['u2','CC',7500.2],
+                       ['u3','CT',9258.0]],
+                      columns=['u','q','Value'])
+    with gdxpds.gdx.GdxFile() as gdx:
+        gdx.append(gdxpds.gdx.GdxSymbol('adopted',gdxpds.gdx.GamsDataType.Parameter,dims=['u','q']))
+        gdx[-1].set_dataframe(df, copy=False)
+        assert gdx[-1].dataframe is df
+        gdx.append(gdxpds.gdx.GdxSymbol('copied',gdxpds.gdx.GamsDataType.Parameter,dims=['u','q']))
+        gdx[-1].set_dataframe(df)
+        assert gdx[-1].dataframe is not df
+        gdxpds.gdx.append_parameter(gdx, 'appended', df, copy=False)
+        assert np.shares_memory(gdx[-1].dataframe['Value'].values, df['Value'].values)
+        gdx.write(os.path.join(outdir,'set_dataframe_without_copy.gdx'))
+
+    gdx = gdxpds.to_gdx({'to_gdx': df}, os.path.join(outdir,'to_gdx_without_copy.gdx'), copy=False)
+    assert gdx['to_gdx'].dataframe is df
+
+    dfs = gdxpds.to_dataframes(os.path.join(outdir,'set_dataframe_without_copy.gdx'))
+    for symbol_name in ['adopted','copied','appended']:
+        assert dfs[symbol_name]['Value'].tolist() == df['Value'].tolist()
+
+
+def test_dense_parameter(manage_rundir):
+    outdir = os.path.join(run_dir,'dense_parameter')
+    if not os.path.exists(outdir):
+        os.mkdir(outdir)
+
+    values = np.array([[1.0, 0.0, np.inf], [0.0, np.nan, 2.5]])
+    coords = [['u1', 'u2'], [2030, 2040, 2050]]
+    expected = pd.DataFrame([['u1','2030',1.0],
+                             ['u1','2050',np.inf],
+                             ['u2','2040',np.nan],
+                             ['u2','2050',2.5]],
+                            columns=['u','t','Value'])
+    with gdxpds.gdx.GdxFile() as gdx:
+        gdxpds.gdx.append_dense_parameter(gdx, 'dense', values, coords, dim_names=['u','t'])
+        symbol = gdx[-1]
+        assert symbol.num_records == 4
+        np.testing.assert_array_equal(symbol.to_numpy_dense(), values)
+        gdxpds.gdx.append_dense_parameter(gdx, 'all_cells', values, coords, skip_value=None)
+        assert gdx[-1].num_records == 6
+        gdxpds.gdx.append_dense_parameter(gdx, 'scalar', np.array(3.0), [])
+        # NaN cells are skipped with skip_value=np.nan, zeros are then records
+        gdxpds.gdx.append_dense_parameter(gdx, 'skip_nan', values, coords, 
+            dim_names=['u','t'], skip_value=np.nan)
+        assert gdx[-1].num_records == 5
+        # labels that are already in the file, against the order of their codes
+        gdxpds.gdx.append_dense_parameter(gdx, 'reversed', values[::-1, ::-1], 
+            [['u2', 'u1'], [2050, 2040, 2030]], dim_names=['u','t'])
+        with pytest.raises(Error):
+            gdxpds.gdx.append_dense_parameter(gdx, 'bad', values, [['u1'], [1, 2, 3]])
+        with pytest.raises(Error):
+            gdx['all_cells'].set_dense(values, [['u1', 'u1'], [1, 2, 3]])
+        cloned = symbol.clone()
+        gdx.write(os.path.join(outdir,'dense.gdx'))
+        # the records are only built if asked for
+        pd.testing.assert_frame_equal(symbol.dataframe, expected)
+    with gdxpds.gdx.GdxFile() as gdx:
+        gdx.append(cloned)
+        gdx.write(os.path.join(outdir,'cloned.gdx'))
+
+    # records come back in the order of the labels in the file
+    def sort(df):
+        return df.sort_values(['u','t']).reset_index(drop=True)
+    dfs = gdxpds.to_dataframes(os.path.join(outdir,'dense.gdx'))
+    pd.testing.assert_frame_equal(sort(dfs['dense']), expected)
+    assert len(dfs['all_cells'].index) == 6
+    assert dfs['scalar']['Value'].tolist() == [3.0]
+    assert sort(dfs['skip_nan'])['Value'].tolist() == [1.0, 0.0, np.inf, 0.0, 2.5]
+    pd.testing.assert_frame_equal(sort(dfs['reversed']), expected)
+    df = gdxpds.to_dataframe(os.path.join(outdir,'cloned.gdx'), 'dense', old_interface=False)
+    pd.testing.assert_frame_equal(sort(df), expected)
+
+
+def test_dense_parameter_from_xarray(manage_rundir):
+    pytest.importorskip('xarray')
+    outdir = os.path.join(run_dir,'dense_parameter')
+    if not os.path.exists(outdir):
+        os.mkdir(outdir)
+
+    with gdxpds.gdx.GdxFile() as f:
+        f.read(os.path.join(base_dir,'CONVqn.gdx'))
+        da = f['CONVqmnallm'].to_xarray()
+        with gdxpds.gdx.GdxFile() as gdx:
+            gdxpds.gdx.append_dense_parameter(gdx, 'CONVqmnallm', da)
+            gdx.write(os.path.join(outdir,'from_xarray.gdx'))
+        f['CONVqmnallm'].load()
+        expected = f['CONVqmnallm'].dataframe
+
+    df = gdxpds.to_dataframe(os.path.join(outdir,'from_xarray.gdx'), 'CONVqmnallm', 
+                             old_interface=False)
+    assert list(df.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        df.sort_values(list(df.columns[:-1])).reset_index(drop=True),
+        expected.sort_values(list(expected.columns[:-1])).reset_index(drop=True))
@@ -1,5 +1,8 @@
+import hashlib
+import json
 import logging
 import os
+from pathlib import Path
 import subprocess as subp
 import re
 
@@ -11,6 +14,29 @@ class Error(Exception):
     Base class for all Exceptions raised by this package.
     """
 
+def get_cache_dir(subdir=None):
+    """
+    Returns the directory used for gdxpds's optional on-disk caches: the 
+    'GDXPDS_CACHE_DIR' environment variable if set, otherwise 'gdxpds' in 
+    'XDG_CACHE_HOME' or '~/.cache'. The directory is not created.
+
+    Parameters
+    ----------
+    subdir : None or str
+        If not None, the name of a sub-directory of the cache directory to return
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    ret = os.environ.get('GDXPDS_CACHE_DIR')
+    if not ret:
+        ret = os.path.join(os.environ.get('XDG_CACHE_HOME') or 
+                           os.path.join(os.path.expanduser('~'), '.cache'), 'gdxpds')
+    ret = Path(ret)
+    return ret if subdir is None else ret / subdir
+
+
 class GamsDirFinder(object):
     """
     Class for finding and accessing the system's GAMS directory. 
@@ -23,8 +49,15 @@ class GamsDirFinder(object):
     You can always specify the GAMS directory directly, and this class will attempt 
     to clean up your input. (Even on Windows, the GAMS path must use '/' rather than 
     '\'.)
+
+    Search results are memoized per process, keyed by the 'GAMS_DIR', 'GAMSDIR' 
+    and 'PATH' environment variables, so only the first search runs 'which gams' 
+    or 'where gams'. If the 'GDXPDS_GAMS_DIR_CACHE' environment variable is set 
+    to a value other than '0', the result of that search is also kept in 
+    :py:func:`get_cache_dir`, keyed by 'PATH', and reused by later processes.
     """
     gams_dir_cache = None
+    _found = {}
 
     def __init__(self,gams_dir=None):
         self.gams_dir = gams_dir
@@ -60,7 +93,41 @@ class GamsDirFinder(object):
         ret = re.sub('\\\\','/',ret)
         return ret
         
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forgets the memoized search results of this process. The on-disk 
+        cache, if any, is left in place.
+        """
+        cls._found = {}
+
     def __find_gams(self):
+        """
+        Returns the memoized result of :py:meth:`__search_gams` for the current 
+        environment, searching if there is none.
+
+        Returns
+        -------
+        str or None
+            If not None, the found gams_dir
+        """
+        key = tuple(os.environ.get(name) for name in ('GAMS_DIR', 'GAMSDIR', 'PATH'))
+        if key in GamsDirFinder._found:
+            ret = GamsDirFinder._found[key]
+        else:
+            ret = self.__search_gams()
+            GamsDirFinder._found[key] = ret
+
+        if ret is not None:
+            GamsDirFinder.gams_dir_cache = ret
+
+        if ret is None:
+            logger.debug(f"Did not find GAMS directory. Using cached value {self.gams_dir_cache}.")
+            ret = GamsDirFinder.gams_dir_cache
+            
+        return ret
+
+    def __search_gams(self):
         """
         For all systems, the first place we examine is the GAMS_DIR environment
         variable, and the second is GAMSDIR.
@@ -70,6 +137,9 @@ class GamsDirFinder(object):
         most recent version.
         
         For all others, the next step is 'which gams'.
+
+        If the on-disk cache is enabled, it is consulted before, and updated 
+        after, these platform-specific searches.
         
         Returns
         -------
@@ -84,6 +154,15 @@ class GamsDirFinder(object):
             ret = os.environ.get('GAMSDIR')
             ret = self.__clean_gams_dir(ret)
 
+        if ret is not None:
+            return ret
+
+        use_disk_cache = os.environ.get('GDXPDS_GAMS_DIR_CACHE', '0') != '0'
+        if use_disk_cache:
+            ret = self.__clean_gams_dir(_read_gams_dir_cache())
+            if ret is not None:
+                return ret
+
         if ret is None and os.name == 'nt':
             # windows systems
             try:
@@ -126,15 +205,43 @@ class GamsDirFinder(object):
             except:
                 ret = None
             ret = self.__clean_gams_dir(ret)
-                
-        if ret is not None:
-            GamsDirFinder.gams_dir_cache = ret
 
-        if ret is None:
-            logger.debug(f"Did not find GAMS directory. Using cached value {self.gams_dir_cache}.")
-            ret = GamsDirFinder.gams_dir_cache
+        if (ret is not None) and use_disk_cache:
+            _write_gams_dir_cache(ret)
             
         return ret
+
+
+def _gams_dir_cache_file():
+    path = os.environ.get('PATH', '')
+    return get_cache_dir('gams_dir') / f"{hashlib.sha1(path.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_gams_dir_cache():
+    """
+    Returns the GAMS directory found for the current 'PATH' by an earlier 
+    process, or None.
+    """
+    try:
+        with open(_gams_dir_cache_file(), 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('PATH') != os.environ.get('PATH', ''):
+        return None
+    return entry.get('gams_dir')
+
+
+def _write_gams_dir_cache(gams_dir):
+    path = _gams_dir_cache_file()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump({'PATH': os.environ.get('PATH', ''), 'gams_dir': gams_dir}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Unable to cache GAMS directory {gams_dir!r}: {e}")
         
 class NeedsGamsDir(object):
     """Mix-in class that asserts that a GAMS directory is needed and provides the methods 
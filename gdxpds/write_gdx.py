@@ -11,9 +11,11 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 class Translator(object):
-    def __init__(self,dataframes,gams_dir=None):
+    def __init__(self,dataframes,gams_dir=None,bool_set_values=False,copy=True):
         self.dataframes = dataframes
         self.__gams_dir=None
+        self.__bool_set_values = bool_set_values
+        self.__copy = copy
 
     def __exit__(self, *args):
         if self.__gdx is not None:
@@ -49,7 +51,8 @@ class Translator(object):
     @property
     def gdx(self):
         if self.__gdx is None:
-            self.__gdx = GdxFile(gams_dir=self.__gams_dir)
+            self.__gdx = GdxFile(gams_dir=self.__gams_dir,
+                                 bool_set_values=self.__bool_set_values)
             for symbol_name, df in self.dataframes.items():
                 self.__add_symbol_to_gdx(symbol_name, df)
         return self.__gdx
@@ -64,46 +67,69 @@ class Translator(object):
         logger.info("Inferred data type of {} to be {}.".format(symbol_name,data_type.name))
 
         self.__gdx.append(GdxSymbol(symbol_name,data_type,dims=num_dims))
-        self.__gdx[symbol_name].dataframe = df
+        self.__gdx[symbol_name].set_dataframe(df, copy=self.__copy)
         return
 
     def __infer_data_type(self,symbol_name,df):
-        """
-        Returns
-        -------
-        (gdxpds.GamsDataType, int)
-            symbol type and number of dimensions implied by df
-        """
-        # See if structure implies that symbol_name may be a Variable or an Equation
-        # If so, break tie based on naming convention--Variables start with upper case, 
-        # equations start with lower case
-        var_or_eqn = False        
-        df_col_names = df.columns
-        var_eqn_col_names = [col_name for col_name, col_ind in GAMS_VALUE_COLS_MAP[GamsDataType.Variable]]
-        if len(df_col_names) >= len(var_eqn_col_names):
-            # might be variable or equation
-            var_or_eqn = True
-            trunc_df_col_names = df_col_names[len(df_col_names) - len(var_eqn_col_names):]
-            for i, df_col in enumerate(trunc_df_col_names):
-                if df_col and (df_col.lower() != var_eqn_col_names[i].lower()):
-                    var_or_eqn = False
-                    break
-            if var_or_eqn:
-                num_dims = len(df_col_names) - len(var_eqn_col_names)
-                if symbol_name[0].upper() == symbol_name[0]:
-                    return GamsDataType.Variable, num_dims
-                else:
-                    return GamsDataType.Equation, num_dims
-
-        # Parameter or set
-        num_dims = len(df_col_names) - 1
-        if len(df.index) > 0:
-            if isinstance(df.iloc[0,-1],Number):
-                return GamsDataType.Parameter, num_dims
-        return GamsDataType.Set, num_dims
-
-
-def to_gdx(dataframes,path=None,gams_dir=None):
+        return infer_data_type(symbol_name,df)
+
+
+def infer_data_type(symbol_name,df):
+    """
+    Infers the type of the symbol that df represents from its structure.
+
+    Frames whose last five columns are the Variable/Equation value columns 
+    (case insensitive) are Variables if symbol_name starts with an upper case 
+    letter, and Equations otherwise. Other frames are Parameters if their last 
+    column holds numbers, and Sets if it holds anything else (e.g., `c_bool`, 
+    numpy bool or str values) or if they are empty. Leading nulls are skipped.
+
+    Parameters
+    ----------
+    symbol_name : str
+    df : pd.DataFrame
+        Dimension columns followed by value columns
+
+    Returns
+    -------
+    (gdxpds.GamsDataType, int)
+        symbol type and number of dimensions implied by df
+    """
+    # See if structure implies that symbol_name may be a Variable or an Equation
+    # If so, break tie based on naming convention--Variables start with upper case, 
+    # equations start with lower case
+    var_or_eqn = False        
+    df_col_names = df.columns
+    var_eqn_col_names = [col_name for col_name, col_ind in GAMS_VALUE_COLS_MAP[GamsDataType.Variable]]
+    if len(df_col_names) >= len(var_eqn_col_names):
+        # might be variable or equation
+        var_or_eqn = True
+        trunc_df_col_names = df_col_names[len(df_col_names) - len(var_eqn_col_names):]
+        for i, df_col in enumerate(trunc_df_col_names):
+            if df_col and (str(df_col).lower() != var_eqn_col_names[i].lower()):
+                var_or_eqn = False
+                break
+        if var_or_eqn:
+            num_dims = len(df_col_names) - len(var_eqn_col_names)
+            if symbol_name[0].upper() == symbol_name[0]:
+                return GamsDataType.Variable, num_dims
+            else:
+                return GamsDataType.Equation, num_dims
+
+    # Parameter or set
+    num_dims = len(df_col_names) - 1
+    if len(df.index) > 0:
+        values = df.iloc[:,-1]
+        if values.dtype.kind in 'fiuc':
+            return GamsDataType.Parameter, num_dims
+        valid = values.notna().to_numpy()
+        value = values.iloc[valid.argmax() if valid.any() else 0]
+        if isinstance(value,Number):
+            return GamsDataType.Parameter, num_dims
+    return GamsDataType.Set, num_dims
+
+
+def to_gdx(dataframes,path=None,gams_dir=None,bool_set_values=False,copy=True):
     """
     Creates a :py:class:`gdxpds.gdx.GdxFile` from dataframes and optionally writes it to path
 
@@ -117,12 +143,21 @@ def to_gdx(dataframes,path=None,gams_dir=None):
     path : None or pathlib.Path or str
         If provided, the gdx file will be written to this path
     gams_dir : None or pathlib.Path or str
+    bool_set_values : bool
+        If True (default is False), Set value columns are kept as numpy bool 
+        columns rather than being converted to `c_bool` objects
+    copy : bool
+        If True (the default), each DataFrame is copied into its 
+        :py:class:`gdxpds.gdx.GdxSymbol`. If False, the DataFrames are adopted 
+        without copying, which keeps peak memory close to that of dataframes, 
+        but means they may be modified (e.g., columns renamed to 'Value').
 
     Returns
     -------
     :py:class:`gdxpds.gdx.GdxFile`
     """
-    translator = Translator(dataframes,gams_dir=gams_dir)
+    translator = Translator(dataframes,gams_dir=gams_dir,bool_set_values=bool_set_values,
+                            copy=copy)
     if path is not None:
         translator.save_gdx(path)
     return translator.gdx
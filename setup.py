@@ -14,6 +14,14 @@ test_requires = [
     "pytest"
 ]
 
+parquet_requires = [
+    "pyarrow"
+]
+
+xarray_requires = [
+    "xarray"
+]
+
 admin_requires = [
     "ghp-import",
     "numpydoc",
@@ -40,7 +48,8 @@ setup(
     },
     scripts = [
         'bin/csv_to_gdx.py', 
-        'bin/gdx_to_csv.py'
+        'bin/gdx_to_csv.py',
+        'bin/gdx_to_parquet.py'
     ],
     install_requires=[
         "gdxcc",
@@ -48,6 +57,8 @@ setup(
         "numpy>=1.7"
     ],
     extras_require={
+        "parquet": parquet_requires,
+        "xarray": xarray_requires,
         "test": test_requires,
         "admin": test_requires + admin_requires
     },